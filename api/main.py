@@ -4,18 +4,23 @@ Professional Subtitle Generation Service v4.0 - FastAPI Application
 Main application entry point with core configuration and routing.
 """
 
+import asyncio
 import os
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 import time
 
 from api.utils.errors import register_exception_handlers
 from api.utils.logging import setup_logging
 from api.routers import subtitle, metrics, presets
+from lib.utils import audio_analyzer, gpu
 
 # Setup logging
 setup_logging(log_level="INFO", use_json=False)  # Use simple format for development
@@ -23,6 +28,40 @@ setup_logging(log_level="INFO", use_json=False)  # Use simple format for develop
 # Track service start time for uptime calculation
 START_TIME = time.time()
 
+# Worker threads available to sync endpoints and run_in_threadpool (anyio default: 40)
+THREADPOOL_SIZE = 64
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks."""
+    # Blocking work (upload spooling, file I/O) is pushed to the threadpool,
+    # so size it explicitly instead of relying on the anyio default
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
+    # Before the job workers load any model
+    gpu.enable_tf32()
+
+    # Validate presets once; a malformed preset is logged (and skipped) here
+    # instead of on every request
+    app.state.presets = presets.load_presets()
+    background_tasks = subtitle.start_job_workers()
+    if presets.WATCHFILES_AVAILABLE and presets.PRESETS_DIR.exists():
+        background_tasks.append(asyncio.create_task(presets.watch_presets(app)))
+
+    # Load librosa's lazy submodules off the event loop so the first
+    # analysis request doesn't pay for them
+    background_tasks.append(asyncio.create_task(to_thread.run_sync(audio_analyzer.warmup)))
+
+    yield
+
+    for task in background_tasks:
+        task.cancel()
+    for task in background_tasks:
+        with suppress(asyncio.CancelledError):
+            await task
+
+
 # Create FastAPI application
 app = FastAPI(
     title="Professional Subtitle Generation Service",
@@ -34,17 +73,32 @@ app = FastAPI(
     ),
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
+# The bundled frontend is same-origin (served from web/dist or via the Vite
+# proxy), so only explicitly listed origins need cross-origin access.
+# Override with a comma-separated CORS_ORIGINS env var.
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3050").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
+# Compress text responses (SRT/JSON transcripts shrink several-fold)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Register exception handlers
 register_exception_handlers(app)
 
@@ -54,8 +108,10 @@ app.include_router(metrics.router, tags=["Monitoring"])
 app.include_router(presets.router, tags=["Presets"])
 
 
-# Check if frontend exists
+# Check if frontend exists (probed once at import, not per request)
 STATIC_DIR = Path(__file__).parent.parent / "web" / "dist"
+INDEX_FILE = STATIC_DIR / "index.html"
+_INDEX_EXISTS = INDEX_FILE.is_file()
 
 
 @app.get("/", tags=["Root"])
@@ -63,10 +119,8 @@ async def root():
     """
     Root endpoint - serves frontend if available, otherwise API info.
     """
-    if STATIC_DIR.exists():
-        index_file = STATIC_DIR / "index.html"
-        if index_file.exists():
-            return FileResponse(index_file)
+    if _INDEX_EXISTS:
+        return FileResponse(INDEX_FILE)
     return {
         "service": "Professional Subtitle Generation Service",
         "version": "4.0.0",
@@ -93,18 +147,8 @@ async def health_check():
     }
 
 
-# Serve static frontend files in production
-if STATIC_DIR.exists() and (STATIC_DIR / "assets").exists():
-    app.mount("/assets", StaticFiles(directory=STATIC_DIR / "assets"), name="assets")
-
-    @app.get("/{full_path:path}", include_in_schema=False)
-    async def serve_frontend(full_path: str):
-        """Serve frontend SPA for all non-API routes."""
-        # Skip API routes
-        if full_path.startswith(("docs", "redoc", "openapi.json", "subtitle", "presets", "metrics", "health")):
-            return None
-        # Serve index.html for SPA routing
-        index_file = STATIC_DIR / "index.html"
-        if index_file.exists():
-            return FileResponse(index_file)
-        return {"error": "Frontend not found"}
+# Serve static frontend files in production. Mounted last so API routes
+# take precedence; StaticFiles(html=True) serves index.html for "/" and
+# returns 404 for unknown paths instead of echoing the SPA shell.
+if _INDEX_EXISTS:
+    app.mount("/", StaticFiles(directory=STATIC_DIR, html=True), name="spa")
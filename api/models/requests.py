@@ -4,9 +4,12 @@ API Request Models
 Pydantic models for validating incoming API requests.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, StringConstraints
 from enum import Enum
-from typing import Optional, Literal
+from typing import Annotated, Optional, Literal
+
+from api.schemas.preset import FormatterConfig, TranscriptionConfig
+from lib.utils.gpu import get_optimal_compute_type
 
 
 class ASREngine(str, Enum):
@@ -37,6 +40,17 @@ class ComputeType(str, Enum):
     FLOAT32 = "float32"
 
 
+# Resolved once at import: int8_float16 on GPU, int8 on CPU
+DEFAULT_COMPUTE_TYPE = ComputeType(get_optimal_compute_type())
+
+
+# ISO 639-1 code, checked and lowercased by pydantic-core without a Python callback
+LanguageCode = Annotated[
+    str,
+    StringConstraints(min_length=2, max_length=2, pattern=r"^[a-zA-Z]{2}$", to_lower=True),
+]
+
+
 class DemucsModel(str, Enum):
     """Demucs vocal separation models"""
 
@@ -61,12 +75,12 @@ class TranscriptionRequest(BaseModel):
         default=ModelSize.LARGE_V3, description="Whisper model size"
     )
     compute_type: ComputeType = Field(
-        default=ComputeType.FLOAT16,
+        default=DEFAULT_COMPUTE_TYPE,
         description="Quantization type (affects speed and VRAM)",
     )
 
     # Language Configuration
-    language: Optional[str] = Field(
+    language: Optional[LanguageCode] = Field(
         default=None,
         description="ISO 639-1 language code (e.g., 'en', 'es') or null for auto-detect",
     )
@@ -94,17 +108,10 @@ class TranscriptionRequest(BaseModel):
         description="Batch size for inference (higher = faster but more VRAM)",
     )
 
-    @field_validator("language")
-    @classmethod
-    def validate_language_code(cls, v):
-        """Validate ISO 639-1 language codes"""
-        if v is None:
-            return v
-        if len(v) != 2 or not v.isalpha():
-            raise ValueError("Language must be 2-letter ISO 639-1 code (e.g., 'en')")
-        return v.lower()
-
     model_config = {
+        # Requests are read-only once parsed; reject unknown fields up front
+        "extra": "forbid",
+        "frozen": True,
         "json_schema_extra": {
             "example": {
                 "engine": "whisperx",
@@ -167,3 +174,28 @@ class SubtitleRequest(TranscriptionRequest):
             }
         }
     }
+
+
+class SubtitleJobForm(BaseModel):
+    """
+    Form fields accepted by POST /subtitle.
+
+    Transcription and formatter settings reuse the preset schema, so a preset
+    can be submitted field-for-field. Parsed from flat form data with
+    ``api.utils.forms.as_form``.
+    """
+
+    format: str = Field(default="srt", description="Output format (srt, json)")
+    engine: str = Field(default="faster-whisper", description="ASR engine")
+    compute_type: Optional[str] = Field(
+        default=None,
+        description="Compute type, or 'auto'/omitted for int8_float16 on GPU, int8 on CPU",
+    )
+    transcription: TranscriptionConfig = Field(default_factory=TranscriptionConfig)
+    formatter: FormatterConfig = Field(default_factory=FormatterConfig)
+
+
+# Build validators at import so the first request doesn't pay for it
+TranscriptionRequest.model_rebuild()
+SubtitleRequest.model_rebuild()
+SubtitleJobForm.model_rebuild()
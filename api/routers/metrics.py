@@ -6,12 +6,16 @@ for production monitoring and observability.
 """
 
 import logging
+import queue
 import time
-from collections import defaultdict, deque
-from typing import Dict
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 import threading
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 from api.models.responses import Metrics
 from lib.utils.gpu import is_gpu_available, get_vram_info
 
@@ -21,36 +25,151 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+@dataclass(slots=True)
+class EndpointStat:
+    """Per-endpoint request statistics"""
+    count: int = 0
+    errors: int = 0
+    total_time_ms: float = 0.0
+
+
+class P2Quantile:
+    """
+    Streaming quantile estimator (P-square algorithm, Jain & Chlamtac 1985).
+
+    Tracks a single quantile in constant memory with O(1) updates, so latency
+    percentiles can be read without keeping or sorting the raw samples.
+    """
+
+    def __init__(self, quantile: float):
+        """
+        Initialize the estimator.
+
+        Args:
+            quantile: Target quantile in (0, 1), e.g. 0.95 for p95
+        """
+        self.quantile = quantile
+        self._initial: List[float] = []
+        self._heights: List[float] = []
+        self._positions: List[int] = []
+        self._desired: List[float] = []
+        self._increments = [0.0, quantile / 2, quantile, (1 + quantile) / 2, 1.0]
+
+    def add(self, x: float):
+        """Add an observation."""
+        if len(self._initial) < 5:
+            self._initial.append(x)
+            if len(self._initial) == 5:
+                self._heights = sorted(self._initial)
+                self._positions = [1, 2, 3, 4, 5]
+                p = self.quantile
+                self._desired = [1.0, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5.0]
+            return
+
+        q = self._heights
+        n = self._positions
+
+        # Find the cell containing x, extending the extremes if needed
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Adjust the three middle markers towards their desired positions
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                height = self._parabolic(i, step)
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                q[i] = height
+                n[i] += step
+
+    def _parabolic(self, i: int, d: int) -> float:
+        """Piecewise-parabolic prediction of marker height."""
+        q = self._heights
+        n = self._positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    @property
+    def value(self) -> float:
+        """Current quantile estimate (0.0 if no observations)."""
+        if self._heights:
+            return self._heights[2]
+        if not self._initial:
+            return 0.0
+        # Fewer than 5 samples: exact quantile of what we have
+        ordered = sorted(self._initial)
+        return ordered[min(int(len(ordered) * self.quantile), len(ordered) - 1)]
+
+
 class MetricsCollector:
     """
     Collects and aggregates service metrics.
 
     Thread-safe metrics collection for request statistics, latency tracking,
     and resource utilization monitoring.
+
+    Recording a request only pushes a sample onto a lock-free queue; samples
+    are folded into the aggregates in batches (on read, or once enough are
+    pending), so request completions never contend on the lock.
     """
 
+    # Pending samples that trigger an opportunistic drain from record_request
+    DRAIN_THRESHOLD = 256
+
+    # Sliding window (seconds) kept in request_times
+    RATE_WINDOW_S = 3600
+
+    # How long (seconds) a GPU/VRAM reading is reused across scrapes
+    GPU_POLL_TTL_S = 5.0
+
     def __init__(self):
         self._lock = threading.Lock()
+        self._pending: queue.SimpleQueue = queue.SimpleQueue()
+
+        # Last GPU reading as (gpu_utilization, vram_usage_percent)
+        self._gpu_cache: Tuple[Optional[float], Optional[float]] = (None, None)
+        self._last_gpu_poll = float("-inf")
 
         # Request statistics
         self.requests_total = 0
         self.requests_successful = 0
         self.requests_failed = 0
 
-        # Request timestamps (for rate calculation)
-        self.request_times: deque = deque(maxlen=1000)  # Last 1000 requests
+        # Request timestamps within the last RATE_WINDOW_S (for rate calculation).
+        # Appended in time order, so the deque is always sorted and expired
+        # entries can be evicted from the left.
+        self.request_times: deque = deque()
 
-        # Inference time tracking
-        self.inference_times: deque = deque(maxlen=1000)  # Last 1000 inference times
+        # Inference time tracking (streaming, O(1) per request)
+        self.inference_count = 0
+        self.inference_total_ms = 0.0
+        self.p50 = P2Quantile(0.50)
+        self.p95 = P2Quantile(0.95)
+        self.p99 = P2Quantile(0.99)
 
         # Model cache statistics
         self.cache_hits = 0
         self.cache_misses = 0
 
         # Per-endpoint statistics
-        self.endpoint_stats: Dict[str, Dict] = defaultdict(
-            lambda: {"count": 0, "errors": 0, "total_time_ms": 0.0}
-        )
+        self.endpoint_stats: Dict[str, EndpointStat] = {}
 
     def record_request(
         self,
@@ -68,7 +187,25 @@ class MetricsCollector:
             success: Whether request succeeded
             cache_hit: Whether model was loaded from cache
         """
-        with self._lock:
+        self._pending.put((time.time(), endpoint, inference_time_ms, success, cache_hit))
+
+        # Keep the backlog bounded without ever blocking the caller
+        if self._pending.qsize() >= self.DRAIN_THRESHOLD and self._lock.acquire(blocking=False):
+            try:
+                self._drain()
+            finally:
+                self._lock.release()
+
+    def _drain(self):
+        """Fold pending samples into the aggregates. Caller must hold the lock."""
+        while True:
+            try:
+                timestamp, endpoint, inference_time_ms, success, cache_hit = (
+                    self._pending.get_nowait()
+                )
+            except queue.Empty:
+                return
+
             # Update counters
             self.requests_total += 1
             if success:
@@ -77,10 +214,14 @@ class MetricsCollector:
                 self.requests_failed += 1
 
             # Record timestamp
-            self.request_times.append(time.time())
+            self.request_times.append(timestamp)
 
             # Record inference time
-            self.inference_times.append(inference_time_ms)
+            self.inference_count += 1
+            self.inference_total_ms += inference_time_ms
+            self.p50.add(inference_time_ms)
+            self.p95.add(inference_time_ms)
+            self.p99.add(inference_time_ms)
 
             # Update cache statistics
             if cache_hit:
@@ -89,10 +230,51 @@ class MetricsCollector:
                 self.cache_misses += 1
 
             # Update per-endpoint stats
-            self.endpoint_stats[endpoint]["count"] += 1
+            stat = self.endpoint_stats.get(endpoint)
+            if stat is None:
+                stat = self.endpoint_stats[endpoint] = EndpointStat()
+            stat.count += 1
             if not success:
-                self.endpoint_stats[endpoint]["errors"] += 1
-            self.endpoint_stats[endpoint]["total_time_ms"] += inference_time_ms
+                stat.errors += 1
+            stat.total_time_ms += inference_time_ms
+
+        self._evict_expired(time.time())
+
+    def _evict_expired(self, now: float):
+        """Drop timestamps older than the rate window. Caller must hold the lock."""
+        cutoff = now - self.RATE_WINDOW_S
+        request_times = self.request_times
+        while request_times and request_times[0] < cutoff:
+            request_times.popleft()
+
+    def _poll_gpu(self, now: float) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Get GPU metrics, reusing the last reading for GPU_POLL_TTL_S seconds.
+
+        Args:
+            now: Current timestamp
+
+        Returns:
+            Tuple of (gpu_utilization, vram_usage_percent)
+        """
+        if now - self._last_gpu_poll < self.GPU_POLL_TTL_S:
+            return self._gpu_cache
+
+        gpu_utilization = None
+        vram_usage_percent = None
+
+        if is_gpu_available():
+            try:
+                vram_info = get_vram_info()
+                vram_usage_percent = vram_info.get("usage_percent")
+                # Note: GPU utilization requires nvidia-ml-py3 or pynvml
+                # For now, we'll leave it as None
+            except Exception as e:
+                logger.warning(f"Failed to get GPU metrics: {e}")
+
+        self._gpu_cache = (gpu_utilization, vram_usage_percent)
+        self._last_gpu_poll = now
+        return self._gpu_cache
 
     def get_metrics(self) -> Dict:
         """
@@ -102,29 +284,27 @@ class MetricsCollector:
             Dictionary of metric values
         """
         with self._lock:
+            self._drain()
+
             # Calculate request rate
             now = time.time()
-            one_hour_ago = now - 3600
             one_minute_ago = now - 60
 
-            # Count requests in last hour and minute
-            requests_last_hour = sum(
-                1 for t in self.request_times if t >= one_hour_ago
-            )
-            requests_last_minute = sum(
-                1 for t in self.request_times if t >= one_minute_ago
+            # Everything left after eviction is within the last hour;
+            # timestamps are sorted, so the last minute is a bisect away
+            self._evict_expired(now)
+            requests_last_hour = len(self.request_times)
+            requests_last_minute = requests_last_hour - bisect_left(
+                self.request_times, one_minute_ago
             )
             requests_per_minute = requests_last_minute  # Already per minute
 
-            # Calculate latency percentiles
-            if self.inference_times:
-                sorted_times = sorted(self.inference_times)
-                count = len(sorted_times)
-
-                avg_inference = sum(sorted_times) / count
-                p50 = sorted_times[int(count * 0.50)]
-                p95 = sorted_times[int(count * 0.95)]
-                p99 = sorted_times[int(count * 0.99)]
+            # Latency percentiles from the streaming estimators
+            if self.inference_count:
+                avg_inference = self.inference_total_ms / self.inference_count
+                p50 = self.p50.value
+                p95 = self.p95.value
+                p99 = self.p99.value
             else:
                 avg_inference = p50 = p95 = p99 = 0.0
 
@@ -141,18 +321,7 @@ class MetricsCollector:
                 else 0.0
             )
 
-            # Get GPU metrics if available
-            gpu_utilization = None
-            vram_usage_percent = None
-
-            if is_gpu_available():
-                try:
-                    vram_info = get_vram_info()
-                    vram_usage_percent = vram_info.get("usage_percent")
-                    # Note: GPU utilization requires nvidia-ml-py3 or pynvml
-                    # For now, we'll leave it as None
-                except Exception as e:
-                    logger.warning(f"Failed to get GPU metrics: {e}")
+            gpu_utilization, vram_usage_percent = self._poll_gpu(now)
 
             return {
                 "requests_total": self.requests_total,
@@ -178,7 +347,12 @@ def get_metrics_collector() -> MetricsCollector:
     return _metrics_collector
 
 
-@router.get("/metrics", response_model=Metrics, tags=["Monitoring"])
+@router.get(
+    "/metrics",
+    response_model=None,
+    responses={200: {"model": Metrics}},
+    tags=["Monitoring"],
+)
 async def get_metrics():
     """
     Get service performance metrics.
@@ -228,5 +402,6 @@ async def get_metrics():
     **Returns**:
     - Current service metrics
     """
+    # Collector output is trusted, so skip model validation on the way out
     metrics_data = _metrics_collector.get_metrics()
-    return Metrics(**metrics_data)
+    return ORJSONResponse(metrics_data)
@@ -2,12 +2,14 @@
 Presets Router - Load preset configurations.
 """
 
+import asyncio
 import json
 import logging
+import os
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
 
-from fastapi import APIRouter
+from fastapi import APIRouter, FastAPI, Request
 from pydantic import ValidationError
 
 from api.schemas.preset import PresetSchema
@@ -19,14 +21,55 @@ router = APIRouter(prefix="/presets")
 # Presets directory path
 PRESETS_DIR = Path(__file__).parent.parent.parent / "presets"
 
+# JSON schema is static for the process lifetime, so generate it once
+_PRESET_SCHEMA = PresetSchema.model_json_schema()
 
-@router.get("/", summary="List all presets", response_model=List[PresetSchema])
-async def list_presets() -> List[PresetSchema]:
+# Parsed presets: file path -> (mtime_ns, preset)
+_preset_cache: Dict[str, Tuple[int, PresetSchema]] = {}
+
+# Optional: hot-reload presets when files change
+try:
+    from watchfiles import awatch
+
+    WATCHFILES_AVAILABLE = True
+except ImportError:
+    WATCHFILES_AVAILABLE = False
+
+
+def _load_preset(path: str, preset_id: str) -> PresetSchema:
     """
-    List all available preset configurations with full details.
+    Parse and validate a single preset file.
+
+    Raises:
+        ValueError: If the file is not valid JSON or fails schema validation
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        # Add ID from filename
+        data["id"] = preset_id
+
+        # Validate against schema
+        return PresetSchema(**data)
+
+    except ValidationError as e:
+        raise ValueError(f"Invalid preset schema {path}: {e}") from e
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"Failed to load preset {path}: {e}") from e
+
+
+def load_presets() -> List[PresetSchema]:
+    """
+    Load and validate all presets in PRESETS_DIR.
+
+    Presets are deploy-time artifacts, so this runs once at startup (and on
+    file changes); files are only re-parsed when their mtime changes.
+    Malformed files are logged and skipped, so one bad preset doesn't take
+    the others (or the service) down.
 
     Returns:
-        List of complete preset configurations (validated against schema)
+        Valid presets sorted by filename
     """
     presets = []
 
@@ -34,26 +77,68 @@ async def list_presets() -> List[PresetSchema]:
         logger.warning(f"Presets directory not found: {PRESETS_DIR}")
         return presets
 
-    for preset_file in sorted(PRESETS_DIR.glob("*.json")):
-        try:
-            with open(preset_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+    seen = set()
+    with os.scandir(PRESETS_DIR) as it:
+        entries = sorted(
+            (e for e in it if e.name.endswith(".json") and e.is_file()),
+            key=lambda e: e.name,
+        )
+
+    for entry in entries:
+        mtime_ns = entry.stat().st_mtime_ns
 
-            # Add ID from filename
-            data["id"] = preset_file.stem
+        cached = _preset_cache.get(entry.path)
+        if cached is None or cached[0] != mtime_ns:
+            try:
+                preset = _load_preset(entry.path, entry.name[: -len(".json")])
+            except ValueError as e:
+                logger.error(str(e))
+                continue
+            cached = _preset_cache[entry.path] = (mtime_ns, preset)
 
-            # Validate against schema
-            preset = PresetSchema(**data)
-            presets.append(preset)
+        seen.add(entry.path)
+        presets.append(cached[1])
 
-        except ValidationError as e:
-            logger.error(f"Invalid preset schema {preset_file}: {e}")
-        except Exception as e:
-            logger.error(f"Failed to load preset {preset_file}: {e}")
+    # Drop presets whose files were removed or no longer parse
+    for path in _preset_cache.keys() - seen:
+        del _preset_cache[path]
 
     return presets
 
 
+async def watch_presets(app: FastAPI):
+    """
+    Reload app.state.presets whenever PRESETS_DIR changes.
+
+    Malformed files are skipped as at startup. Reloads run in a worker
+    thread, so file I/O and validation stay off the event loop.
+
+    Args:
+        app: Application whose state holds the preset list
+    """
+    async for _ in awatch(PRESETS_DIR):
+        try:
+            app.state.presets = await asyncio.to_thread(load_presets)
+            logger.info(f"Reloaded {len(app.state.presets)} presets")
+        except OSError as e:
+            logger.error(f"Keeping previous presets: {e}")
+
+
+@router.get("/", summary="List all presets", response_model=List[PresetSchema])
+async def list_presets(request: Request) -> List[PresetSchema]:
+    """
+    List all available preset configurations with full details.
+
+    Returns:
+        List of complete preset configurations (validated against schema)
+    """
+    presets = getattr(request.app.state, "presets", None)
+    if presets is None:
+        # Lifespan did not run (e.g. app mounted without startup hooks)
+        presets = request.app.state.presets = load_presets()
+    return presets
+
+
 @router.get("/schema", summary="Get preset schema")
 async def get_preset_schema() -> dict:
     """
@@ -62,4 +147,4 @@ async def get_preset_schema() -> dict:
     Returns:
         JSON schema definition for presets
     """
-    return PresetSchema.model_json_schema()
+    return _PRESET_SCHEMA
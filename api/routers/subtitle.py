@@ -5,25 +5,38 @@ Handles async subtitle generation jobs with status tracking.
 """
 
 import asyncio
+import errno
+import io
 import logging
 import os
 import tempfile
 import time
-from concurrent.futures import ThreadPoolExecutor
-from pathlib import Path
-from typing import Optional
+from functools import lru_cache
+from itertools import chain
+from typing import BinaryIO, Dict, Iterator, List, Optional
 
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, status, BackgroundTasks
-from fastapi.responses import JSONResponse
+import orjson
+from pydantic import TypeAdapter
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 
 from api.utils.errors import (
     FileTooLargeError,
     UnsupportedAudioFormatError,
-    AudioProcessingError,
 )
+from api.models.requests import SubtitleJobForm
+from api.schemas.preset import DEFAULT_FORMATTER_DICT
+from api.utils.forms import as_form
 from api.utils.jobs import get_job_manager, JobStatus
-from lib.models import get_model_manager
-from lib.utils.gpu import get_vram_info, is_gpu_available, get_optimal_device, get_optimal_compute_type
+from lib.utils.gpu import (
+    get_vram_info,
+    is_gpu_available,
+    get_device_count,
+    get_optimal_device,
+    get_optimal_compute_type,
+)
+from lib.engines.base import Segment
 from lib.formatters import SRTFormatter
 
 logger = logging.getLogger(__name__)
@@ -33,10 +46,186 @@ router = APIRouter()
 
 # Configuration
 MAX_FILE_SIZE_MB = 500
-SUPPORTED_FORMATS = {".mp3", ".wav", ".m4a", ".flac", ".ogg", ".opus", ".webm"}
+SUPPORTED_FORMATS = frozenset({".mp3", ".wav", ".m4a", ".flac", ".ogg", ".opus", ".webm"})
+
+# Pending jobs, consumed by one worker per GPU (or a single worker on CPU)
+# so only one transcription runs per device at a time. Created by
+# start_job_workers() at application startup.
+_job_queue: Optional[asyncio.Queue] = None
+
+# Model pre-loaded and pinned on every device (every CPU worker) at startup,
+# so the first job doesn't pay the weight upload. Defaults to what the web
+# frontend requests. Pinned models are never evicted, so this holds memory for
+# the process lifetime; set WARM_MODEL_SIZE="" to disable.
+WARM_ENGINE = os.getenv("WARM_ENGINE", "openai-whisper")
+WARM_MODEL_SIZE = os.getenv("WARM_MODEL_SIZE", "turbo")
+
+# Parallel job workers when running on CPU. Each worker holds its own model
+# and gets an equal share of the cores, so concurrent jobs don't
+# oversubscribe the CPU with competing OpenMP thread pools.
+CPU_WORKERS = max(1, int(os.getenv("CPU_WORKERS", "1")))
+CPU_THREADS = max(
+    1,
+    (len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1)
+    // CPU_WORKERS,
+)
+
+# Max queued jobs a worker takes at once and regroups by model. Only a
+# single worker batches; with several, draining the queue would leave the
+# other devices idle.
+JOB_BATCH_MAX = 8
+
+# Upper bound for ?wait= long-polling on job status
+MAX_LONG_POLL_S = 60
+
+# List items (segments/words) encoded per chunk when streaming JSON results
+STREAM_CHUNK_ITEMS = 64
+
+# Segments are dumped to plain dicts by pydantic-core in one call instead of
+# per-segment/per-word Python comprehensions
+_SEGMENTS_ADAPTER = TypeAdapter(List[Segment])
+_SEGMENT_FIELDS = {
+    "__all__": {
+        "start": True,
+        "end": True,
+        "text": True,
+        "words": {"__all__": {"word", "start", "end"}},
+    }
+}
+
+
+# Chunk size for copying uploads to disk
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MB
+
+# Small uploads go to RAM-backed tmpfs so the decode never touches disk.
+# Larger ones use the regular temp dir: /dev/shm is often small (64 MB by
+# default in Docker) and shared by concurrent jobs. Queued uploads stay on
+# it until a worker picks up their job, so free space is checked per upload
+# (keeping TMPFS_MARGIN_MB spare) and a full tmpfs falls back to disk.
+TMPFS_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+TMPFS_MAX_MB = 32
+TMPFS_MARGIN_MB = 16
+
+
+def get_model_manager():
+    """Return the model manager, importing lib.models (and the engine backends) on first use."""
+    from lib.models import get_model_manager
+
+    return get_model_manager()
+
+
+def _upload_dir(size: Optional[int]) -> Optional[str]:
+    """Pick the temp directory for an upload of the given size (bytes, if known)."""
+    if not TMPFS_DIR or size is None or size > TMPFS_MAX_MB * 1024 * 1024:
+        return None
+
+    try:
+        stat = os.statvfs(TMPFS_DIR)
+    except OSError:
+        return None
+    if stat.f_bavail * stat.f_frsize < size + TMPFS_MARGIN_MB * 1024 * 1024:
+        return None
+    return TMPFS_DIR
+
+
+def _save_upload(source: BinaryIO, suffix: str, dir: Optional[str] = None) -> str:
+    """
+    Stream an uploaded file to a temporary file, enforcing MAX_FILE_SIZE_MB.
+
+    Copies in UPLOAD_CHUNK_SIZE chunks so peak memory stays constant
+    regardless of upload size. If ``dir`` runs out of space (a tmpfs filled
+    by other queued uploads), the upload is written to the system temp dir
+    instead.
+
+    Args:
+        source: Uploaded file object (seekable)
+        suffix: Temporary file suffix (audio extension)
+        dir: Directory for the temporary file (default: system temp dir)
+
+    Returns:
+        Path of the temporary file
+
+    Raises:
+        FileTooLargeError: If the upload exceeds MAX_FILE_SIZE_MB
+    """
+    try:
+        return _write_upload(source, suffix, dir)
+    except OSError as e:
+        if dir is None or e.errno != errno.ENOSPC:
+            raise
+        logger.warning(f"No space left in {dir}; writing upload to {tempfile.gettempdir()}")
+        source.seek(0)
+        return _write_upload(source, suffix, None)
 
-# Thread pool for running transcription in background
-executor = ThreadPoolExecutor(max_workers=2)
+
+def _write_upload(source: BinaryIO, suffix: str, dir: Optional[str]) -> str:
+    """Copy an upload into a new temporary file in ``dir`` (see _save_upload)."""
+    max_bytes = MAX_FILE_SIZE_MB * 1024 * 1024
+    size = 0
+
+    with tempfile.NamedTemporaryFile(
+        mode="wb", suffix=suffix, dir=dir, delete=False
+    ) as temp_file:
+        try:
+            while chunk := source.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise FileTooLargeError(round(size / (1024 * 1024), 2), MAX_FILE_SIZE_MB)
+                temp_file.write(chunk)
+        except BaseException:
+            temp_file.close()
+            os.unlink(temp_file.name)
+            raise
+        return temp_file.name
+
+
+@lru_cache(maxsize=32)
+def _get_formatter(
+    max_line_width: int,
+    max_line_count: int,
+    adjust_timing: bool,
+    split_by_punctuation: bool,
+) -> SRTFormatter:
+    """Get a shared SRTFormatter for the given settings (formatters are stateless)."""
+    return SRTFormatter(
+        max_line_width=max_line_width,
+        max_line_count=max_line_count,
+        adjust_timing=adjust_timing,
+        split_by_punctuation=split_by_punctuation,
+    )
+
+
+def _iter_json_result(head: dict, data: dict) -> Iterator[bytes]:
+    """
+    Encode a completed JSON job response incrementally.
+
+    Produces the same document as ``{**head, "result": {"type": "json", "data": data}}``
+    but encodes list fields (segments, words) a chunk at a time, so the client
+    starts receiving bytes before the whole transcript is serialized.
+
+    Args:
+        head: Top-level job fields (job_id, status, progress)
+        data: Transcription result data
+
+    Yields:
+        JSON fragments
+    """
+    # Re-open the encoded head object to append the result
+    yield orjson.dumps(head)[:-1] + b',"result":{"type":"json","data":{'
+
+    for index, (key, value) in enumerate(data.items()):
+        prefix = (b"," if index else b"") + orjson.dumps(key) + b":"
+        if not isinstance(value, list) or not value:
+            yield prefix + orjson.dumps(value)
+            continue
+
+        yield prefix + b"["
+        for start in range(0, len(value), STREAM_CHUNK_ITEMS):
+            items = orjson.dumps(value[start:start + STREAM_CHUNK_ITEMS])[1:-1]
+            yield (b"," if start else b"") + items
+        yield b"]"
+
+    yield b"}}}"
 
 
 def process_subtitle_job(
@@ -49,13 +238,14 @@ def process_subtitle_job(
     compute_type: str,
     transcription_config: dict,
     formatter_config: dict,
+    device_index: int = 0,
 ):
     """
     Process subtitle generation in background thread.
     Updates job status as it progresses.
     """
     job_manager = get_job_manager()
-    request_start_time = time.time()
+    request_start_time = time.perf_counter_ns()
 
     try:
         # Update status to processing
@@ -63,30 +253,42 @@ def process_subtitle_job(
 
         # Load model
         model_manager = get_model_manager()
-        engine_config = {
-            "device": get_optimal_device(),
-            "compute_type": compute_type,
-        }
+        engine_config = _engine_config(device_index, compute_type)
 
         job_manager.update_job(job_id, progress=20)
 
-        preprocessing_start = time.time()
+        preprocessing_start = time.perf_counter_ns()
         engine_instance = model_manager.get_engine(engine, model_size, engine_config)
-        preprocessing_time_ms = (time.time() - preprocessing_start) * 1000
+        preprocessing_time_ms = (time.perf_counter_ns() - preprocessing_start) / 1e6
 
         job_manager.update_job(job_id, progress=30)
 
-        # Transcribe
-        inference_start = time.time()
-        result = engine_instance.transcribe(temp_file_path, transcription_config)
-        inference_time_ms = (time.time() - inference_start) * 1000
+        # Transcribe. SRT entries are written as segments are decoded, so
+        # the transcript is never held as a segment list.
+        inference_start = time.perf_counter_ns()
+        if output_format == "json":
+            result = engine_instance.transcribe(temp_file_path, transcription_config)
+            audio_duration_s = result.segments[-1].end if result.segments else 0
+        else:
+            formatter_config = {**DEFAULT_FORMATTER_DICT, **formatter_config}
+            formatter = _get_formatter(
+                max_line_width=formatter_config["max_line_width"],
+                max_line_count=formatter_config["max_line_count"],
+                adjust_timing=formatter_config["adjust_timing"],
+                split_by_punctuation=formatter_config["split_by_punctuation"],
+            )
+            segments, _ = engine_instance.transcribe_stream(temp_file_path, transcription_config)
+            srt_buffer = io.StringIO()
+            audio_duration_s = formatter.stream_format(
+                segments, srt_buffer, word_level=formatter_config["word_level"]
+            )
+        inference_time_ms = (time.perf_counter_ns() - inference_start) / 1e6
 
         job_manager.update_job(job_id, progress=80)
 
-        total_time_ms = (time.time() - request_start_time) * 1000
+        total_time_ms = (time.perf_counter_ns() - request_start_time) / 1e6
 
         # Calculate metrics
-        audio_duration_s = result.segments[-1].end if result.segments else 0
         real_time_factor = (total_time_ms / 1000) / audio_duration_s if audio_duration_s > 0 else 0
 
         vram_used_mb = None
@@ -96,30 +298,14 @@ def process_subtitle_job(
 
         # Format result based on output format
         if output_format == "json":
-            words_list = []
-            for segment in result.segments:
-                if segment.words:
-                    words_list.extend([
-                        {"word": w.word, "start": w.start, "end": w.end}
-                        for w in segment.words
-                    ])
-
+            # Words are only stored per segment; the flat list is derived on
+            # request (GET /jobs/{job_id}?flat_words=true)
             response_data = {
                 "text": result.text,
                 "language": result.language,
-                "segments": [
-                    {
-                        "start": seg.start,
-                        "end": seg.end,
-                        "text": seg.text,
-                        "words": [
-                            {"word": w.word, "start": w.start, "end": w.end}
-                            for w in seg.words
-                        ] if seg.words else None
-                    }
-                    for seg in result.segments
-                ],
-                "words": words_list if words_list else None,
+                "segments": _SEGMENTS_ADAPTER.dump_python(
+                    result.segments, include=_SEGMENT_FIELDS
+                ),
                 "metadata": {
                     "engine": engine,
                     "model_size": model_size,
@@ -140,16 +326,7 @@ def process_subtitle_job(
                 result={"type": "json", "data": response_data}
             )
         else:  # SRT format
-            formatter = SRTFormatter(
-                max_line_width=formatter_config.get("max_line_width", 42),
-                max_line_count=formatter_config.get("max_line_count", 2),
-                adjust_timing=formatter_config.get("adjust_timing", False),
-                split_by_punctuation=formatter_config.get("split_by_punctuation", False),
-            )
-            content = formatter.format(
-                result.segments,
-                word_level=formatter_config.get("word_level", False)
-            )
+            content = srt_buffer.getvalue()
 
             job_manager.update_job(
                 job_id,
@@ -158,7 +335,7 @@ def process_subtitle_job(
                 result={
                     "type": "srt",
                     "content": content,
-                    "filename": Path(filename).stem + ".srt",
+                    "filename": os.path.splitext(os.path.basename(filename))[0] + ".srt",
                     "metadata": {
                         "total_time_ms": total_time_ms,
                         "inference_time_ms": inference_time_ms,
@@ -179,38 +356,107 @@ def process_subtitle_job(
 
     finally:
         # Cleanup temporary file
-        if temp_file_path and os.path.exists(temp_file_path):
+        if temp_file_path:
             try:
                 os.unlink(temp_file_path)
                 logger.debug(f"Cleaned up temporary file: {temp_file_path}")
-            except Exception as e:
+            except FileNotFoundError:
+                pass
+            except OSError as e:
                 logger.warning(f"Failed to cleanup temporary file: {e}")
 
 
+def _engine_config(device_index: int, compute_type: str) -> dict:
+    """Build the engine load config for one worker's device."""
+    device = get_optimal_device()
+    config = {
+        "device": device,
+        "device_index": device_index,
+        "compute_type": compute_type,
+    }
+    if device == "cpu":
+        config["cpu_threads"] = CPU_THREADS
+    return config
+
+
+def _warm_engine(device_index: int):
+    """Load and pin the default engine on one device."""
+    engine_config = _engine_config(device_index, get_optimal_compute_type())
+    try:
+        get_model_manager().get_engine(WARM_ENGINE, WARM_MODEL_SIZE, engine_config, pin=True)
+    except Exception as e:
+        logger.warning(
+            f"Failed to pre-load {WARM_ENGINE}/{WARM_MODEL_SIZE} on device {device_index}: {e}"
+        )
+
+
+def _group_by_model(batch: List[tuple]) -> List[tuple]:
+    """
+    Reorder queued jobs so jobs sharing a model run back to back.
+
+    Groups by (engine, model_size, compute_type), keeping first-seen order
+    between groups and submission order within a group.
+    """
+    groups: Dict[tuple, List[tuple]] = {}
+    for job_args in batch:
+        groups.setdefault(job_args[4:7], []).append(job_args)
+    return [job_args for group in groups.values() for job_args in group]
+
+
+async def _job_worker(device_index: int, batch_max: int = 1):
+    """
+    Run queued jobs one at a time on a single device.
+
+    Args:
+        device_index: Device the worker's jobs run on
+        batch_max: Max queued jobs taken at once and regrouped by model
+    """
+    while True:
+        # Take whatever is already waiting (up to batch_max) so jobs for
+        # the same model run consecutively instead of swapping models
+        batch = [await _job_queue.get()]
+        while len(batch) < batch_max and not _job_queue.empty():
+            batch.append(_job_queue.get_nowait())
+
+        for job_args in _group_by_model(batch):
+            try:
+                # process_subtitle_job records its own failures on the job
+                await asyncio.to_thread(process_subtitle_job, *job_args, device_index=device_index)
+            finally:
+                _job_queue.task_done()
+
+
+def start_job_workers() -> List[asyncio.Task]:
+    """
+    Create the job queue and start one worker per GPU (CPU_WORKERS on CPU).
+
+    The warm model is loaded by separate tasks, so workers take jobs right
+    away; a job for the warm model waits on its in-progress load instead of
+    loading it again.
+
+    Must be called from the running event loop (application startup).
+
+    Returns:
+        Worker and warm-up tasks, to be cancelled on shutdown
+    """
+    global _job_queue
+    _job_queue = asyncio.Queue()
+
+    num_workers = get_device_count() or CPU_WORKERS
+    batch_max = JOB_BATCH_MAX if num_workers == 1 else 1
+    logger.info(f"Starting {num_workers} subtitle job worker(s)")
+    tasks = [asyncio.create_task(_job_worker(i, batch_max)) for i in range(num_workers)]
+    if WARM_MODEL_SIZE:
+        tasks.extend(
+            asyncio.create_task(asyncio.to_thread(_warm_engine, i)) for i in range(num_workers)
+        )
+    return tasks
+
+
 @router.post("/subtitle", tags=["Subtitles"])
 async def submit_subtitle_job(
     audio_file: UploadFile = File(..., description="Audio file to transcribe"),
-    format: str = Form(default="srt", description="Output format (srt, json)"),
-    engine: Optional[str] = Form(default="faster-whisper", description="ASR engine"),
-    model_size: Optional[str] = Form(default="large-v3", description="Model size"),
-    compute_type: Optional[str] = Form(default=None, description="Compute type"),
-    language: Optional[str] = Form(default=None, description="Language code"),
-    vad_filter: Optional[bool] = Form(default=True, description="Enable VAD"),
-    word_timestamps: Optional[bool] = Form(default=True, description="Include word timestamps"),
-    batch_size: Optional[int] = Form(default=16, description="Batch size"),
-    beam_size: Optional[int] = Form(default=5, description="Beam size"),
-    temperature: Optional[float] = Form(default=0.0, description="Temperature"),
-    best_of: Optional[int] = Form(default=5, description="Best of N samples"),
-    condition_on_previous_text: Optional[bool] = Form(default=True, description="Condition on previous text"),
-    no_speech_threshold: Optional[float] = Form(default=0.6, description="No speech threshold"),
-    compression_ratio_threshold: Optional[float] = Form(default=2.4, description="Compression ratio threshold"),
-    logprob_threshold: Optional[float] = Form(default=-1.0, description="Log probability threshold"),
-    initial_prompt: Optional[str] = Form(default=None, description="Initial prompt for context"),
-    word_level: Optional[bool] = Form(default=False, description="One word per subtitle"),
-    max_line_width: Optional[int] = Form(default=42, description="Max characters per line"),
-    max_line_count: Optional[int] = Form(default=2, description="Max lines per subtitle"),
-    adjust_timing: Optional[bool] = Form(default=False, description="Adjust timing for natural reading"),
-    split_by_punctuation: Optional[bool] = Form(default=False, description="Split subtitles at punctuation marks"),
+    form: SubtitleJobForm = Depends(as_form(SubtitleJobForm)),
 ):
     """
     Submit a subtitle generation job.
@@ -227,7 +473,7 @@ async def submit_subtitle_job(
     ```
     """
     # Validate format
-    format = format.lower()
+    format = form.format.lower()
     if format not in ["srt", "json"]:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -238,85 +484,69 @@ async def submit_subtitle_job(
             },
         )
 
-    # Validate file size
-    file_content = await audio_file.read()
-    file_size_mb = len(file_content) / (1024 * 1024)
-
-    if file_size_mb > MAX_FILE_SIZE_MB:
-        raise FileTooLargeError(file_size_mb, MAX_FILE_SIZE_MB)
-
     # Validate audio format
-    file_extension = Path(audio_file.filename).suffix.lower()
+    file_extension = os.path.splitext(audio_file.filename)[1].lower()
     if file_extension not in SUPPORTED_FORMATS:
         raise UnsupportedAudioFormatError(file_extension)
 
-    # Save to temporary file
-    with tempfile.NamedTemporaryFile(
-        mode="wb", suffix=file_extension, delete=False
-    ) as temp_file:
-        temp_file.write(file_content)
-        temp_file_path = temp_file.name
+    # Stream to a temporary file, validating size as we go
+    # (blocking disk I/O, keep it off the event loop)
+    temp_file_path = await run_in_threadpool(
+        _save_upload, audio_file.file, file_extension, _upload_dir(audio_file.size)
+    )
 
-    # Auto-detect compute type if needed
-    if compute_type is None:
+    # Auto-detect compute type if omitted or "auto"
+    compute_type = form.compute_type
+    if compute_type in (None, "", "auto"):
         compute_type = get_optimal_compute_type()
 
     # Create job
     job_manager = get_job_manager()
     job = job_manager.create_job(format=format, filename=audio_file.filename)
 
-    # Prepare configs
-    transcription_config = {
-        "language": language,
-        "vad_filter": vad_filter,
-        "word_timestamps": word_timestamps,
-        "batch_size": batch_size,
-        "beam_size": beam_size,
-        "temperature": temperature,
-        "best_of": best_of,
-        "condition_on_previous_text": condition_on_previous_text,
-        "no_speech_threshold": no_speech_threshold,
-        "compression_ratio_threshold": compression_ratio_threshold,
-        "logprob_threshold": logprob_threshold,
-        "initial_prompt": initial_prompt,
-    }
-
-    formatter_config = {
-        "word_level": word_level,
-        "max_line_width": max_line_width,
-        "max_line_count": max_line_count,
-        "adjust_timing": adjust_timing,
-        "split_by_punctuation": split_by_punctuation,
-    }
-
-    # Submit to thread pool
-    executor.submit(
-        process_subtitle_job,
+    # Queue for the device workers; the job stays PENDING until picked up
+    _job_queue.put_nowait((
         job.id,
         temp_file_path,
         format,
         audio_file.filename,
-        engine,
-        model_size,
+        form.engine,
+        form.transcription.model_size,
         compute_type,
-        transcription_config,
-        formatter_config,
-    )
+        form.transcription.model_dump(),
+        form.formatter.model_dump(),
+    ))
 
     logger.info(f"Submitted job {job.id} for {audio_file.filename}")
 
-    return JSONResponse(content={
+    return {
         "job_id": job.id,
         "status": job.status.value,
         "message": "Job submitted successfully"
-    })
+    }
 
 
 @router.get("/jobs/{job_id}", tags=["Jobs"])
-async def get_job_status(job_id: str):
+async def get_job_status(
+    job_id: str,
+    flat_words: bool = Query(
+        default=False,
+        description="Include a flat top-level 'words' list in JSON results",
+    ),
+    wait: float = Query(
+        default=0,
+        ge=0,
+        le=MAX_LONG_POLL_S,
+        description="Long-poll: wait up to this many seconds for the job to change",
+    ),
+):
     """
     Get the status of a subtitle generation job.
 
+    Pass ``?wait=N`` (seconds, max 60) to long-poll: a pending/processing
+    job is returned as soon as its status or progress changes, or after
+    ``N`` seconds, instead of polling in a tight loop.
+
     **Response (pending/processing)**:
     ```json
     {
@@ -371,19 +601,40 @@ async def get_job_status(job_id: str):
             detail={"error": "job_not_found", "message": f"Job {job_id} not found"}
         )
 
+    if wait > 0 and not job.is_finished:
+        await job_manager.wait_for_update(job, (job.status, job.progress), wait)
+
     response = {
         "job_id": job.id,
         "status": job.status.value,
         "progress": job.progress,
     }
 
-    if job.status == JobStatus.COMPLETED and job.result:
-        response["result"] = job.result
+    if job.status == JobStatus.COMPLETED and job.result_bytes is not None:
+        if flat_words and job.format == "json":
+            data = job.result["data"]
+            words = list(chain.from_iterable(
+                seg["words"] for seg in data["segments"] if seg["words"]
+            ))
+            data = {**data, "words": words or None}
+
+            # Full transcripts can hold thousands of segments/words; stream them
+            return StreamingResponse(
+                _iter_json_result(response, data),
+                media_type="application/json",
+            )
+
+        # The result was encoded once on completion; splice it into the
+        # encoded head object instead of re-serializing it on every poll
+        return Response(
+            content=orjson.dumps(response)[:-1] + b',"result":' + job.result_bytes + b"}",
+            media_type="application/json",
+        )
 
     if job.status == JobStatus.FAILED and job.error:
         response["error"] = job.error
 
-    return JSONResponse(content=response)
+    return ORJSONResponse(content=response)
 
 
 @router.get("/jobs", tags=["Jobs"])
@@ -394,7 +645,7 @@ async def list_jobs():
     job_manager = get_job_manager()
     jobs = job_manager.list_jobs()
 
-    return JSONResponse(content={
+    return {
         "jobs": [
             {
                 "job_id": job.id,
@@ -406,4 +657,4 @@ async def list_jobs():
             }
             for job in jobs.values()
         ]
-    })
+    }
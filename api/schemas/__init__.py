@@ -8,6 +8,8 @@ from api.schemas.preset import (
     FormatterConfig,
     DEFAULT_TRANSCRIPTION,
     DEFAULT_FORMATTER,
+    DEFAULT_TRANSCRIPTION_DICT,
+    DEFAULT_FORMATTER_DICT,
 )
 
 __all__ = [
@@ -16,4 +18,6 @@ __all__ = [
     "FormatterConfig",
     "DEFAULT_TRANSCRIPTION",
     "DEFAULT_FORMATTER",
+    "DEFAULT_TRANSCRIPTION_DICT",
+    "DEFAULT_FORMATTER_DICT",
 ]
@@ -5,6 +5,7 @@ Defines the structure for transcription presets.
 All presets must follow this schema.
 """
 
+from types import MappingProxyType
 from typing import Optional
 from pydantic import BaseModel, Field
 
@@ -24,8 +25,9 @@ class TranscriptionConfig(BaseModel):
     compression_ratio_threshold: float = Field(default=2.4, ge=0.0, description="Compression ratio threshold")
     logprob_threshold: float = Field(default=-1.0, description="Log probability threshold")
     initial_prompt: Optional[str] = Field(default=None, description="Initial prompt for context/vocabulary guidance")
+    vad_filter: bool = Field(default=True, description="Enable VAD filtering (Silero VAD pre-pass for openai-whisper)")
     # faster-whisper specific
-    vad_filter: bool = Field(default=True, description="Enable VAD filtering (faster-whisper only)")
+    batch_size: int = Field(default=16, ge=1, le=64, description="VAD chunks decoded per forward pass (faster-whisper only)")
 
 
 class FormatterConfig(BaseModel):
@@ -84,3 +86,8 @@ class PresetSchema(BaseModel):
 # Default preset values for reference
 DEFAULT_TRANSCRIPTION = TranscriptionConfig()
 DEFAULT_FORMATTER = FormatterConfig()
+
+# Read-only dumps of the defaults, for filling in partial config dicts
+# without constructing a model
+DEFAULT_TRANSCRIPTION_DICT = MappingProxyType(DEFAULT_TRANSCRIPTION.model_dump())
+DEFAULT_FORMATTER_DICT = MappingProxyType(DEFAULT_FORMATTER.model_dump())
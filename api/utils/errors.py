@@ -10,6 +10,8 @@ from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 import logging
 
+from lib.engines.base import ModelNotLoadedError
+
 logger = logging.getLogger(__name__)
 
 
@@ -111,6 +113,22 @@ async def audio_processing_error_handler(
     )
 
 
+async def model_not_loaded_error_handler(
+    request: Request, exc: ModelNotLoadedError
+) -> JSONResponse:
+    """Handle use of an engine before its model is loaded"""
+    logger.error(f"Model not loaded: {exc}")
+
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content=create_error_response(
+            error_code="model_not_loaded",
+            message=str(exc),
+            remediation="Retry once the model has finished loading",
+        ),
+    )
+
+
 async def model_load_error_handler(
     request: Request, exc: ModelLoadError
 ) -> JSONResponse:
@@ -232,6 +250,7 @@ def register_exception_handlers(app):
     """
     app.add_exception_handler(AudioProcessingError, audio_processing_error_handler)
     app.add_exception_handler(ModelLoadError, model_load_error_handler)
+    app.add_exception_handler(ModelNotLoadedError, model_not_loaded_error_handler)
     app.add_exception_handler(InsufficientVRAMError, insufficient_vram_error_handler)
     app.add_exception_handler(
         UnsupportedAudioFormatError, unsupported_audio_format_error_handler
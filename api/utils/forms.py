@@ -0,0 +1,62 @@
+"""
+Form Parsing Utilities
+
+Builds FastAPI dependencies that parse multipart form fields into Pydantic models.
+"""
+
+import inspect
+from functools import cache
+from typing import Callable, Type, TypeVar
+
+from fastapi import Depends, Form
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@cache
+def as_form(model_cls: Type[ModelT]) -> Callable[..., ModelT]:
+    """
+    Build a dependency that parses a model from flat form fields.
+
+    Each model field becomes a ``Form`` parameter with the field's default and
+    description; nested model fields are flattened recursively, so their
+    fields are read from the same form. The dependency is built once per model.
+
+    Args:
+        model_cls: Pydantic model to parse
+
+    Returns:
+        Dependency callable for use with ``Depends``
+    """
+    params = []
+    for name, field in model_cls.model_fields.items():
+        annotation = field.annotation
+        if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+            default = Depends(as_form(annotation))
+        else:
+            default = Form(
+                ... if field.is_required() else field.default,
+                description=field.description,
+            )
+        params.append(
+            inspect.Parameter(
+                name,
+                inspect.Parameter.KEYWORD_ONLY,
+                default=default,
+                annotation=annotation,
+            )
+        )
+
+    def dependency(**data) -> ModelT:
+        try:
+            return model_cls(**data)
+        except ValidationError as e:
+            # Report constraint violations (ge/le, etc.) as a regular 422
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+            ) from e
+
+    dependency.__signature__ = inspect.Signature(params)
+    return dependency
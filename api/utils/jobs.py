@@ -5,14 +5,18 @@ Manages async subtitle generation jobs with status tracking.
 """
 
 import asyncio
+import itertools
 import logging
-import uuid
+import secrets
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import threading
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,11 +37,32 @@ class Job:
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     progress: int = 0  # 0-100
-    result: Optional[Any] = None
+    # Result JSON, encoded once when stored so polls don't re-serialize it
+    result_bytes: Optional[bytes] = None
     error: Optional[str] = None
     # Job parameters
     format: str = "srt"
     filename: str = ""
+    # Serializes updates to this job only
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    # Long-poll waiters, woken on the next update
+    _waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    @property
+    def result(self) -> Optional[Any]:
+        """Decoded job result (decodes ``result_bytes`` on every access)"""
+        if self.result_bytes is None:
+            return None
+        return orjson.loads(self.result_bytes)
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the job reached a terminal status"""
+        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED)
 
 
 class JobManager:
@@ -46,21 +71,32 @@ class JobManager:
 
     Thread-safe storage for job status and results.
     Jobs are kept in memory and will be lost on restart.
+
+    Only inserts and cleanup take the manager lock; updates lock the single
+    job being changed, and reads rely on dict lookups/copies being atomic
+    in CPython, so status polling never contends with workers.
     """
 
     def __init__(self, max_jobs: int = 100):
         self._jobs: Dict[str, Job] = {}
-        self._lock = threading.Lock()
+        self._insert_lock = threading.Lock()
         self._max_jobs = max_jobs
+        # Sequential IDs; the random per-process prefix keeps IDs from
+        # before a restart from resolving to new jobs
+        self._id_prefix = secrets.token_hex(2)
+        self._ids = itertools.count(1)
+        # IDs of finished jobs in completion order (oldest first), so cleanup
+        # pops victims from the left instead of scanning and sorting all jobs
+        self._finished: deque = deque()
 
     def create_job(self, format: str = "srt", filename: str = "") -> Job:
         """Create a new job and return it"""
-        with self._lock:
+        with self._insert_lock:
             # Clean up old completed jobs if we have too many
             if len(self._jobs) >= self._max_jobs:
                 self._cleanup_old_jobs()
 
-            job_id = str(uuid.uuid4())[:8]  # Short ID for convenience
+            job_id = f"{self._id_prefix}{next(self._ids):04x}"
             job = Job(
                 id=job_id,
                 format=format,
@@ -72,8 +108,7 @@ class JobManager:
 
     def get_job(self, job_id: str) -> Optional[Job]:
         """Get job by ID"""
-        with self._lock:
-            return self._jobs.get(job_id)
+        return self._jobs.get(job_id)
 
     def update_job(
         self,
@@ -84,49 +119,92 @@ class JobManager:
         error: Optional[str] = None,
     ) -> Optional[Job]:
         """Update job status and data"""
-        with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                return None
+        job = self._jobs.get(job_id)
+        if not job:
+            return None
+
+        with job._lock:
+            # Readers don't lock, so publish result/error before the status
+            # that tells them to look for it
+            if result is not None:
+                job.result_bytes = orjson.dumps(result)
+
+            if error is not None:
+                job.error = error
+
+            if progress is not None:
+                job.progress = progress
 
+            finished = False
             if status:
-                job.status = status
                 if status == JobStatus.PROCESSING and not job.started_at:
                     job.started_at = datetime.now()
                 elif status in (JobStatus.COMPLETED, JobStatus.FAILED):
                     job.completed_at = datetime.now()
+                    finished = job.status not in (JobStatus.COMPLETED, JobStatus.FAILED)
+                job.status = status
 
-            if progress is not None:
-                job.progress = progress
-
-            if result is not None:
-                job.result = result
+            # Wake long-polling readers (update_job runs on worker threads)
+            waiters, job._waiters = job._waiters, []
 
-            if error is not None:
-                job.error = error
+        for loop, event in waiters:
+            loop.call_soon_threadsafe(event.set)
 
-            return job
+        if finished:
+            self._finished.append(job_id)
+            # Free memory as jobs finish rather than on the next insert
+            if len(self._jobs) >= self._max_jobs:
+                with self._insert_lock:
+                    self._cleanup_old_jobs()
+
+        return job
+
+    async def wait_for_update(
+        self, job: Job, seen: Tuple[JobStatus, int], timeout: float
+    ) -> None:
+        """
+        Wait until a job changes from a previously seen state.
+
+        Returns immediately if the job already differs from ``seen``.
+
+        Args:
+            job: Job to watch
+            seen: (status, progress) the caller last observed
+            timeout: Maximum seconds to wait
+        """
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        waiter = (loop, event)
+
+        with job._lock:
+            if (job.status, job.progress) != seen:
+                return
+            job._waiters.append(waiter)
+
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with job._lock:
+                if waiter in job._waiters:
+                    job._waiters.remove(waiter)
 
     def _cleanup_old_jobs(self):
-        """Remove oldest completed jobs to free memory"""
-        completed_jobs = [
-            (job_id, job) for job_id, job in self._jobs.items()
-            if job.status in (JobStatus.COMPLETED, JobStatus.FAILED)
-        ]
-
-        # Sort by completion time and remove oldest
-        completed_jobs.sort(key=lambda x: x[1].completed_at or datetime.min)
-
-        # Remove half of completed jobs
-        to_remove = len(completed_jobs) // 2
-        for job_id, _ in completed_jobs[:to_remove]:
-            del self._jobs[job_id]
+        """Remove oldest completed jobs to free memory. Caller must hold _insert_lock."""
+        if len(self._jobs) < self._max_jobs:
+            return  # Another thread already cleaned up
+
+        # Remove the oldest half of finished jobs
+        to_remove = len(self._finished) // 2
+        for _ in range(to_remove):
+            job_id = self._finished.popleft()
+            self._jobs.pop(job_id, None)
             logger.debug(f"Cleaned up old job {job_id}")
 
     def list_jobs(self) -> Dict[str, Job]:
         """List all jobs"""
-        with self._lock:
-            return dict(self._jobs)
+        return self._jobs.copy()
 
 
 # Global job manager instance
@@ -4,11 +4,25 @@ Structured Logging Configuration
 Sets up JSON-formatted logging for production observability.
 """
 
+import atexit
+import copy
 import logging
-import json
+import queue
 import sys
-from datetime import datetime
-from typing import Any, Dict
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+import orjson
+
+# Datetimes in metadata as UTC with a "Z" suffix; numpy scalars/arrays from
+# audio metrics and non-str dict keys are serialized natively
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Console output is buffered and flushed on a timer rather than per record
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL_S = 0.2
 
 
 class JSONFormatter(logging.Formatter):
@@ -18,6 +32,23 @@ class JSONFormatter(logging.Formatter):
     Outputs logs in JSON format for easy parsing by log aggregation systems.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Second-resolution timestamp prefix, reused while records share a second
+        self._last_sec = -1
+        self._last_prefix = ""
+
+    def _timestamp(self, created: float) -> str:
+        """Format a record time as ISO 8601 UTC with microseconds and a Z suffix."""
+        sec = int(created)
+        usec = round((created - sec) * 1_000_000)
+        if usec == 1_000_000:
+            sec, usec = sec + 1, 0
+        if sec != self._last_sec:
+            self._last_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            self._last_sec = sec
+        return f"{self._last_prefix}.{usec:06d}Z"
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record as JSON.
@@ -30,7 +61,7 @@ class JSONFormatter(logging.Formatter):
         """
         # Base log data
         log_data = {
-            "timestamp": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -52,7 +83,107 @@ class JSONFormatter(logging.Formatter):
                 "function": record.funcName,
             }
 
-        return json.dumps(log_data)
+        return orjson.dumps(log_data, option=_ORJSON_OPTIONS).decode("utf-8")
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that batches writes instead of flushing every record.
+
+    Records are written to a buffered stream and flushed by a background
+    thread every ``flush_interval`` seconds, so bursts of log lines become a
+    few large writes. ERROR and above are flushed immediately.
+    """
+
+    def __init__(self, stream=None, flush_interval: float = LOG_FLUSH_INTERVAL_S):
+        """
+        Initialize the handler.
+
+        Args:
+            stream: Buffered text stream to write to (default: sys.stderr)
+            flush_interval: Seconds between background flushes
+        """
+        super().__init__(stream)
+        self._stopped = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            args=(flush_interval,),
+            name="log-flusher",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._stopped.wait(interval):
+            self.flush()
+
+    def flush(self) -> None:
+        try:
+            super().flush()
+        except (OSError, ValueError):
+            # Stream closed underneath us (interpreter exit, captured output)
+            pass
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        self._stopped.set()
+        self.flush()
+        super().close()
+
+
+class RecordQueueHandler(QueueHandler):
+    """
+    QueueHandler that defers all formatting to the listener thread.
+
+    The stock handler formats records before queueing them, which merges
+    tracebacks into the message. This one only resolves the message
+    arguments (they may be mutated after the call returns) and keeps
+    exc_info and extra fields for the real formatter.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Background thread emitting queued records, set up by setup_logging()
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Drain queued records and close the console handler."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+def _buffered_stdout():
+    """
+    Open a buffered text stream on stdout's file descriptor.
+
+    Falls back to sys.stdout when it has no real descriptor (e.g. when
+    output is captured).
+    """
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return sys.stdout
+    return open(fd, "w", buffering=LOG_BUFFER_SIZE, encoding="utf-8", closefd=False)
 
 
 def setup_logging(log_level: str = "INFO", use_json: bool = True) -> None:
@@ -62,19 +193,29 @@ def setup_logging(log_level: str = "INFO", use_json: bool = True) -> None:
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         use_json: Whether to use JSON formatting (default True for production)
+
+    Records are handed to a queue on the calling thread and formatted and
+    written by a background listener, so logging from the transcription
+    path never waits on I/O.
     """
+    global _listener
+
     # Get root logger
     root_logger = logging.getLogger()
 
-    # Clear existing handlers
-    root_logger.handlers.clear()
+    # Remove existing handlers and stop a previous listener
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
+    _stop_listener()
 
     # Set log level
     level = getattr(logging, log_level.upper(), logging.INFO)
     root_logger.setLevel(level)
 
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    # Create console handler. Flushed periodically and by logging.shutdown()
+    # at interpreter exit.
+    console_handler = BufferedStreamHandler(_buffered_stdout())
     console_handler.setLevel(level)
 
     # Set formatter
@@ -88,8 +229,11 @@ def setup_logging(log_level: str = "INFO", use_json: bool = True) -> None:
 
     console_handler.setFormatter(formatter)
 
-    # Add handler
-    root_logger.addHandler(console_handler)
+    # Route records through a queue to the console handler
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(RecordQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _listener.start()
 
     # Log initial message
     root_logger.info(
@@ -115,6 +259,9 @@ def log_event(
         event: Event description
         metadata: Additional structured data
     """
+    if not logger.isEnabledFor(getattr(logging, level.upper())):
+        return
+
     log_func = getattr(logger, level.lower())
 
     if metadata:
@@ -123,5 +270,8 @@ def log_event(
         log_func(event)
 
 
+# Drain queued records before logging.shutdown() closes the handlers
+atexit.register(_stop_listener)
+
 # Convenience logger for application
 app_logger = logging.getLogger("subtitle_service")
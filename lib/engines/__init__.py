@@ -1,11 +1,31 @@
 """
 ASR Engine implementations and interfaces.
+
+Engine backends (and the factory that registers them) import their ML
+libraries at module load, so they are only imported on first access.
 """
 
-from lib.engines.base import ASREngine, TranscriptionResult, Segment, Word, EngineInfo
-from lib.engines.factory import EngineFactory, get_engine
-from lib.engines.faster_whisper import FasterWhisperEngine, FASTER_WHISPER_AVAILABLE
-from lib.engines.openai_whisper import OpenAIWhisperEngine, OPENAI_WHISPER_AVAILABLE
+import importlib
+
+from lib.engines.base import (
+    ASREngine,
+    TranscriptionResult,
+    Segment,
+    Word,
+    EngineInfo,
+    TranscribeConfig,
+    ModelNotLoadedError,
+)
+
+# Lazily imported name -> defining submodule
+_LAZY_EXPORTS = {
+    "EngineFactory": "lib.engines.factory",
+    "get_engine": "lib.engines.factory",
+    "FasterWhisperEngine": "lib.engines.faster_whisper",
+    "FASTER_WHISPER_AVAILABLE": "lib.engines.faster_whisper",
+    "OpenAIWhisperEngine": "lib.engines.openai_whisper",
+    "OPENAI_WHISPER_AVAILABLE": "lib.engines.openai_whisper",
+}
 
 __all__ = [
     "ASREngine",
@@ -13,6 +33,8 @@ __all__ = [
     "Segment",
     "Word",
     "EngineInfo",
+    "TranscribeConfig",
+    "ModelNotLoadedError",
     "EngineFactory",
     "get_engine",
     "FasterWhisperEngine",
@@ -20,3 +42,12 @@ __all__ = [
     "OpenAIWhisperEngine",
     "OPENAI_WHISPER_AVAILABLE",
 ]
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
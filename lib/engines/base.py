@@ -6,8 +6,8 @@ along with common data structures for transcription results.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TypedDict
+from pydantic import BaseModel, Field, model_validator
 
 
 class Word(BaseModel):
@@ -24,15 +24,16 @@ class Word(BaseModel):
         default=None, ge=0.0, le=1.0, description="Confidence score (0-1), if available"
     )
 
-    @field_validator("end")
-    @classmethod
-    def end_after_start(cls, v, info):
+    @model_validator(mode="after")
+    def end_after_start(self):
         """Ensure end time is after start time"""
-        if "start" in info.data and v <= info.data["start"]:
+        if self.end <= self.start:
             raise ValueError("end must be greater than start")
-        return v
+        return self
 
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
         "json_schema_extra": {
             "example": {
                 "start": 0.0,
@@ -58,15 +59,16 @@ class Segment(BaseModel):
         default=None, description="Word-level timestamps (if available)"
     )
 
-    @field_validator("end")
-    @classmethod
-    def end_after_start(cls, v, info):
+    @model_validator(mode="after")
+    def end_after_start(self):
         """Ensure end time is after start time"""
-        if "start" in info.data and v <= info.data["start"]:
+        if self.end <= self.start:
             raise ValueError("end must be greater than start")
-        return v
+        return self
 
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
         "json_schema_extra": {
             "example": {
                 "start": 0.0,
@@ -99,6 +101,8 @@ class TranscriptionResult(BaseModel):
     )
 
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
         "json_schema_extra": {
             "example": {
                 "text": "Hello world. This is a test.",
@@ -120,12 +124,14 @@ class EngineInfo(BaseModel):
 
     name: str = Field(description="Engine name")
     version: str = Field(description="Engine version")
-    supported_models: List[str] = Field(description="Supported model sizes")
+    supported_models: Tuple[str, ...] = Field(description="Supported model sizes")
     supports_word_timestamps: bool = Field(
         description="Whether engine supports word-level timestamps"
     )
 
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
         "json_schema_extra": {
             "example": {
                 "name": "faster-whisper",
@@ -137,6 +143,36 @@ class EngineInfo(BaseModel):
     }
 
 
+class TranscribeConfig(TypedDict, total=False):
+    """
+    Transcription options accepted by ASREngine.transcribe().
+
+    A plain dict at runtime (e.g. TranscriptionConfig.model_dump()), so the
+    job queue and API layer pass it through unchanged. Engines ignore keys
+    they don't support.
+    """
+
+    language: Optional[str]
+    word_timestamps: bool
+    beam_size: int
+    best_of: int
+    temperature: float
+    condition_on_previous_text: bool
+    initial_prompt: Optional[str]
+    no_speech_threshold: float
+    compression_ratio_threshold: float
+    logprob_threshold: float
+    vad_filter: bool
+    vad_parameters: Optional[Dict[str, Any]]
+    batch_size: int
+
+
+class ModelNotLoadedError(RuntimeError):
+    """Raised when an engine is used before load_model()"""
+
+    __slots__ = ()
+
+
 class ASREngine(ABC):
     """
     Abstract base class for ASR (Automatic Speech Recognition) engines.
@@ -164,7 +200,7 @@ class ASREngine(ABC):
         pass
 
     @abstractmethod
-    def transcribe(self, audio_path: str, config: dict) -> TranscriptionResult:
+    def transcribe(self, audio_path: str, config: TranscribeConfig) -> TranscriptionResult:
         """
         Transcribe an audio file.
 
@@ -180,6 +216,26 @@ class ASREngine(ABC):
         """
         pass
 
+    def transcribe_stream(
+        self, audio_path: str, config: TranscribeConfig
+    ) -> Tuple[Iterator[Segment], str]:
+        """
+        Transcribe an audio file, returning its segments as an iterator.
+
+        Engines that decode incrementally override this to yield segments as
+        they are produced; the default runs transcribe() and iterates its
+        result.
+
+        Args:
+            audio_path: Path to audio file
+            config: Transcription configuration (language, vad_filter, etc.)
+
+        Returns:
+            Tuple of (segment iterator, detected or requested language code)
+        """
+        result = self.transcribe(audio_path, config)
+        return iter(result.segments), result.language
+
     @abstractmethod
     def get_info(self) -> EngineInfo:
         """
@@ -27,6 +27,11 @@ class EngineFactory:
         "openai-whisper": (OpenAIWhisperEngine, OPENAI_WHISPER_AVAILABLE),
     }
 
+    # Availability is fixed at import time, so the list is computed once
+    _available_engines = tuple(
+        name for name, (_, is_available) in _engines.items() if is_available
+    )
+
     @classmethod
     def create_engine(cls, engine_name: str) -> ASREngine:
         """
@@ -42,28 +47,40 @@ class EngineFactory:
             ValueError: If engine name is unknown or unavailable
         """
         engine_name = engine_name.lower()
+        cls.validate_engine(engine_name)
+        engine_class, _ = cls._engines[engine_name]
+
+        # Create and return engine instance
+        logger.info(f"Creating engine: {engine_name}")
+        return engine_class()
+
+    @classmethod
+    def validate_engine(cls, engine_name: str) -> None:
+        """
+        Check that an engine is registered and its dependencies are installed.
+
+        Args:
+            engine_name: Engine name
+
+        Raises:
+            ValueError: If engine name is unknown or unavailable
+        """
+        if engine_name.lower() in cls._available_engines:
+            return
 
         # Check if engine is registered
-        if engine_name not in cls._engines:
+        if engine_name.lower() not in cls._engines:
             available = ", ".join(cls._engines.keys())
             raise ValueError(
-                f"Unsupported engine: '{engine_name}'. "
+                f"Unsupported engine: '{engine_name.lower()}'. "
                 f"Available engines: {available}"
             )
 
-        # Get engine class and availability
-        engine_class, is_available = cls._engines[engine_name]
-
-        # Check if engine is available (dependencies installed)
-        if not is_available:
-            raise ValueError(
-                f"Engine '{engine_name}' is not available. "
-                f"Please install required dependencies."
-            )
-
-        # Create and return engine instance
-        logger.info(f"Creating engine: {engine_name}")
-        return engine_class()
+        # Registered, but its dependencies aren't installed
+        raise ValueError(
+            f"Engine '{engine_name.lower()}' is not available. "
+            f"Please install required dependencies."
+        )
 
     @classmethod
     def get_available_engines(cls) -> list[str]:
@@ -73,11 +90,7 @@ class EngineFactory:
         Returns:
             List of engine names that are currently available
         """
-        return [
-            name
-            for name, (_, is_available) in cls._engines.items()
-            if is_available
-        ]
+        return list(cls._available_engines)
 
     @classmethod
     def is_engine_available(cls, engine_name: str) -> bool:
@@ -90,11 +103,7 @@ class EngineFactory:
         Returns:
             True if engine is available, False otherwise
         """
-        engine_name = engine_name.lower()
-        if engine_name not in cls._engines:
-            return False
-        _, is_available = cls._engines[engine_name]
-        return is_available
+        return engine_name.lower() in cls._available_engines
 
 
 def get_engine(engine_name: str) -> ASREngine:
@@ -6,9 +6,11 @@ Achieves 4x speedup compared to vanilla Whisper while maintaining accuracy.
 """
 
 import logging
+import os
+import threading
 import time
-from typing import Optional
-from pathlib import Path
+import weakref
+from typing import Iterator, Optional, Tuple
 
 from lib.engines.base import (
     ASREngine,
@@ -16,18 +18,91 @@ from lib.engines.base import (
     Segment,
     Word,
     EngineInfo,
+    TranscribeConfig,
+    ModelNotLoadedError,
 )
+from lib.utils.features import TORCH_AVAILABLE, TorchFeatureExtractor
 
 logger = logging.getLogger(__name__)
 
 # Try to import faster_whisper
 try:
+    import faster_whisper
     from faster_whisper import WhisperModel
     FASTER_WHISPER_AVAILABLE = True
 except ImportError:
     FASTER_WHISPER_AVAILABLE = False
     logger.warning("faster-whisper not available - install with: pip install faster-whisper")
 
+# Batched inference pipeline (faster-whisper >= 1.1)
+try:
+    from faster_whisper import BatchedInferencePipeline
+    BATCHED_PIPELINE_AVAILABLE = True
+except ImportError:
+    BATCHED_PIPELINE_AVAILABLE = False
+
+# Model sizes accepted by WhisperModel
+_SUPPORTED_MODELS = (
+    "tiny",
+    "tiny.en",
+    "base",
+    "base.en",
+    "small",
+    "small.en",
+    "medium",
+    "medium.en",
+    "large",
+    "large-v1",
+    "large-v2",
+    "large-v3",
+    "large-v3-turbo",
+    "turbo",
+    "distil-small.en",
+    "distil-medium.en",
+    "distil-large-v2",
+    "distil-large-v3",
+)
+
+# Names load_model accepts without a download attempt; includes any aliases
+# the installed faster-whisper knows about
+_MODEL_SET = frozenset(_SUPPORTED_MODELS).union(
+    getattr(faster_whisper, "available_models", tuple)() if FASTER_WHISPER_AVAILABLE else ()
+)
+
+# Loaded WhisperModels by load parameters. Weak values: a model stays
+# shared while any engine still references it (e.g. a running job on an
+# engine ModelManager already evicted) and is freed with the last one.
+_MODEL_CACHE: "weakref.WeakValueDictionary[tuple, WhisperModel]" = weakref.WeakValueDictionary()
+_MODEL_CACHE_LOCK = threading.Lock()
+
+# Transcription slots per shared model, so engines wrapping the same
+# WhisperModel share one num_workers bound. Freed with the model.
+_MODEL_SLOTS: "weakref.WeakKeyDictionary[WhisperModel, threading.BoundedSemaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Engine info is static; built once and shared by every get_info() call
+_ENGINE_INFO = EngineInfo.model_construct(
+    name="faster-whisper",
+    version=getattr(faster_whisper, "__version__", "unknown") if FASTER_WHISPER_AVAILABLE else "unknown",
+    supported_models=_SUPPORTED_MODELS,
+    supports_word_timestamps=True,
+)
+
+
+def _release_when_done(slots: threading.BoundedSemaphore, segments: Iterator[Segment]):
+    """
+    Yield segments, releasing a transcription slot once they are done.
+
+    The first next() only enters the try block, so the slot is also
+    released when the caller drops the iterator without reading it.
+    """
+    try:
+        yield
+        yield from segments
+    finally:
+        slots.release()
+
 
 class FasterWhisperEngine(ASREngine):
     """
@@ -43,9 +118,13 @@ class FasterWhisperEngine(ASREngine):
             raise ImportError("faster-whisper not installed")
 
         self.model: Optional[WhisperModel] = None
+        self.batched_model: Optional["BatchedInferencePipeline"] = None
         self.model_size: Optional[str] = None
         self.device: str = "cpu"
         self.compute_type: str = "int8"
+        # Bounds concurrent transcribe() calls to the model's worker count;
+        # shared by every engine using the same loaded model
+        self._transcribe_slots = threading.BoundedSemaphore(1)
 
     def load_model(self, model_size: str, config: dict):
         """
@@ -55,60 +134,120 @@ class FasterWhisperEngine(ASREngine):
             model_size: Model size (tiny, base, small, medium, large, large-v3)
             config: Configuration dict with:
                 - device: "cuda" or "cpu" (default: auto-detect)
+                - device_index: GPU index when device is "cuda" (default: 0)
+                - gpu_features: Compute log-mel features on the GPU when
+                  device is "cuda" (default: True)
                 - compute_type: "int8", "float16", "float32" (default: auto)
+                - cpu_threads: Inference threads when device is "cpu"
+                  (default: 0, CTranslate2's default)
+                - num_workers: Transcriptions the model may run in parallel
+                  (default: 1); further concurrent calls wait their turn
                 - download_root: Model cache directory (optional)
                 - local_files_only: Use only cached models (default: False)
 
         Raises:
+            ValueError: If model_size is neither a known size, a Hugging Face
+                repo id nor a local model directory
             Exception: If model loading fails
         """
+        # Reject typos before WhisperModel tries to download them
+        if model_size not in _MODEL_SET and "/" not in model_size and not os.path.isdir(model_size):
+            raise ValueError(
+                f"Unsupported model size: '{model_size}'. "
+                f"Available sizes: {', '.join(_SUPPORTED_MODELS)}"
+            )
+
         try:
             # Extract config
             self.device = config.get("device", "cpu")
             self.compute_type = config.get("compute_type", "int8")
+            device_index = config.get("device_index", 0)
             download_root = config.get("download_root", None)
             local_files_only = config.get("local_files_only", False)
+            cpu_threads = config.get("cpu_threads", 0)
+            num_workers = config.get("num_workers", 1)
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Loading faster-whisper model: {model_size}",
+                    extra={
+                        "metadata": {
+                            "model_size": model_size,
+                            "device": self.device,
+                            "compute_type": self.compute_type,
+                        }
+                    },
+                )
 
-            logger.info(
-                f"Loading faster-whisper model: {model_size}",
-                extra={
-                    "metadata": {
-                        "model_size": model_size,
-                        "device": self.device,
-                        "compute_type": self.compute_type,
-                    }
-                },
+            start_time = time.perf_counter_ns()
+
+            gpu_features = self.device == "cuda" and TORCH_AVAILABLE and config.get("gpu_features", True)
+            model_key = (
+                model_size, self.device, device_index, self.compute_type,
+                cpu_threads, num_workers, gpu_features,
             )
+            with _MODEL_CACHE_LOCK:
+                model = _MODEL_CACHE.get(model_key)
+
+            if model is not None:
+                logger.info(f"Reusing resident faster-whisper model: {model_size}")
+            else:
+                # Load model with CTranslate2 optimization
+                model = WhisperModel(
+                    model_size,
+                    device=self.device,
+                    device_index=device_index,
+                    compute_type=self.compute_type,
+                    cpu_threads=cpu_threads,
+                    num_workers=num_workers,
+                    download_root=download_root,
+                    local_files_only=local_files_only,
+                )
 
-            start_time = time.time()
+                # Move log-mel extraction from numpy on the CPU to torch on the GPU
+                if gpu_features:
+                    try:
+                        model.feature_extractor = TorchFeatureExtractor(
+                            model.feature_extractor, device=f"cuda:{device_index}"
+                        )
+                    except Exception as e:
+                        logger.warning(f"GPU feature extraction unavailable, using CPU: {e}")
+
+                # A concurrent load of the same model may have won the race
+                with _MODEL_CACHE_LOCK:
+                    model = _MODEL_CACHE.setdefault(model_key, model)
+
+            with _MODEL_CACHE_LOCK:
+                self._transcribe_slots = _MODEL_SLOTS.setdefault(
+                    model, threading.BoundedSemaphore(num_workers)
+                )
 
-            # Load model with CTranslate2 optimization
-            self.model = WhisperModel(
-                model_size,
-                device=self.device,
-                compute_type=self.compute_type,
-                download_root=download_root,
-                local_files_only=local_files_only,
-            )
+            self.model = model
 
-            self.model_size = model_size
-            load_time = (time.time() - start_time) * 1000
+            # Batched pipeline shares the loaded weights; it decodes several
+            # VAD chunks per forward pass instead of one 30s window at a time
+            if BATCHED_PIPELINE_AVAILABLE:
+                self.batched_model = BatchedInferencePipeline(model=self.model)
 
-            logger.info(
-                f"Model loaded successfully in {load_time:.1f}ms",
-                extra={
-                    "metadata": {
-                        "model_size": model_size,
-                        "load_time_ms": load_time,
-                    }
-                },
-            )
+            self.model_size = model_size
+            load_time = (time.perf_counter_ns() - start_time) / 1e6
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Model loaded successfully in {load_time:.1f}ms",
+                    extra={
+                        "metadata": {
+                            "model_size": model_size,
+                            "load_time_ms": load_time,
+                        }
+                    },
+                )
 
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
             raise Exception(f"Model loading failed: {str(e)}")
 
-    def transcribe(self, audio_path: str, config: dict) -> TranscriptionResult:
+    def transcribe(self, audio_path: str, config: TranscribeConfig) -> TranscriptionResult:
         """
         Transcribe audio file using faster-whisper.
 
@@ -123,6 +262,8 @@ class FasterWhisperEngine(ASREngine):
                 - best_of: Number of candidates for beam search (default: 5)
                 - temperature: Sampling temperature (default: 0.0)
                 - initial_prompt: Optional text to guide transcription style/vocabulary
+                - batch_size: Number of VAD chunks decoded per forward pass (default: 1).
+                  Values > 1 use BatchedInferencePipeline when vad_filter is enabled.
 
         Returns:
             TranscriptionResult: Complete transcription with segments
@@ -130,23 +271,81 @@ class FasterWhisperEngine(ASREngine):
         Raises:
             Exception: If transcription fails
         """
-        if self.model is None:
-            raise Exception("Model not loaded. Call load_model() first.")
-
-        if not Path(audio_path).exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        self._check_ready()
 
         try:
-            # Extract config
-            language = config.get("language", None)
-            vad_filter = config.get("vad_filter", True)
-            word_timestamps = config.get("word_timestamps", False)
-            beam_size = config.get("beam_size", 5)
-            best_of = config.get("best_of", 5)
-            temperature = config.get("temperature", 0.0)
-            vad_parameters = config.get("vad_parameters", None)
-            initial_prompt = config.get("initial_prompt", None)
+            start_time = time.perf_counter_ns()
+
+            # The stream holds one of the model's slots until it is exhausted
+            segments, detected_language = self.transcribe_stream(audio_path, config)
+            segments_list = list(segments)
+
+            inference_time_ms = (time.perf_counter_ns() - start_time) / 1e6
+
+            # Build full transcript
+            full_text = " ".join(segment.text for segment in segments_list)
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Transcription complete in {inference_time_ms:.1f}ms",
+                    extra={
+                        "metadata": {
+                            "inference_time_ms": inference_time_ms,
+                            "segment_count": len(segments_list),
+                            "language": detected_language,
+                        }
+                    },
+                )
 
+            return TranscriptionResult(
+                text=full_text,
+                language=detected_language,
+                segments=segments_list,
+                inference_time_ms=inference_time_ms,
+            )
+
+        except FileNotFoundError:
+            raise
+        except MemoryError as e:
+            logger.error(f"Out of memory during transcription: {e}")
+            raise Exception(f"Insufficient memory (OOM): {str(e)}")
+        except Exception as e:
+            logger.error(f"Transcription failed: {e}")
+            raise Exception(f"Transcription failed: {str(e)}")
+
+    def transcribe_stream(
+        self, audio_path: str, config: TranscribeConfig
+    ) -> Tuple[Iterator[Segment], str]:
+        """
+        Start a transcription and return its segments lazily.
+
+        Segments are decoded as the iterator is consumed, so callers can
+        forward them (or drop them) without holding the whole transcript.
+        One of the model's num_workers slots is held from the call until the
+        iterator is exhausted, closed or garbage collected; further
+        concurrent calls wait their turn.
+
+        Args:
+            audio_path: Path to audio file
+            config: Transcription configuration (see transcribe())
+
+        Returns:
+            Tuple of (segment iterator, detected or requested language code)
+        """
+        self._check_ready()
+
+        # Extract config
+        language = config.get("language", None)
+        vad_filter = config.get("vad_filter", True)
+        word_timestamps = config.get("word_timestamps", False)
+        beam_size = config.get("beam_size", 5)
+        best_of = config.get("best_of", 5)
+        temperature = config.get("temperature", 0.0)
+        vad_parameters = config.get("vad_parameters", None)
+        initial_prompt = config.get("initial_prompt", None)
+        batch_size = config.get("batch_size") or 1
+
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
                 f"Transcribing audio: {audio_path}",
                 extra={
@@ -156,106 +355,117 @@ class FasterWhisperEngine(ASREngine):
                         "vad_filter": vad_filter,
                         "word_timestamps": word_timestamps,
                         "initial_prompt": initial_prompt,
+                        "batch_size": batch_size,
                     }
                 },
             )
 
-            start_time = time.time()
-
-            # Transcribe with faster-whisper
-            segments_generator, info = self.model.transcribe(
-                audio_path,
-                language=language,
-                vad_filter=vad_filter,
-                vad_parameters=vad_parameters,
-                word_timestamps=word_timestamps,
-                beam_size=beam_size,
-                best_of=best_of,
-                temperature=temperature,
-                initial_prompt=initial_prompt,
-            )
+        transcribe_kwargs = dict(
+            language=language,
+            vad_filter=vad_filter,
+            vad_parameters=vad_parameters,
+            word_timestamps=word_timestamps,
+            beam_size=beam_size,
+            best_of=best_of,
+            temperature=temperature,
+            initial_prompt=initial_prompt,
+        )
 
-            # Convert generator to list and extract segments
-            segments_list = []
-            full_text_parts = []
-
-            for segment in segments_generator:
-                # Build segment text
-                text = segment.text.strip()
-                full_text_parts.append(text)
-
-                # Extract word timestamps if available
-                words_list = None
-                if word_timestamps and hasattr(segment, "words") and segment.words:
-                    words_list = []
-                    for word in segment.words:
-                        # Skip words with invalid timestamps (end <= start)
-                        # This can happen with faster-whisper in edge cases
-                        if word.end <= word.start:
-                            logger.warning(
-                                f"Skipping word with invalid timestamps: '{word.word}' "
-                                f"(start={word.start}, end={word.end})"
-                            )
-                            continue
-                        
-                        try:
-                            words_list.append(
-                                Word(
-                                    start=word.start,
-                                    end=word.end,
-                                    word=word.word.strip(),
-                                    confidence=word.probability if hasattr(word, "probability") else None,
-                                )
-                            )
-                        except Exception as e:
-                            logger.warning(f"Failed to create Word object: {e}")
-                            continue
-                    
-                    # If no valid words, set to None
-                    if not words_list:
-                        words_list = None
-
-
-                # Create segment
-                segments_list.append(
-                    Segment(
-                        start=segment.start,
-                        end=segment.end,
-                        text=text,
-                        words=words_list,
+        # Transcribe with faster-whisper. The batched pipeline relies on VAD
+        # to cut the audio into independent chunks, so it is only used when
+        # VAD is enabled; otherwise fall back to sequential decoding.
+        # Audio is decoded up front here; a missing file fails on open rather
+        # than with a separate stat() beforehand.
+        slots = self._transcribe_slots
+        slots.acquire()
+        try:
+            try:
+                if self.batched_model is not None and vad_filter and batch_size > 1:
+                    segments_generator, info = self.batched_model.transcribe(
+                        audio_path, batch_size=batch_size, **transcribe_kwargs
                     )
-                )
+                else:
+                    segments_generator, info = self.model.transcribe(
+                        audio_path, **transcribe_kwargs
+                    )
+            except FileNotFoundError as e:
+                raise FileNotFoundError(f"Audio file not found: {audio_path}") from e
+        except BaseException:
+            slots.release()
+            raise
+
+        segments = _release_when_done(
+            slots, self._convert_segments(segments_generator, word_timestamps)
+        )
+        next(segments)
 
-            inference_time_ms = (time.time() - start_time) * 1000
+        detected_language = getattr(info, "language", None) or language or "unknown"
+        return segments, detected_language
 
-            # Build full transcript
-            full_text = " ".join(full_text_parts)
-            detected_language = info.language if hasattr(info, "language") else (language or "unknown")
+    def _convert_segments(self, segments_generator, word_timestamps: bool) -> Iterator[Segment]:
+        """
+        Convert faster-whisper segments to our Segment format as they arrive.
 
-            logger.info(
-                f"Transcription complete in {inference_time_ms:.1f}ms",
-                extra={
-                    "metadata": {
-                        "inference_time_ms": inference_time_ms,
-                        "segment_count": len(segments_list),
-                        "language": detected_language,
-                    }
-                },
+        Args:
+            segments_generator: faster-whisper segment generator
+            word_timestamps: Whether to convert word timestamps
+
+        Yields:
+            Segment: Valid segments, in order
+        """
+        skipped_words = 0
+
+        for segment in segments_generator:
+            # Build segment text
+            text = segment.text.strip()
+
+            # Skip segments the Segment model would reject. Segments and
+            # words are built with model_construct, so the checks that
+            # validation did per object happen here, once.
+            if segment.end <= segment.start or not text:
+                logger.warning(
+                    "Skipping invalid segment: start=%.3f, end=%.3f, text=%r",
+                    segment.start, segment.end, text,
+                )
+                continue
+
+            # Extract word timestamps if available. Words with invalid
+            # timestamps (end <= start, an edge case in faster-whisper) or
+            # empty text are dropped and reported once at the end.
+            words_list = None
+            if word_timestamps and getattr(segment, "words", None):
+                words_list = [
+                    Word.model_construct(
+                        start=word.start,
+                        end=word.end,
+                        word=word_text,
+                        confidence=getattr(word, "probability", None),
+                    )
+                    for word in segment.words
+                    if word.end > word.start and (word_text := word.word.strip())
+                ]
+                skipped_words += len(segment.words) - len(words_list)
+
+                # If no valid words, set to None
+                if not words_list:
+                    words_list = None
+
+            yield Segment.model_construct(
+                start=segment.start,
+                end=segment.end,
+                text=text,
+                words=words_list,
             )
 
-            return TranscriptionResult(
-                text=full_text,
-                language=detected_language,
-                segments=segments_list,
-                inference_time_ms=inference_time_ms,
+        if skipped_words:
+            logger.warning(
+                f"Skipped {skipped_words} words with invalid timestamps or empty text"
             )
 
-        except MemoryError as e:
-            logger.error(f"Out of memory during transcription: {e}")
-            raise Exception(f"Insufficient memory (OOM): {str(e)}")
-        except Exception as e:
-            logger.error(f"Transcription failed: {e}")
-            raise Exception(f"Transcription failed: {str(e)}")
+    def _check_ready(self):
+        """Raise if no model is loaded."""
+        if self.model is None:
+            raise ModelNotLoadedError("Model not loaded. Call load_model() first.")
 
     def get_info(self) -> EngineInfo:
         """
@@ -264,28 +474,4 @@ class FasterWhisperEngine(ASREngine):
         Returns:
             EngineInfo: Engine capabilities and version
         """
-        try:
-            import faster_whisper
-            version = getattr(faster_whisper, "__version__", "unknown")
-        except:
-            version = "unknown"
-
-        return EngineInfo(
-            name="faster-whisper",
-            version=version,
-            supported_models=[
-                "tiny",
-                "tiny.en",
-                "base",
-                "base.en",
-                "small",
-                "small.en",
-                "medium",
-                "medium.en",
-                "large",
-                "large-v1",
-                "large-v2",
-                "large-v3",
-            ],
-            supports_word_timestamps=True,
-        )
+        return _ENGINE_INFO
@@ -5,12 +5,24 @@ Original Whisper implementation from OpenAI.
 Simple, reliable, with natural segmentation.
 """
 
+import gc
+import os
 import time
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 from pathlib import Path
 
-from lib.engines.base import ASREngine, TranscriptionResult, Segment, Word, EngineInfo
+from lib.engines.base import (
+    ASREngine,
+    TranscriptionResult,
+    Segment,
+    Word,
+    EngineInfo,
+    TranscribeConfig,
+    ModelNotLoadedError,
+)
+from lib.engines.faster_whisper import FASTER_WHISPER_AVAILABLE, FasterWhisperEngine
+from lib.utils.vad import SILERO_VAD_AVAILABLE, SpeechTimeline, extract_speech
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +35,95 @@ except ImportError:
     OPENAI_WHISPER_AVAILABLE = False
     logger.warning("OpenAI Whisper not available. Install with: pip install openai-whisper")
 
+# In-process audio decoding (PyAV) bundled with faster-whisper
+try:
+    from faster_whisper.audio import decode_audio
+    PYAV_DECODE_AVAILABLE = True
+except ImportError:
+    PYAV_DECODE_AVAILABLE = False
+
+# Optional HQQ weight-only quantization
+try:
+    from hqq.core.quantize import BaseQuantizeConfig, HQQLinear
+    HQQ_AVAILABLE = True
+except ImportError:
+    HQQ_AVAILABLE = False
+
+# Optional OpenVINO GenAI runtime (CPU, GPU and NPU targets)
+try:
+    import openvino_genai
+    OPENVINO_AVAILABLE = True
+except ImportError:
+    OPENVINO_AVAILABLE = False
+
+# Optional whisper.cpp bindings
+try:
+    from pywhispercpp.model import Model as WhisperCppModel
+    WHISPERCPP_AVAILABLE = True
+except ImportError:
+    WHISPERCPP_AVAILABLE = False
+
+# Inference backends accepted by load_model
+_BACKENDS = ("torch", "ct2", "openvino", "whispercpp")
+
+# Weight quantization modes for the "torch" backend
+_QUANTIZE_MODES = ("none", "int8_dynamic", "hqq4")
+
+# Inference backend used when the load config has no "backend" key:
+# "torch" runs the official PyTorch model, "ct2" runs the same weights
+# through CTranslate2 (int8 GEMM on CPU) via faster-whisper, "openvino"
+# and "whispercpp" run converted models on those runtimes
+_DEFAULT_BACKEND = os.environ.get("OPENAI_WHISPER_BACKEND", "torch")
+
+# Model sizes accepted by whisper.load_model
+_SUPPORTED_MODELS = (
+    "tiny",
+    "base",
+    "small",
+    "medium",
+    "large",
+    "large-v2",
+    "large-v3",
+)
+
+# Engine info is static; built once and shared by every get_info() call
+_ENGINE_INFO = EngineInfo.model_construct(
+    name="openai-whisper",
+    version="20250625",
+    supports_word_timestamps=True,
+    supported_models=_SUPPORTED_MODELS,
+)
+
+
+def _as_plain_linear(layer: "torch.nn.Linear") -> "torch.nn.Linear":
+    """Return a plain nn.Linear sharing the given layer's parameters."""
+    plain = torch.nn.Linear(layer.in_features, layer.out_features, bias=layer.bias is not None)
+    plain.weight = layer.weight
+    plain.bias = layer.bias
+    return plain
+
+
+def _replace_linear(module: "torch.nn.Module", convert) -> None:
+    """
+    Replace every nn.Linear below a module, recursively.
+
+    Args:
+        module: Root module, modified in place
+        convert: Called with each Linear; returns its replacement
+    """
+    for name, child in module.named_children():
+        if isinstance(child, torch.nn.Linear):
+            setattr(module, name, convert(child))
+        else:
+            _replace_linear(child, convert)
+
+
+def _load_audio(audio_path: str):
+    """Decode a file to 16 kHz mono float32, in-process when PyAV is available."""
+    if PYAV_DECODE_AVAILABLE:
+        return decode_audio(audio_path, sampling_rate=whisper.audio.SAMPLE_RATE)
+    return whisper.load_audio(audio_path)
+
 
 class OpenAIWhisperEngine(ASREngine):
     """
@@ -45,6 +146,9 @@ class OpenAIWhisperEngine(ASREngine):
         self.model: Optional[Any] = None
         self.model_size: Optional[str] = None
         self.device: str = "cpu"
+        self._backend: str = "torch"
+        # Set when the model was loaded with the "ct2" backend
+        self._ct2_engine: Optional[FasterWhisperEngine] = None
 
     def load_model(self, model_size: str, config: dict):
         """
@@ -54,11 +158,56 @@ class OpenAIWhisperEngine(ASREngine):
             model_size: Model size (tiny, base, small, medium, large, large-v2, large-v3)
             config: Configuration dict with:
                 - device: "cpu" or "cuda"
+                - device_index: GPU index when device is "cuda" (default: 0)
                 - download_root: Optional path for model cache
+                - backend: "torch" (official PyTorch model), "ct2"
+                  (CTranslate2 via faster-whisper), "openvino" (OpenVINO
+                  GenAI) or "whispercpp" (whisper.cpp); default from the
+                  OPENAI_WHISPER_BACKEND env var, else "torch"
+                - model_path: Converted OpenVINO model directory for the
+                  "openvino" backend (default: model_size)
+                - ov_device: OpenVINO device, e.g. "CPU", "GPU", "NPU"
+                  (default: "CPU")
+                - cache_dir: OpenVINO compiled-kernel cache directory
+                  (default: ".ov_cache")
+                - compute_type: CTranslate2 compute type for the "ct2" backend
+                  (default: "int8" on CPU, "float16" on CUDA)
+                - quantize: Weight quantization on the "torch" backend:
+                  "none" (default), "int8_dynamic" (CPU only) or "hqq4"
+                  (needs hqq); only Linear layers are quantized
+                - compile_decoder: torch.compile the decoder with CUDA graphs
+                  on the "torch" backend (default: False); the compile cost
+                  is paid by a warm-up decode during load
         """
-        start_time = time.time()
+        backend = config.get("backend", _DEFAULT_BACKEND)
+        if backend not in _BACKENDS:
+            raise ValueError(
+                f"Unsupported backend: '{backend}'. "
+                f"Available backends: {', '.join(_BACKENDS)}"
+            )
+        self._ct2_engine = None
+        if backend == "ct2":
+            self._load_ct2_model(model_size, config)
+        elif backend == "openvino":
+            self._load_openvino_model(model_size, config)
+        elif backend == "whispercpp":
+            self._load_whispercpp_model(model_size, config)
+        if backend != "torch":
+            self._backend = backend
+            return
+
+        quantize = config.get("quantize", "none")
+        if quantize not in _QUANTIZE_MODES:
+            raise ValueError(
+                f"Unsupported quantize mode: '{quantize}'. "
+                f"Available modes: {', '.join(_QUANTIZE_MODES)}"
+            )
+
+        start_time = time.perf_counter_ns()
 
         self.device = config.get("device", "cpu")
+        if self.device == "cuda" and "device_index" in config:
+            self.device = f"cuda:{config['device_index']}"
         download_root = config.get("download_root", None)
 
         logger.info(f"Loading OpenAI Whisper model: {model_size} on {self.device}")
@@ -70,15 +219,184 @@ class OpenAIWhisperEngine(ASREngine):
                 download_root=download_root,
             )
             self.model_size = model_size
+            self._backend = "torch"
+
+            if quantize != "none":
+                self._quantize(quantize)
+
+            if config.get("compile_decoder", False):
+                self._compile_decoder()
 
-            load_time = time.time() - start_time
+            load_time = (time.perf_counter_ns() - start_time) / 1e9
             logger.info(f"OpenAI Whisper model loaded in {load_time:.2f}s")
 
         except Exception as e:
             logger.error(f"Failed to load OpenAI Whisper model: {e}")
             raise RuntimeError(f"Failed to load model '{model_size}': {e}")
 
-    def transcribe(self, audio_path: str, config: dict) -> TranscriptionResult:
+    def _quantize(self, mode: str):
+        """
+        Quantize the model's Linear weights in place.
+
+        The decoder is weight-bandwidth-bound at batch size 1, so fewer
+        bytes per weight means faster steps and a smaller footprint.
+        Convolutions, layer norms and embeddings stay in full precision.
+
+        Args:
+            mode: "int8_dynamic" or "hqq4"
+        """
+        if mode == "int8_dynamic":
+            if self.device != "cpu":
+                raise RuntimeError("int8_dynamic quantization runs on CPU only; use device 'cpu'")
+            # quantize_dynamic matches exact module types, and whisper uses
+            # its own nn.Linear subclass
+            _replace_linear(self.model, _as_plain_linear)
+            self.model = torch.ao.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        elif mode == "hqq4":
+            if not HQQ_AVAILABLE:
+                raise RuntimeError("hqq4 quantization needs hqq. Install with: pip install hqq")
+            quant_config = BaseQuantizeConfig(nbits=4, group_size=64)
+            _replace_linear(
+                self.model,
+                lambda layer: HQQLinear(
+                    layer, quant_config, compute_dtype=torch.float16, device=self.device
+                ),
+            )
+
+        logger.info(f"Quantized Whisper Linear weights: {mode}")
+
+    def _compile_decoder(self):
+        """
+        Compile the text decoder for CUDA-graph replay and warm it up.
+
+        The batch-size-1 autoregressive decoder is launch-bound on GPU;
+        "reduce-overhead" replays each step as a captured CUDA graph.
+        Failures leave the eager decoder in place.
+        """
+        if not self.device.startswith("cuda"):
+            logger.warning("compile_decoder needs a CUDA device; using the eager decoder")
+            return
+        if not hasattr(torch, "compile"):
+            logger.warning("compile_decoder needs torch >= 2.0; using the eager decoder")
+            return
+
+        eager_decoder = self.model.decoder
+        try:
+            start_time = time.perf_counter_ns()
+            self.model.decoder = torch.compile(eager_decoder, mode="reduce-overhead")
+
+            # One 30s window of silence traces the decoder here instead of
+            # in the first transcribe() call
+            mel = torch.zeros((self.model.dims.n_mels, 3000), device=self.device)
+            whisper.decode(self.model, mel, whisper.DecodingOptions(language="en", without_timestamps=True))
+
+            compile_time = (time.perf_counter_ns() - start_time) / 1e9
+            logger.info(f"Compiled Whisper decoder in {compile_time:.2f}s")
+        except Exception as e:
+            self.model.decoder = eager_decoder
+            logger.warning(f"Decoder compilation failed, using the eager decoder: {e}")
+
+    def _load_ct2_model(self, model_size: str, config: dict):
+        """
+        Load the model with the CTranslate2 backend.
+
+        Same Whisper weights, run by faster-whisper's fused C++ kernels;
+        transcribe() then delegates to the wrapped FasterWhisperEngine.
+
+        Args:
+            model_size: Model size
+            config: load_model configuration dict
+        """
+        if not FASTER_WHISPER_AVAILABLE:
+            raise RuntimeError(
+                "The ct2 backend needs faster-whisper. "
+                "Install with: pip install faster-whisper"
+            )
+
+        device = config.get("device", "cpu")
+        ct2_config = {
+            **config,
+            "compute_type": config.get("compute_type", "int8" if device == "cpu" else "float16"),
+        }
+        if device == "cpu":
+            ct2_config.setdefault("cpu_threads", os.cpu_count() or 0)
+
+        engine = FasterWhisperEngine()
+        engine.load_model(model_size, ct2_config)
+
+        self._ct2_engine = engine
+        self.model = engine.model
+        self.model_size = model_size
+        self.device = device
+
+    def _load_openvino_model(self, model_size: str, config: dict):
+        """
+        Load an OpenVINO-converted Whisper model into a GenAI pipeline.
+
+        Compiled kernels are cached in cache_dir, so later loads on the
+        same device skip compilation.
+
+        Args:
+            model_size: Model size, used as the model directory when
+                model_path is not given
+            config: load_model configuration dict
+        """
+        if not OPENVINO_AVAILABLE:
+            raise RuntimeError(
+                "The openvino backend needs OpenVINO GenAI. "
+                "Install with: pip install openvino-genai"
+            )
+
+        model_path = config.get("model_path", model_size)
+        ov_device = config.get("ov_device", "CPU")
+        logger.info(f"Loading OpenVINO Whisper model: {model_path} on {ov_device}")
+
+        try:
+            self.model = openvino_genai.WhisperPipeline(
+                model_path, ov_device, CACHE_DIR=config.get("cache_dir", ".ov_cache")
+            )
+        except Exception as e:
+            logger.error(f"Failed to load OpenVINO Whisper model: {e}")
+            raise RuntimeError(f"Failed to load model '{model_path}': {e}")
+
+        self.model_size = model_size
+        self.device = "cpu"
+
+    def _load_whispercpp_model(self, model_size: str, config: dict):
+        """
+        Load a ggml Whisper model with whisper.cpp.
+
+        Args:
+            model_size: Model size (downloaded by pywhispercpp) or ggml file path
+            config: load_model configuration dict; cpu_threads sets the
+                thread count (default: all cores)
+        """
+        if not WHISPERCPP_AVAILABLE:
+            raise RuntimeError(
+                "The whispercpp backend needs pywhispercpp. "
+                "Install with: pip install pywhispercpp"
+            )
+
+        logger.info(f"Loading whisper.cpp model: {model_size}")
+
+        try:
+            self.model = WhisperCppModel(
+                model_size,
+                models_dir=config.get("download_root", None),
+                n_threads=config.get("cpu_threads") or os.cpu_count() or 1,
+                print_progress=False,
+                print_realtime=False,
+            )
+        except Exception as e:
+            logger.error(f"Failed to load whisper.cpp model: {e}")
+            raise RuntimeError(f"Failed to load model '{model_size}': {e}")
+
+        self.model_size = model_size
+        self.device = "cpu"
+
+    def transcribe(self, audio_path: str, config: TranscribeConfig) -> TranscriptionResult:
         """
         Transcribe audio with OpenAI Whisper.
 
@@ -92,12 +410,17 @@ class OpenAIWhisperEngine(ASREngine):
                 - best_of: Number of candidates (default: 5)
                 - condition_on_previous_text: Use previous text as context (default: True)
                 - initial_prompt: Optional text to guide transcription style/vocabulary
+                - vad_filter: Only decode speech found by a Silero VAD pre-pass (default: False)
+                - vad_parameters: VAD configuration dict
 
         Returns:
             TranscriptionResult with segments and optional word timestamps
         """
         if self.model is None:
-            raise Exception("Model not loaded. Call load_model() first.")
+            raise ModelNotLoadedError("Model not loaded. Call load_model() first.")
+
+        if self._ct2_engine is not None:
+            return self._ct2_engine.transcribe(audio_path, config)
 
         if not Path(audio_path).exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
@@ -113,16 +436,55 @@ class OpenAIWhisperEngine(ASREngine):
         no_speech_threshold = config.get("no_speech_threshold", 0.6)
         compression_ratio_threshold = config.get("compression_ratio_threshold", 2.4)
         logprob_threshold = config.get("logprob_threshold", -1.0)
+        vad_filter = config.get("vad_filter", False)
 
-        logger.info(f"Transcribing: {audio_path}")
-        logger.info(f"Config: language={language}, word_timestamps={word_timestamps}, initial_prompt={initial_prompt}")
+        # Lazy %-formatting: nothing is stringified when INFO is disabled
+        logger.info("Transcribing: %s", audio_path)
+        logger.info(
+            "Config: language=%s, word_timestamps=%s, initial_prompt=%s",
+            language, word_timestamps, initial_prompt,
+        )
 
-        inference_start = time.time()
+        inference_start = time.perf_counter_ns()
+
+        # Whisper has no VAD of its own; drop silence up front so the
+        # decoder only runs over speech
+        audio = audio_path
+        timeline = None
+        if vad_filter and SILERO_VAD_AVAILABLE:
+            audio, timeline = extract_speech(audio_path, config.get("vad_parameters"))
+            if audio.size == 0:
+                return TranscriptionResult(
+                    text="",
+                    language=language or "unknown",
+                    segments=[],
+                    inference_time_ms=(time.perf_counter_ns() - inference_start) / 1e6,
+                )
+        elif vad_filter:
+            logger.warning("vad_filter requested but Silero VAD is unavailable (needs faster-whisper)")
 
         try:
+            if self._backend == "openvino":
+                result = self._generate_openvino(audio, language, initial_prompt)
+                return self._convert_result(
+                    result, (time.perf_counter_ns() - inference_start) / 1e6, timeline
+                )
+            if self._backend == "whispercpp":
+                result = self._generate_whispercpp(audio, language, initial_prompt)
+                return self._convert_result(
+                    result, (time.perf_counter_ns() - inference_start) / 1e6, timeline
+                )
+
+            # Hand whisper a waveform tensor on the model's device: no
+            # ffmpeg process per call, and the log-mel is computed there
+            if isinstance(audio, str) and PYAV_DECODE_AVAILABLE:
+                audio = decode_audio(audio, sampling_rate=whisper.audio.SAMPLE_RATE)
+            if not isinstance(audio, str):
+                audio = torch.from_numpy(audio).to(self.device)
+
             # Transcribe with OpenAI Whisper
             result = self.model.transcribe(
-                audio_path,
+                audio,
                 language=language,
                 word_timestamps=word_timestamps,
                 temperature=temperature,
@@ -136,19 +498,176 @@ class OpenAIWhisperEngine(ASREngine):
                 verbose=False,  # Disable verbose output
             )
 
-            inference_time_ms = (time.time() - inference_start) * 1000
+            inference_time_ms = (time.perf_counter_ns() - inference_start) / 1e6
 
             # Convert to our TranscriptionResult format
-            return self._convert_result(result, inference_time_ms)
+            return self._convert_result(result, inference_time_ms, timeline)
 
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             raise RuntimeError(f"OpenAI Whisper transcription failed: {e}")
 
+    def transcribe_stream(
+        self, audio_path: str, config: TranscribeConfig
+    ) -> Tuple[Iterator[Segment], str]:
+        """
+        Transcribe audio, returning its segments as an iterator.
+
+        Lazy on the "ct2" backend; the other backends decode the whole file
+        first (see ASREngine.transcribe_stream).
+
+        Args:
+            audio_path: Path to audio file
+            config: Transcription configuration (see transcribe())
+
+        Returns:
+            Tuple of (segment iterator, detected or requested language code)
+        """
+        if self._ct2_engine is not None:
+            return self._ct2_engine.transcribe_stream(audio_path, config)
+        return super().transcribe_stream(audio_path, config)
+
+    def _generate_openvino(self, audio, language: Optional[str], initial_prompt: Optional[str]) -> dict:
+        """
+        Run the OpenVINO pipeline and return a whisper-style result dict.
+
+        Args:
+            audio: Audio path or 16 kHz waveform
+            language: Optional language code
+            initial_prompt: Optional prompt text
+
+        Returns:
+            dict with "segments" (start, end, text) and "language"
+        """
+        if isinstance(audio, str):
+            audio = _load_audio(audio)
+
+        options = {"task": "transcribe", "return_timestamps": True}
+        if language:
+            options["language"] = f"<|{language}|>"
+        if initial_prompt:
+            options["initial_prompt"] = initial_prompt
+
+        decoded = self.model.generate(audio.tolist(), **options)
+        return {
+            "segments": [
+                {"start": chunk.start_ts, "end": chunk.end_ts, "text": chunk.text}
+                for chunk in decoded.chunks or ()
+            ],
+            "language": language or "unknown",
+        }
+
+    def _generate_whispercpp(self, audio, language: Optional[str], initial_prompt: Optional[str]) -> dict:
+        """
+        Run whisper.cpp and return a whisper-style result dict.
+
+        Args:
+            audio: Audio path or 16 kHz waveform
+            language: Optional language code
+            initial_prompt: Optional prompt text
+
+        Returns:
+            dict with "segments" (start, end, text) and "language"
+        """
+        params = {"language": language or "auto"}
+        if initial_prompt:
+            params["initial_prompt"] = initial_prompt
+
+        # whisper.cpp timestamps are in centiseconds
+        return {
+            "segments": [
+                {"start": seg.t0 / 100, "end": seg.t1 / 100, "text": seg.text}
+                for seg in self.model.transcribe(audio, **params)
+            ],
+            "language": language or "unknown",
+        }
+
+    def transcribe_batch(self, audio_paths: List[str], config: TranscribeConfig) -> List[TranscriptionResult]:
+        """
+        Transcribe several short clips in one batched pass.
+
+        Clips that fit in one 30s Whisper window are stacked into a single
+        mel batch, so the encoder runs once and beam search decodes all of
+        them together. Longer clips, and every clip when word timestamps are
+        requested, go through transcribe() one by one. A batched clip
+        yields a single segment spanning the clip, and its
+        inference_time_ms is the time of the whole batch.
+
+        Args:
+            audio_paths: Paths to audio files
+            config: Transcription configuration (see transcribe())
+
+        Returns:
+            One TranscriptionResult per path, in order
+        """
+        if self.model is None:
+            raise ModelNotLoadedError("Model not loaded. Call load_model() first.")
+
+        if self._backend != "torch" or config.get("word_timestamps", False):
+            return [self.transcribe(path, config) for path in audio_paths]
+
+        results: List[Optional[TranscriptionResult]] = [None] * len(audio_paths)
+        batch = []  # (index, duration_s, mel)
+
+        inference_start = time.perf_counter_ns()
+
+        try:
+            for index, path in enumerate(audio_paths):
+                audio = _load_audio(path)
+                if len(audio) > whisper.audio.N_SAMPLES:
+                    results[index] = self.transcribe(path, config)
+                    continue
+                mel = whisper.log_mel_spectrogram(
+                    whisper.pad_or_trim(torch.from_numpy(audio).to(self.device)),
+                    self.model.dims.n_mels,
+                )
+                batch.append((index, len(audio) / whisper.audio.SAMPLE_RATE, mel))
+
+            if not batch:
+                return results
+
+            temperature = config.get("temperature", 0.0)
+            options = whisper.DecodingOptions(
+                language=config.get("language", None),
+                temperature=temperature,
+                beam_size=config.get("beam_size", 5) if temperature == 0 else None,
+                best_of=config.get("best_of", 5) if temperature > 0 else None,
+                prompt=config.get("initial_prompt", None),
+                without_timestamps=True,
+                fp16=self.device.startswith("cuda"),
+            )
+            decoded = self.model.decode(torch.stack([mel for _, _, mel in batch]), options)
+
+        except Exception as e:
+            logger.error(f"Batch transcription failed: {e}")
+            raise RuntimeError(f"OpenAI Whisper batch transcription failed: {e}")
+
+        inference_time_ms = (time.perf_counter_ns() - inference_start) / 1e6
+        no_speech_threshold = config.get("no_speech_threshold", 0.6)
+        logprob_threshold = config.get("logprob_threshold", -1.0)
+
+        for (index, duration, _), result in zip(batch, decoded):
+            text = result.text.strip()
+            # Same silence rule whisper.transcribe applies per window
+            if result.no_speech_prob > no_speech_threshold and result.avg_logprob < logprob_threshold:
+                text = ""
+            results[index] = TranscriptionResult(
+                text=text,
+                language=result.language,
+                segments=[Segment(start=0.0, end=duration, text=text)] if text and duration > 0 else [],
+                inference_time_ms=inference_time_ms,
+            )
+
+        logger.info(
+            "Batch-transcribed %d of %d clips in %.1fms", len(batch), len(audio_paths), inference_time_ms
+        )
+        return results
+
     def _convert_result(
         self,
         whisper_result: dict,
-        inference_time_ms: float
+        inference_time_ms: float,
+        timeline: Optional[SpeechTimeline] = None,
     ) -> TranscriptionResult:
         """
         Convert OpenAI Whisper result to our TranscriptionResult format.
@@ -156,56 +675,67 @@ class OpenAIWhisperEngine(ASREngine):
         Args:
             whisper_result: Raw Whisper result dict
             inference_time_ms: Inference time in milliseconds
+            timeline: Maps VAD-compacted times back to the original audio
 
         Returns:
             TranscriptionResult with standardized format
         """
         segments = []
         full_text_parts = []
-
-        for seg in whisper_result.get("segments", []):
-            seg_start = float(seg.get("start", 0.0))
-            seg_end = float(seg.get("end", 0.0))
-            seg_text = seg.get("text", "").strip()
-
-            # Skip invalid segments
+        skipped_words = 0
+
+        for seg in whisper_result.get("segments", ()):
+            seg_start = float(seg["start"])
+            seg_end = float(seg["end"])
+            seg_text = seg["text"].strip()
+            if timeline is not None:
+                seg_start = timeline.to_original(seg_start)
+                seg_end = timeline.to_original(seg_end, is_end=True)
+
+            # Skip segments the Segment model would reject. Segments and
+            # words are built with model_construct, so the checks that
+            # validation did per object happen here, once.
             if seg_end <= seg_start or not seg_text:
-                logger.warning(f"Skipping invalid segment: start={seg_start}, end={seg_end}, text='{seg_text}'")
+                logger.warning(
+                    "Skipping invalid segment: start=%.3f, end=%.3f, text=%r",
+                    seg_start, seg_end, seg_text,
+                )
                 continue
 
-            # Extract word-level timestamps if available
-            words = []
-            if "words" in seg and seg["words"]:
-                for word_data in seg["words"]:
-                    word_start = float(word_data.get("start", 0.0))
-                    word_end = float(word_data.get("end", 0.0))
-                    word_text = word_data.get("word", "").strip()
-
-                    # Skip invalid words
-                    if word_end <= word_start or not word_text:
-                        continue
-
-                    try:
-                        word = Word(
-                            start=word_start,
-                            end=word_end,
-                            word=word_text,
-                            confidence=word_data.get("probability", None),
-                        )
-                        words.append(word)
-                    except Exception as e:
-                        logger.warning(f"Failed to create Word object: {e}")
-                        continue
-
-            # Create segment
-            segment = Segment(
-                start=seg_start,
-                end=seg_end,
-                text=seg_text,
-                words=words if words else None,
+            # Extract word-level timestamps if available; words with
+            # invalid timestamps or empty text are dropped
+            raw_words = seg.get("words") or ()
+            if timeline is None:
+                spans = ((float(w["start"]), float(w["end"]), w) for w in raw_words)
+            else:
+                spans = (
+                    (timeline.to_original(w["start"]), timeline.to_original(w["end"], is_end=True), w)
+                    for w in raw_words
+                )
+            words = [
+                Word.model_construct(
+                    start=word_start,
+                    end=word_end,
+                    word=word_text,
+                    confidence=w.get("probability"),
+                )
+                for word_start, word_end, w in spans
+                if word_end > word_start and (word_text := w["word"].strip())
+            ]
+            skipped_words += len(raw_words) - len(words)
+
+            segments.append(
+                Segment.model_construct(
+                    start=seg_start,
+                    end=seg_end,
+                    text=seg_text,
+                    words=words or None,
+                )
             )
-            segments.append(segment)
-            full_text_parts.append(segment.text)
+            full_text_parts.append(seg_text)
+
+        if skipped_words:
+            logger.warning(f"Skipped {skipped_words} words with invalid timestamps or empty text")
 
         # Combine all segment text
         full_text = " ".join(full_text_parts).strip()
@@ -225,20 +755,7 @@ class OpenAIWhisperEngine(ASREngine):
         Returns:
             EngineInfo with engine metadata
         """
-        return EngineInfo(
-            name="openai-whisper",
-            version="20250625",
-            supports_word_timestamps=True,
-            supported_models=[
-                "tiny",
-                "base",
-                "small",
-                "medium",
-                "large",
-                "large-v2",
-                "large-v3",
-            ],
-        )
+        return _ENGINE_INFO
 
     def unload_model(self):
         """
@@ -246,9 +763,24 @@ class OpenAIWhisperEngine(ASREngine):
         """
         logger.info("Unloading OpenAI Whisper model")
 
+        if self._backend != "torch":
+            # CTranslate2, OpenVINO and whisper.cpp free their own memory
+            # with the last reference
+            self.model = None
+            self._ct2_engine = None
+            return
+
+        # The loaded device says whether CUDA was used; no runtime probe
+        on_cuda = self.model is not None and self.device.startswith("cuda")
+        if on_cuda:
+            # Move weights off the GPU so the cached blocks become free even
+            # if something else still references the module
+            self.model.to("cpu")
         self.model = None
+        gc.collect()
 
-        # Clear CUDA cache if available
-        if torch.cuda.is_available():
+        if on_cuda:
+            torch.cuda.synchronize()
             torch.cuda.empty_cache()
+            torch.cuda.ipc_collect()
             logger.info("Cleared CUDA cache")
@@ -5,12 +5,79 @@ Generates subtitle files in SubRip format (.srt), the most widely supported
 subtitle format used by YouTube, Premiere Pro, and most video players.
 """
 
+import io
 import logging
-from typing import List
+import re
+from functools import lru_cache
+from typing import Iterable, List, TextIO
 from lib.engines.base import Segment, Word
 
 logger = logging.getLogger(__name__)
 
+# CJK Unified Ideographs, Japanese Hiragana/Katakana, Korean Hangul
+_CJK_RE = re.compile(r"[\u4e00-\u9fff\u3040-\u30ff\uac00-\ud7af]")
+# Letters: word characters minus digits and underscore
+_ALPHA_RE = re.compile(r"[^\W\d_]")
+
+# A well-formed SRT file (stripped): entries of number, timing line and
+# one or more non-blank text lines, separated by blank lines
+_SRT_ENTRY = (
+    r"\d+\n\d{2}:\d{2}:\d{2},\d{3} --> \d{2}:\d{2}:\d{2},\d{3}\n"
+    r"[^\S\n]*\S[^\n]*(?:\n[^\S\n]*\S[^\n]*)*"
+)
+_SRT_RE = re.compile(rf"{_SRT_ENTRY}(?:\n(?:[^\S\n]*\n)+{_SRT_ENTRY})*")
+
+
+@lru_cache(maxsize=4096)
+def _wrap(text: str, max_line_width: int, max_line_count: int) -> str:
+    """
+    Greedily wrap words into lines of at most max_line_width characters.
+
+    Memoized so repeated captions are wrapped once. A word longer than the
+    width gets a line of its own; lines beyond max_line_count are merged
+    into the last allowed line.
+    """
+    lines = []
+    current_line = []
+    current_length = 0
+
+    for word in text.split():
+        word_length = len(word)
+
+        # Check if adding this word (and one space per word already on the
+        # line) exceeds line width
+        if current_length + word_length + len(current_line) > max_line_width:
+            if current_line:
+                lines.append(" ".join(current_line))
+                current_line = [word]
+                current_length = word_length
+            else:
+                # Single word exceeds max width, add it anyway
+                lines.append(word)
+                current_length = 0
+        else:
+            current_line.append(word)
+            current_length += word_length
+
+    # Add remaining words
+    if current_line:
+        lines.append(" ".join(current_line))
+
+    # Limit to max line count by merging the excess into the last line
+    if len(lines) > max_line_count:
+        lines[max_line_count - 1:] = [" ".join(lines[max_line_count - 1:])]
+
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=1024)
+def _is_cjk(text: str) -> bool:
+    """Return True if more than 30% of the letters in text are CJK."""
+    total_count = len(_ALPHA_RE.findall(text))
+    if total_count == 0:
+        return False
+    return len(_CJK_RE.findall(text)) / total_count > 0.3
+
 
 class SRTFormatter:
     """
@@ -39,7 +106,7 @@ class SRTFormatter:
     MAX_DURATION = 7.0  # Maximum subtitle duration in seconds
 
     # Punctuation marks that indicate sentence/clause boundaries
-    SPLIT_PUNCTUATION = {'。', '，', '？', '！', ',', '.', '?', '!', '、', '；', ';'}
+    SPLIT_PUNCTUATION = frozenset({'。', '，', '？', '！', ',', '.', '?', '!', '、', '；', ';'})
 
     def __init__(
         self,
@@ -65,51 +132,76 @@ class SRTFormatter:
         self.chars_per_second = chars_per_second
         self.split_by_punctuation = split_by_punctuation
 
-    def format(self, segments: List[Segment], word_level: bool = False) -> str:
+    def format(self, segments: Iterable[Segment], word_level: bool = False) -> str:
         """
         Format segments as SRT subtitle file.
 
         Args:
-            segments: List of transcription segments with timestamps
+            segments: Transcription segments with timestamps
             word_level: If True, create one subtitle per word (requires words in segments)
 
         Returns:
             SRT formatted string
         """
-        if word_level:
-            return self._format_word_level(segments)
-        else:
-            return self._format_segment_level(segments)
+        buf = io.StringIO()
+        self.stream_format(segments, buf, word_level=word_level)
+        return buf.getvalue()
 
-    def _format_segment_level(self, segments: List[Segment]) -> str:
-        """Format at segment level (sentence/phrase per subtitle)."""
+    def stream_format(
+        self, segments: Iterable[Segment], out: TextIO, word_level: bool = False
+    ) -> float:
+        """
+        Write segments as SRT entries while they arrive.
+
+        Each entry is written as soon as its segment is read, so a lazy
+        segment iterator (e.g. from an engine's transcribe_stream()) is
+        formatted without ever holding the whole transcript.
+
+        Args:
+            segments: Transcription segments with timestamps, in order
+            out: Text stream to write to (file, StringIO, ...)
+            word_level: If True, create one subtitle per word (requires words in segments)
+
+        Returns:
+            float: End time of the last segment in seconds (0.0 if none)
+        """
+        if word_level:
+            return self._format_word_level(segments, out)
         if self.adjust_timing:
-            return self._format_with_adjusted_timing(segments)
+            return self._format_with_adjusted_timing(segments, out)
+        return self._format_segment_level(segments, out)
 
-        srt_entries = []
+    def _format_segment_level(self, segments: Iterable[Segment], out: TextIO) -> float:
+        """Format at segment level (sentence/phrase per subtitle)."""
+        last_end = 0.0
         for idx, segment in enumerate(segments, start=1):
-            text = segment.text.strip()
-            start_time = self._format_timestamp(segment.start)
-            end_time = self._format_timestamp(segment.end)
-            text_lines = self._wrap_text(text)
-            entry = f"{idx}\n{start_time} --> {end_time}\n{text_lines}\n"
-            srt_entries.append(entry)
+            self._write_entry(
+                out,
+                idx,
+                self._format_timestamp_pair(segment.start, segment.end),
+                self._wrap_text(segment.text.strip()),
+            )
+            last_end = segment.end
 
-        return "\n".join(srt_entries)
+        return last_end
 
-    def _format_with_adjusted_timing(self, segments: List[Segment]) -> str:
+    def _format_with_adjusted_timing(self, segments: Iterable[Segment], out: TextIO) -> float:
         """
         Format segments with adjusted timing, fixing overlaps.
 
         When adjust_timing causes subtitles to overlap, adjust the start time
         of the overlapping subtitle to match the end time of the previous one.
+        Adjusted end times stay anchored to the original ones, so each entry
+        only depends on the previous entry and is written in the same pass.
         """
-        if not segments:
-            return ""
+        idx = 0
+        # Adjusted starts are never negative, so 0.0 never clamps the first entry
+        prev_end = 0.0
+        last_end = 0.0
 
-        # First pass: optionally split by punctuation, then calculate adjusted timing
-        adjusted_segments = []
         for segment in segments:
+            last_end = segment.end
+
             # Split segment by punctuation if enabled
             if self.split_by_punctuation and segment.words:
                 split_segments = self._split_by_punctuation(segment)
@@ -127,32 +219,21 @@ class SRTFormatter:
                 start_sec, end_sec = self._calculate_adjusted_timing(
                     text, split_seg['start'], split_seg['end']
                 )
-                adjusted_segments.append({
-                    'start': start_sec,
-                    'end': end_sec,
-                    'text': text,
-                })
 
-        # Second pass: fix overlaps by adjusting start time
-        for i in range(1, len(adjusted_segments)):
-            prev_end = adjusted_segments[i - 1]['end']
-            curr_start = adjusted_segments[i]['start']
-
-            if curr_start < prev_end:
-                # Overlap detected - set start to previous end
-                adjusted_segments[i]['start'] = prev_end
-
-        # Build SRT entries
-        srt_entries = []
-        for idx, seg in enumerate(adjusted_segments, start=1):
-            start_time = self._format_timestamp(seg['start'])
-            end_time = self._format_timestamp(seg['end'])
-            text_lines = self._wrap_text(seg['text'])
-
-            entry = f"{idx}\n{start_time} --> {end_time}\n{text_lines}\n"
-            srt_entries.append(entry)
+                if start_sec < prev_end:
+                    # Overlap detected - set start to previous end
+                    start_sec = prev_end
+                prev_end = end_sec
+
+                idx += 1
+                self._write_entry(
+                    out,
+                    idx,
+                    self._format_timestamp_pair(start_sec, end_sec),
+                    self._wrap_text(text),
+                )
 
-        return "\n".join(srt_entries)
+        return last_end
 
     def _split_by_punctuation(self, segment: Segment) -> list:
         """
@@ -175,32 +256,38 @@ class SRTFormatter:
             }]
 
         result = []
-        current_words = []
-        current_text = ""
+        punctuation = self.SPLIT_PUNCTUATION
+        # Current group: word texts (joined once at the boundary) and span
+        parts = []
+        group_start = group_end = None
 
         for word in segment.words:
             word_text = word.word.strip()
-            current_words.append(word)
-            current_text += word_text
+            if group_start is None:
+                group_start = word.start
+            group_end = word.end
+            parts.append(word_text)
 
             # Check if word ends with punctuation
-            if word_text and word_text[-1] in self.SPLIT_PUNCTUATION:
+            if word_text and word_text[-1] in punctuation:
                 # Save current group
-                if current_words and current_text.strip():
+                text = "".join(parts).strip()
+                if text:
                     result.append({
-                        'start': current_words[0].start,
-                        'end': current_words[-1].end,
-                        'text': current_text.strip(),
+                        'start': group_start,
+                        'end': group_end,
+                        'text': text,
                     })
-                current_words = []
-                current_text = ""
+                parts.clear()
+                group_start = None
 
         # Don't forget remaining words
-        if current_words and current_text.strip():
+        text = "".join(parts).strip()
+        if text:
             result.append({
-                'start': current_words[0].start,
-                'end': current_words[-1].end,
-                'text': current_text.strip(),
+                'start': group_start,
+                'end': group_end,
+                'text': text,
             })
 
         return result if result else [{
@@ -211,24 +298,7 @@ class SRTFormatter:
 
     def _is_cjk_text(self, text: str) -> bool:
         """Check if text is primarily CJK (Chinese/Japanese/Korean)."""
-        cjk_count = 0
-        total_count = 0
-        for char in text:
-            if char.isalpha() or '\u4e00' <= char <= '\u9fff':
-                total_count += 1
-                # CJK Unified Ideographs
-                if '\u4e00' <= char <= '\u9fff':
-                    cjk_count += 1
-                # Japanese Hiragana/Katakana
-                elif '\u3040' <= char <= '\u30ff':
-                    cjk_count += 1
-                # Korean Hangul
-                elif '\uac00' <= char <= '\ud7af':
-                    cjk_count += 1
-
-        if total_count == 0:
-            return False
-        return cjk_count / total_count > 0.3
+        return _is_cjk(text)
 
     def _calculate_reading_duration(self, text: str) -> float:
         """
@@ -247,10 +317,9 @@ class SRTFormatter:
         else:
             cps = self.DEFAULT_CPS_LATIN
 
-        # Count visible characters (excluding spaces for more accurate CJK calculation)
-        char_count = len(text.replace(' ', ''))
-
-        duration = char_count / cps
+        # Count visible characters (excluding spaces for more accurate CJK
+        # calculation) without building a space-free copy
+        duration = (len(text) - text.count(' ')) / cps
 
         # Clamp to min/max duration
         return max(self.MIN_DURATION, min(self.MAX_DURATION, duration))
@@ -287,36 +356,61 @@ class SRTFormatter:
 
         return start_time, end_time
 
-    def _format_word_level(self, segments: List[Segment]) -> str:
+    def _format_word_level(self, segments: Iterable[Segment], out: TextIO) -> float:
         """Format at word level (one word per subtitle)."""
-        srt_entries = []
         entry_num = 1
+        last_end = 0.0
 
         for segment in segments:
+            last_end = segment.end
             if not segment.words:
                 # Fallback to segment level if no word timestamps
                 logger.warning(
                     f"Segment has no word timestamps, using segment timing"
                 )
-                start_time = self._format_timestamp(segment.start)
-                end_time = self._format_timestamp(segment.end)
-                text = segment.text.strip()
-                entry = f"{entry_num}\n{start_time} --> {end_time}\n{text}\n"
-                srt_entries.append(entry)
+                self._write_entry(
+                    out,
+                    entry_num,
+                    self._format_timestamp_pair(segment.start, segment.end),
+                    segment.text.strip(),
+                )
                 entry_num += 1
                 continue
 
             # Create entry for each word
             for word in segment.words:
-                start_time = self._format_timestamp(word.start)
-                end_time = self._format_timestamp(word.end)
-                text = word.word.strip()
-
-                entry = f"{entry_num}\n{start_time} --> {end_time}\n{text}\n"
-                srt_entries.append(entry)
+                self._write_entry(
+                    out,
+                    entry_num,
+                    self._format_timestamp_pair(word.start, word.end),
+                    word.word.strip(),
+                )
                 entry_num += 1
 
-        return "\n".join(srt_entries)
+        return last_end
+
+    @staticmethod
+    def _write_entry(buf: TextIO, idx: int, timing: str, text: str) -> None:
+        """
+        Append one SRT entry to a text stream.
+
+        Entries are separated by a blank line; the last one ends with a
+        single newline.
+
+        Args:
+            buf: Output text stream
+            idx: Entry number
+            timing: Timing line from _format_timestamp_pair
+            text: Subtitle text
+        """
+        if idx > 1:
+            buf.write("\n")
+        buf.write(str(idx))
+        buf.write("\n")
+        buf.write(timing)
+        buf.write("\n")
+        buf.write(text)
+        buf.write("\n")
 
     def _format_timestamp(self, seconds: float) -> str:
         """
@@ -328,13 +422,36 @@ class SRTFormatter:
         Returns:
             Formatted timestamp string
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        milliseconds = int((seconds % 1) * 1000)
+        # Integer arithmetic on rounded milliseconds
+        secs, milliseconds = divmod(int(seconds * 1000 + 0.5), 1000)
+        minutes, secs = divmod(secs, 60)
+        hours, minutes = divmod(minutes, 60)
 
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
 
+    def _format_timestamp_pair(self, start: float, end: float) -> str:
+        """
+        Format an SRT timing line: HH:MM:SS,mmm --> HH:MM:SS,mmm
+
+        Args:
+            start: Start time in seconds
+            end: End time in seconds
+
+        Returns:
+            Formatted timing line
+        """
+        start_s, start_ms = divmod(int(start * 1000 + 0.5), 1000)
+        start_m, start_s = divmod(start_s, 60)
+        start_h, start_m = divmod(start_m, 60)
+        end_s, end_ms = divmod(int(end * 1000 + 0.5), 1000)
+        end_m, end_s = divmod(end_s, 60)
+        end_h, end_m = divmod(end_m, 60)
+
+        return (
+            f"{start_h:02d}:{start_m:02d}:{start_s:02d},{start_ms:03d} --> "
+            f"{end_h:02d}:{end_m:02d}:{end_s:02d},{end_ms:03d}"
+        )
+
     def _wrap_text(self, text: str) -> str:
         """
         Wrap text to respect max line width and line count.
@@ -345,41 +462,7 @@ class SRTFormatter:
         Returns:
             Wrapped text with newlines
         """
-        words = text.split()
-        lines = []
-        current_line = []
-        current_length = 0
-
-        for word in words:
-            word_length = len(word)
-
-            # Check if adding this word exceeds line width
-            if current_length + word_length + len(current_line) > self.max_line_width:
-                if current_line:
-                    lines.append(" ".join(current_line))
-                    current_line = [word]
-                    current_length = word_length
-                else:
-                    # Single word exceeds max width, add it anyway
-                    lines.append(word)
-                    current_length = 0
-            else:
-                current_line.append(word)
-                current_length += word_length
-
-        # Add remaining words
-        if current_line:
-            lines.append(" ".join(current_line))
-
-        # Limit to max line count
-        if len(lines) > self.max_line_count:
-            # Merge excess lines
-            while len(lines) > self.max_line_count:
-                # Merge last two lines
-                last_line = lines.pop()
-                lines[-1] = lines[-1] + " " + last_line
-
-        return "\n".join(lines)
+        return _wrap(text, self.max_line_width, self.max_line_count)
 
     def validate(self, srt_content: str) -> tuple[bool, List[str]]:
         """
@@ -391,8 +474,16 @@ class SRTFormatter:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
+        stripped = srt_content.strip()
+
+        # Fast path: one C-level scan accepts well-formed files (everything
+        # this formatter writes); anything else gets the line-by-line pass
+        # below, which is more lenient and reports each problem
+        if _SRT_RE.fullmatch(stripped):
+            return True, []
+
         errors = []
-        lines = srt_content.strip().split("\n")
+        lines = stripped.split("\n")
 
         if not lines:
             return False, ["Empty SRT file"]
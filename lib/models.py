@@ -5,25 +5,44 @@ Manages ASR model lifecycle including loading, caching, and automatic cleanup
 when VRAM usage exceeds thresholds.
 """
 
+import gc
 import logging
-from typing import Dict, Optional, Tuple
-from datetime import datetime
+import threading
 from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Set, Tuple
+from datetime import datetime
 
 from lib.engines.base import ASREngine
 from lib.engines.factory import EngineFactory
-from lib.utils.gpu import get_vram_info, clear_gpu_cache, is_gpu_available
+from lib.utils.gpu import (
+    get_vram_info,
+    get_allocated_vram_mb,
+    get_device_count,
+    clear_gpu_cache,
+    is_gpu_available,
+    expandable_segments_enabled,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of the ModelManager cache"""
+
+    size: int  # Number of cached models
+    cache_keys: Tuple[Tuple[str, str, int], ...]  # (engine, model_size, device_index), LRU first
+    total_vram_mb: float  # VRAM measured for the cached models' loads
+
+
 class ModelManager:
     """
     Manages ASR model loading, caching, and lifecycle.
 
     Features:
-    - LRU cache for loaded models
-    - VRAM monitoring and automatic cleanup
+    - LRU cache for loaded models (pinned models are never evicted)
+    - VRAM monitoring and automatic cleanup, per device
     - Lazy loading (models loaded on first use)
     - Resource tracking
     """
@@ -33,14 +52,42 @@ class ModelManager:
         Initialize the model manager.
 
         Args:
-            vram_limit_percent: Maximum VRAM usage percent before cleanup (default: 80%)
-            max_cached_models: Maximum number of models to keep cached (default: 3)
+            vram_limit_percent: Maximum VRAM usage percent of a device before
+                cleanup (default: 80%)
+            max_cached_models: Maximum number of models to keep cached per
+                device (default: 3)
         """
         self.vram_limit_percent = vram_limit_percent
         self.max_cached_models = max_cached_models
 
-        # LRU cache: (engine_name, model_size) -> (engine_instance, load_time, vram_mb)
-        self._cache: OrderedDict[Tuple[str, str], Tuple[ASREngine, datetime, Optional[float]]] = OrderedDict()
+        # Devices and their total VRAM don't change during the process
+        # lifetime; query them once so the load path needs a single
+        # allocated-memory read
+        self._gpu = is_gpu_available()
+        self._total_vram_mb: Dict[int, float] = {
+            device_index: get_vram_info(device_index)["total_mb"]
+            for device_index in range(get_device_count())
+        }
+        self._vram_limit_mb: Dict[int, float] = {
+            device_index: total_mb * vram_limit_percent / 100
+            for device_index, total_mb in self._total_vram_mb.items()
+        }
+
+        # LRU cache: (engine_name, model_size, device_index) -> (engine_instance, load_time, vram_mb).
+        # move_to_end() on a hit keeps the first key the least recently used.
+        self._cache: "OrderedDict[Tuple[str, str, int], Tuple[ASREngine, datetime, Optional[float]]]" = OrderedDict()
+
+        # Cache keys exempt from LRU/VRAM eviction (pre-warmed models)
+        self._pinned: Set[Tuple[str, str, int]] = set()
+
+        # Running total of the cached models' vram_mb, kept in step with
+        # _cache so get_cache_stats() doesn't re-sum it
+        self._cached_vram_mb = 0.0
+
+        # _global_lock guards the cache dicts; a per-key lock serializes
+        # loads of the same model so concurrent misses load it only once
+        self._global_lock = threading.Lock()
+        self._key_locks: Dict[Tuple[str, str, int], threading.Lock] = {}
 
         logger.info(
             "ModelManager initialized",
@@ -53,7 +100,7 @@ class ModelManager:
         )
 
     def get_engine(
-        self, engine_name: str, model_size: str, config: dict
+        self, engine_name: str, model_size: str, config: dict, pin: bool = False
     ) -> ASREngine:
         """
         Get or load an ASR engine instance.
@@ -64,7 +111,9 @@ class ModelManager:
         Args:
             engine_name: Engine identifier ("faster-whisper", "openai-whisper")
             model_size: Model size to load
-            config: Engine configuration dict
+            config: Engine configuration dict (a "device_index" entry keeps
+                a separate instance per GPU)
+            pin: Keep the model resident; it is never evicted
 
         Returns:
             ASREngine: Loaded engine instance
@@ -73,20 +122,71 @@ class ModelManager:
             ValueError: If engine name is not supported
             Exception: If model loading fails
         """
-        cache_key = (engine_name, model_size)
-
-        # Check cache
-        if cache_key in self._cache:
+        # Reject unknown engines before any cache bookkeeping or VRAM queries
+        EngineFactory.validate_engine(engine_name)
+
+        cache_key = (engine_name, model_size, config.get("device_index", 0))
+        with self._global_lock:
+            if pin:
+                self._pinned.add(cache_key)
+            engine = self._lookup(cache_key)
+            if engine is None:
+                lock = self._key_locks.setdefault(cache_key, threading.Lock())
+
+        if engine is not None:
             logger.info(
                 f"Model cache hit: {engine_name}/{model_size}",
                 extra={"metadata": {"engine": engine_name, "model_size": model_size}},
             )
+            return engine
 
-            # Move to end (most recently used)
-            engine, load_time, vram_mb = self._cache.pop(cache_key)
-            self._cache[cache_key] = (engine, load_time, vram_mb)
+        with lock:
+            # Another request may have loaded the model while we waited
+            with self._global_lock:
+                engine = self._lookup(cache_key)
+            if engine is not None:
+                logger.info(
+                    f"Model loaded by concurrent request: {engine_name}/{model_size}",
+                    extra={"metadata": {"engine": engine_name, "model_size": model_size}},
+                )
+                return engine
 
-            return engine
+            return self._load_engine(cache_key, config)
+
+    def _lookup(self, cache_key: Tuple[str, str, int]) -> Optional[ASREngine]:
+        """
+        Return a cached engine and mark it most recently used.
+
+        Must be called with ``_global_lock`` held.
+
+        Args:
+            cache_key: (engine_name, model_size, device_index)
+
+        Returns:
+            Cached engine, or None on a miss
+        """
+        entry = self._cache.get(cache_key)
+        if entry is None:
+            return None
+
+        # Single relink in C; no pop + re-insert
+        self._cache.move_to_end(cache_key)
+        return entry[0]
+
+    def _load_engine(self, cache_key: Tuple[str, str, int], config: dict) -> ASREngine:
+        """
+        Create, load and cache an engine.
+
+        Must be called with the per-key load lock for ``cache_key`` held.
+
+        Args:
+            cache_key: (engine_name, model_size, device_index)
+            config: Engine configuration dict
+
+        Returns:
+            ASREngine: Loaded engine instance
+        """
+        engine_name, model_size, device_index = cache_key
 
         # Cache miss - need to load model
         logger.info(
@@ -94,16 +194,15 @@ class ModelManager:
             extra={"metadata": {"engine": engine_name, "model_size": model_size}},
         )
 
-        # Check VRAM before loading
-        self._check_and_cleanup_vram()
+        # Check VRAM of the target device before loading
+        with self._global_lock:
+            self._check_and_cleanup_vram(device_index)
 
         # Create engine instance
         engine = self._create_engine(engine_name)
 
         # Record VRAM before loading
-        vram_before = None
-        if is_gpu_available():
-            vram_before = get_vram_info()["allocated_mb"]
+        vram_before = get_allocated_vram_mb(device_index) if self._gpu else None
 
         # Load model
         load_start = datetime.now()
@@ -112,16 +211,17 @@ class ModelManager:
 
         # Record VRAM after loading
         vram_used = None
-        if is_gpu_available() and vram_before is not None:
-            vram_after = get_vram_info()["allocated_mb"]
-            vram_used = vram_after - vram_before
-
-        # Add to cache
-        self._cache[cache_key] = (engine, load_time, vram_used)
-
-        # Enforce max cache size
-        if len(self._cache) > self.max_cached_models:
-            self._evict_lru()
+        if vram_before is not None:
+            vram_used = round(get_allocated_vram_mb(device_index) - vram_before, 2)
+
+        # Add to cache and enforce the device's max cache size
+        with self._global_lock:
+            self._cache[cache_key] = (engine, load_time, vram_used)
+            if vram_used is not None:
+                self._cached_vram_mb += vram_used
+            cached_on_device = sum(1 for key in self._cache if key[2] == device_index)
+            if cached_on_device > self.max_cached_models:
+                self._evict_lru(device_index)
 
         logger.info(
             f"Model loaded and cached: {engine_name}/{model_size}",
@@ -152,53 +252,82 @@ class ModelManager:
         """
         return EngineFactory.create_engine(engine_name)
 
-    def _check_and_cleanup_vram(self):
+    def _check_and_cleanup_vram(self, device_index: int):
         """
-        Check VRAM usage and cleanup if necessary.
+        Check VRAM usage of one device and cleanup if necessary.
+
+        If the device's VRAM usage exceeds the limit, evict models cached
+        on that device until usage drops below threshold.
 
-        If VRAM usage exceeds the limit, evict cached models until
-        usage drops below threshold.
+        Args:
+            device_index: GPU to check
         """
-        if not is_gpu_available():
+        total_vram_mb = self._total_vram_mb.get(device_index, 0.0)
+        if not self._gpu or total_vram_mb <= 0:
             return
 
-        vram_info = get_vram_info()
-        current_usage = vram_info["usage_percent"]
-
-        if current_usage >= self.vram_limit_percent:
+        vram_limit_mb = self._vram_limit_mb[device_index]
+        allocated = get_allocated_vram_mb(device_index)
+        if allocated >= vram_limit_mb:
+            current_usage = allocated / total_vram_mb * 100
             logger.warning(
-                f"VRAM usage {current_usage:.1f}% exceeds limit {self.vram_limit_percent}%",
+                f"VRAM usage {current_usage:.1f}% on device {device_index} "
+                f"exceeds limit {self.vram_limit_percent}%",
                 extra={
                     "metadata": {
+                        "device_index": device_index,
                         "vram_usage_percent": current_usage,
                         "vram_limit_percent": self.vram_limit_percent,
                     }
                 },
             )
 
-            # Evict models until usage drops
-            while current_usage >= self.vram_limit_percent and len(self._cache) > 0:
-                self._evict_lru()
-                clear_gpu_cache()
-
-                vram_info = get_vram_info()
-                current_usage = vram_info["usage_percent"]
+            # Evict models until usage drops. Usage counts allocated (not
+            # reserved) memory, so it drops as soon as an evicted model is
+            # freed; no empty_cache() sweep is needed per iteration.
+            evicted = False
+            while allocated >= vram_limit_mb and self._evict_lru(device_index):
+                evicted = True
+                allocated = get_allocated_vram_mb(device_index)
+                current_usage = allocated / total_vram_mb * 100
 
                 logger.info(
                     f"VRAM usage after cleanup: {current_usage:.1f}%",
                     extra={"metadata": {"vram_usage_percent": current_usage}},
                 )
 
-    def _evict_lru(self):
+            # Without expandable segments, release the freed blocks once so
+            # the next load can't trip over fragmentation
+            if evicted and not expandable_segments_enabled():
+                clear_gpu_cache()
+
+    def _evict_lru(self, device_index: int) -> bool:
         """
-        Evict the least recently used model from cache.
+        Evict the least recently used unpinned model of one device from cache.
+
+        Args:
+            device_index: Device whose models are eviction candidates
+
+        Returns:
+            bool: True if a model was evicted
         """
-        if len(self._cache) == 0:
-            return
+        # Oldest (LRU) entry on the device that isn't pinned
+        cache_key = next(
+            (key for key in self._cache if key[2] == device_index and key not in self._pinned),
+            None,
+        )
+        if cache_key is None:
+            return False
 
-        # Remove oldest (LRU) entry
-        cache_key, (engine, load_time, vram_mb) = self._cache.popitem(last=False)
-        engine_name, model_size = cache_key
+        engine, load_time, vram_mb = self._cache.pop(cache_key)
+        if vram_mb is not None:
+            self._cached_vram_mb -= vram_mb
+        engine_name, model_size, _ = cache_key
+
+        # Drop the last reference here and collect reference cycles, so the
+        # model's memory is released before the caller re-measures VRAM
+        del engine
+        gc.collect()
 
         logger.info(
             f"Evicted model from cache: {engine_name}/{model_size}",
@@ -211,28 +340,21 @@ class ModelManager:
             },
         )
 
-        # Note: Python's garbage collector will handle cleanup
-        # The model object will be freed when no longer referenced
+        return True
 
-    def get_cache_stats(self) -> dict:
+    def get_cache_stats(self) -> CacheStats:
         """
         Get cache statistics.
 
         Returns:
-            Dict with cache information:
-            - cached_models: Number of models in cache
-            - cache_keys: List of cached (engine, model_size) tuples
-            - total_vram_mb: Total VRAM used by cached models
+            CacheStats: Cache size, keys and total VRAM of cached models
         """
-        total_vram = sum(
-            vram_mb for _, _, vram_mb in self._cache.values() if vram_mb is not None
-        )
-
-        return {
-            "cached_models": len(self._cache),
-            "cache_keys": list(self._cache.keys()),
-            "total_vram_mb": round(total_vram, 2) if total_vram else 0.0,
-        }
+        with self._global_lock:
+            return CacheStats(
+                size=len(self._cache),
+                cache_keys=tuple(self._cache),
+                total_vram_mb=round(self._cached_vram_mb, 2),
+            )
 
     def clear_cache(self):
         """
@@ -240,10 +362,13 @@ class ModelManager:
 
         Useful for freeing memory or forcing model reload.
         """
-        cache_size = len(self._cache)
-        self._cache.clear()
+        with self._global_lock:
+            cache_size = len(self._cache)
+            self._cache.clear()
+            self._cached_vram_mb = 0.0
+            self._pinned.clear()
 
-        if is_gpu_available():
+        if self._gpu:
             clear_gpu_cache()
 
         logger.info(
@@ -259,10 +384,11 @@ class ModelManager:
             List of dicts with model information
         """
         models = []
-        for (engine_name, model_size), (engine, load_time, vram_mb) in self._cache.items():
+        for (engine_name, model_size, device_index), (engine, load_time, vram_mb) in self._cache.items():
             models.append({
                 "engine": engine_name,
                 "model_size": model_size,
+                "device_index": device_index,
                 "load_time": load_time.isoformat(),
                 "vram_mb": vram_mb,
             })
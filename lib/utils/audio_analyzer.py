@@ -5,7 +5,10 @@ Analyzes audio files for quality metrics including SNR, music detection,
 silence detection, and preprocessing recommendations.
 """
 
+import hashlib
 import logging
+import math
+import threading
 import numpy as np
 from pathlib import Path
 from typing import Dict, Optional, Tuple
@@ -23,7 +26,90 @@ except ImportError:
     logger.warning("Librosa not available. Install with: pip install librosa soundfile")
 
 
-@dataclass
+def _framed_rms(y: np.ndarray, frame_length: int = 2048, hop_length: int = 512) -> np.ndarray:
+    """
+    RMS energy per frame, matching librosa.feature.rms(center=True).
+
+    No (frames x frame_length) array is materialized. When frame_length
+    is a multiple of hop_length (the analyzer's 2048/512), each frame is a
+    run of whole hop-sized blocks: block energies come from one reshaped
+    dot product and frame energies from a cumulative sum over blocks, so
+    the only full-length temporary is the padded signal. Other sizes fall
+    back to a per-sample cumulative sum.
+
+    Args:
+        y: Mono audio samples
+        frame_length: Frame size in samples
+        hop_length: Hop between frames in samples
+
+    Returns:
+        np.ndarray: RMS per frame (float32)
+    """
+    padded = np.pad(y, frame_length // 2)
+    n_frames = 1 + (len(padded) - frame_length) // hop_length
+
+    if frame_length % hop_length == 0:
+        blocks_per_frame = frame_length // hop_length
+        n_blocks = n_frames + blocks_per_frame - 1
+        blocks = padded[:n_blocks * hop_length].reshape(n_blocks, hop_length)
+        block_energy = np.einsum("ij,ij->i", blocks, blocks, dtype=np.float64)
+
+        cumulative = np.concatenate(([0.0], np.cumsum(block_energy)))
+        frame_energy = cumulative[blocks_per_frame:] - cumulative[:-blocks_per_frame]
+    else:
+        cumulative = np.concatenate(([0.0], np.cumsum(np.square(padded, dtype=np.float64))))
+        starts = np.arange(n_frames) * hop_length
+        frame_energy = cumulative[starts + frame_length] - cumulative[starts]
+
+    # Cumulative-sum differences can go a hair below zero on silence
+    return np.sqrt(np.maximum(frame_energy, 0.0) / frame_length).astype(np.float32)
+
+
+def _quantiles(values: np.ndarray, qs: Tuple[float, ...]) -> np.ndarray:
+    """
+    Linearly interpolated quantiles (as np.percentile) from one partition.
+
+    Only the order statistics around each quantile are selected; one
+    np.partition call places all of them.
+
+    Args:
+        values: 1-D array
+        qs: Quantiles in [0, 1]
+
+    Returns:
+        np.ndarray: One value per quantile
+    """
+    positions = np.asarray(qs) * (values.size - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(lower + 1, values.size - 1)
+
+    part = np.partition(values, np.union1d(lower, upper))
+    return part[lower] + (part[upper] - part[lower]) * (positions - lower)
+
+
+def _content_key(audio_path: str, chunk_size: int = 1 << 20) -> bytes:
+    """
+    Content fingerprint: streaming blake2b over the whole file.
+
+    Hashing every byte is far cheaper than the decode it saves, and unlike
+    sampling the file ends it can't confuse same-length recordings that
+    share a header and silent lead-in/out.
+
+    Args:
+        audio_path: Path to audio file
+        chunk_size: Bytes read per update
+
+    Returns:
+        bytes: 16-byte digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(audio_path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.digest()
+
+
+@dataclass(frozen=True)
 class AudioQualityMetrics:
     """Audio quality analysis results"""
 
@@ -48,6 +134,27 @@ class AudioQualityMetrics:
     quality_score: float  # Overall quality (0-100)
 
 
+def warmup() -> None:
+    """
+    Prime librosa's lazily loaded submodules and caches.
+
+    librosa imports its feature and FFT machinery on first use, so the first
+    analysis pays that cost on top of the request. Running the analysis
+    primitives once on a short silent buffer moves it to startup. A no-op
+    when librosa is not installed.
+    """
+    if not LIBROSA_AVAILABLE:
+        return
+
+    y = np.zeros(AudioAnalyzer.FRAME_LENGTH, dtype=np.float32)
+    S = np.abs(librosa.stft(y, n_fft=AudioAnalyzer.FRAME_LENGTH, hop_length=AudioAnalyzer.HOP_LENGTH))
+    freq = librosa.fft_frequencies(sr=AudioAnalyzer.ANALYSIS_SR, n_fft=AudioAnalyzer.FRAME_LENGTH)
+    centroid = librosa.feature.spectral_centroid(S=S, freq=freq)
+    librosa.feature.spectral_bandwidth(S=S, freq=freq, centroid=centroid)
+    librosa.resample(y, orig_sr=2 * AudioAnalyzer.ANALYSIS_SR, target_sr=AudioAnalyzer.ANALYSIS_SR)
+    logger.info("Audio analyzer warmed up")
+
+
 class AudioAnalyzer:
     """
     Analyzes audio files for quality metrics and preprocessing recommendations.
@@ -60,11 +167,24 @@ class AudioAnalyzer:
     - Automatic preprocessing recommendations
     """
 
+    # Analysis sample rate; the speech/music heuristics only need <= 8 kHz content
+    ANALYSIS_SR = 16000
+
+    # Analysis frame size and hop in samples
+    FRAME_LENGTH = 2048
+    HOP_LENGTH = 512
+
+    # Clips shorter than this, or whose loudest frame is below SILENT_RMS,
+    # skip SNR and music detection
+    MIN_SPECTRAL_DURATION_S = 0.5
+    SILENT_RMS = 1e-5
+
     def __init__(
         self,
         silence_threshold_db: float = -40.0,
         music_threshold: float = 0.6,
         snr_threshold_db: float = 20.0,
+        cache_size: int = 256,
     ):
         """
         Initialize AudioAnalyzer.
@@ -73,6 +193,7 @@ class AudioAnalyzer:
             silence_threshold_db: Threshold for silence detection (dB)
             music_threshold: Confidence threshold for music detection (0-1)
             snr_threshold_db: Minimum acceptable SNR (dB)
+            cache_size: Results kept for repeated files (0 disables caching)
         """
         if not LIBROSA_AVAILABLE:
             raise ImportError(
@@ -84,6 +205,44 @@ class AudioAnalyzer:
         self.music_threshold = music_threshold
         self.snr_threshold_db = snr_threshold_db
 
+        # LRU of results by content fingerprint; a plain dict keeps
+        # insertion order, so the first key is the least recently used
+        self.cache_size = cache_size
+        self._cache: Dict[bytes, AudioQualityMetrics] = {}
+        self._cache_lock = threading.Lock()
+
+    @staticmethod
+    def quick_info(audio_path: str) -> Dict[str, float]:
+        """
+        Read duration, sample rate and channel count from the file header.
+
+        No PCM is decoded, so this is cheap for validation checks that don't
+        need the full analysis. Only formats libsndfile can parse (WAV, FLAC,
+        OGG, ...) are supported.
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            Dict with duration_s, sample_rate and channels
+
+        Raises:
+            ImportError: If soundfile is not installed
+            RuntimeError: If libsndfile can't read the header
+        """
+        if not LIBROSA_AVAILABLE:
+            raise ImportError(
+                "Soundfile is required for audio header queries. "
+                "Install with: pip install librosa soundfile"
+            )
+
+        info = sf.info(audio_path)
+        return {
+            "duration_s": info.frames / info.samplerate,
+            "sample_rate": info.samplerate,
+            "channels": info.channels,
+        }
+
     def analyze(self, audio_path: str) -> AudioQualityMetrics:
         """
         Perform comprehensive audio quality analysis.
@@ -97,29 +256,72 @@ class AudioAnalyzer:
         if not Path(audio_path).exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-        logger.info(f"Analyzing audio: {audio_path}")
+        # Repeated uploads (retries, A/B runs) reuse the earlier result
+        cache_key = _content_key(audio_path) if self.cache_size > 0 else None
+        if cache_key is not None:
+            with self._cache_lock:
+                metrics = self._cache.pop(cache_key, None)
+                if metrics is not None:
+                    self._cache[cache_key] = metrics
+                    logger.debug(f"Audio analysis cache hit: {audio_path}")
+                    return metrics
 
-        # Load audio
-        audio, sr = librosa.load(audio_path, sr=None, mono=False)
+        metrics = self._analyze(audio_path)
 
-        # Convert to mono for analysis
-        if audio.ndim > 1:
-            audio_mono = librosa.to_mono(audio)
-            channels = audio.shape[0]
-        else:
-            audio_mono = audio
-            channels = 1
+        if cache_key is not None:
+            with self._cache_lock:
+                self._cache[cache_key] = metrics
+                while len(self._cache) > self.cache_size:
+                    del self._cache[next(iter(self._cache))]
+
+        return metrics
+
+    def _analyze(self, audio_path: str) -> AudioQualityMetrics:
+        """
+        Run the analysis passes on an audio file (uncached).
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            AudioQualityMetrics with analysis results
+        """
+        logger.info(f"Analyzing audio: {audio_path}")
+
+        # Native rate and channel count come from the file header
+        try:
+            info = self.quick_info(audio_path)
+            native_sr, channels = info["sample_rate"], info["channels"]
+        except Exception:
+            # Formats libsndfile can't parse: fall back to a native decode
+            native, native_sr = librosa.load(audio_path, sr=None, mono=False)
+            channels = native.shape[0] if native.ndim > 1 else 1
+            del native  # free the multichannel buffer before the analysis decode
+
+        # Decode once as 16 kHz mono; every feature below runs at this rate
+        sr = self.ANALYSIS_SR
+        audio_mono, _ = librosa.load(audio_path, sr=sr, mono=True, dtype=np.float32)
 
         # Calculate duration
         duration_s = len(audio_mono) / sr
 
+        # Frame RMS energy, computed once and shared by the SNR, energy and
+        # silence metrics
+        rms = _framed_rms(audio_mono, self.FRAME_LENGTH, self.HOP_LENGTH)
+
         # Calculate quality metrics
-        snr_db = self._calculate_snr(audio_mono)
-        rms_energy = self._calculate_rms(audio_mono)
-        silence_ratio = self._calculate_silence_ratio(audio_mono, sr)
+        rms_energy = self._calculate_rms(rms)
+        silence_ratio = self._calculate_silence_ratio(rms)
+
+        if duration_s < self.MIN_SPECTRAL_DURATION_S or not rms.size or rms.max() < self.SILENT_RMS:
+            # Too short or silent for the SNR and spectral heuristics
+            snr_db = None
+            has_music, music_confidence, spectral_centroid = False, 0.0, 0.0
+        else:
+            snr_db = self._calculate_snr(rms)
 
-        # Music detection
-        has_music, music_confidence, spectral_centroid = self._detect_music(audio_mono, sr)
+            # Music detection
+            has_music, music_confidence, spectral_centroid = self._detect_music(audio_mono, sr)
 
         # Generate recommendations
         preprocessing_recommended = False
@@ -144,7 +346,7 @@ class AudioAnalyzer:
 
         return AudioQualityMetrics(
             duration_s=duration_s,
-            sample_rate=sr,
+            sample_rate=native_sr,
             channels=channels,
             snr_db=snr_db,
             rms_energy=rms_energy,
@@ -157,7 +359,7 @@ class AudioAnalyzer:
             quality_score=quality_score,
         )
 
-    def _calculate_snr(self, audio: np.ndarray) -> Optional[float]:
+    def _calculate_snr(self, rms: np.ndarray) -> Optional[float]:
         """
         Calculate Signal-to-Noise Ratio (SNR) in dB.
 
@@ -166,95 +368,66 @@ class AudioAnalyzer:
         - Noise: 10th percentile of energy
 
         Args:
-            audio: Audio samples
+            rms: Frame RMS energy
 
         Returns:
             SNR in dB, or None if cannot be calculated
         """
         try:
-            # Calculate frame energy
-            frame_length = 2048
-            hop_length = 512
-
-            # RMS energy per frame
-            rms = librosa.feature.rms(
-                y=audio,
-                frame_length=frame_length,
-                hop_length=hop_length
-            )[0]
-
             # Estimate signal and noise levels
-            signal_level = np.percentile(rms, 90)
-            noise_level = np.percentile(rms, 10)
+            noise_level, signal_level = _quantiles(rms, (0.1, 0.9))
 
             # Avoid division by zero
             if noise_level < 1e-10:
                 return None
 
             # Calculate SNR in dB
-            snr_linear = signal_level / noise_level
-            snr_db = 20 * np.log10(snr_linear)
-
-            return float(snr_db)
+            snr_linear = float(signal_level / noise_level)
+            return 20.0 * math.log10(snr_linear)
 
         except Exception as e:
             logger.warning(f"Failed to calculate SNR: {e}")
             return None
 
-    def _calculate_rms(self, audio: np.ndarray) -> float:
+    def _calculate_rms(self, rms: np.ndarray) -> float:
         """
         Calculate Root Mean Square (RMS) energy.
 
         Args:
-            audio: Audio samples
+            rms: Frame RMS energy
 
         Returns:
             RMS energy value
         """
-        rms = librosa.feature.rms(y=audio)[0]
         return float(np.mean(rms))
 
-    def _calculate_silence_ratio(self, audio: np.ndarray, sr: int) -> float:
+    def _calculate_silence_ratio(self, rms: np.ndarray) -> float:
         """
         Calculate ratio of silence in audio.
 
+        A frame is silent when its energy is more than silence_threshold_db
+        below the loudest frame (the same rule librosa.effects.split uses,
+        without its second framing pass).
+
         Args:
-            audio: Audio samples
-            sr: Sample rate
+            rms: Frame RMS energy
 
         Returns:
             Silence ratio (0-1)
         """
-        # Convert threshold from dB to amplitude
-        ref_amplitude = np.max(np.abs(audio))
-        if ref_amplitude < 1e-10:
-            return 1.0  # All silence
-
-        threshold_amplitude = ref_amplitude * (10 ** (self.silence_threshold_db / 20))
-
-        # Detect non-silent intervals
-        intervals = librosa.effects.split(
-            audio,
-            top_db=abs(self.silence_threshold_db),
-            frame_length=2048,
-            hop_length=512
-        )
-
-        # Calculate silence ratio
-        if len(intervals) == 0:
+        ref_rms = np.max(rms) if rms.size else 0.0
+        if ref_rms < 1e-10:
             return 1.0  # All silence
 
-        total_samples = len(audio)
-        non_silent_samples = sum(end - start for start, end in intervals)
-        silence_ratio = 1.0 - (non_silent_samples / total_samples)
-
-        return float(max(0.0, min(1.0, silence_ratio)))
+        # Compare amplitudes directly: rms_db < max_db + threshold_db
+        threshold_rms = ref_rms * (10 ** (self.silence_threshold_db / 20))
+        return float(np.mean(rms < threshold_rms))
 
     def _detect_music(self, audio: np.ndarray, sr: int) -> Tuple[bool, float, float]:
         """
         Detect presence of music using spectral features.
 
-        Uses spectral centroid and spectral rolloff to distinguish
+        Uses spectral centroid and spectral bandwidth to distinguish
         speech from music. Music typically has:
         - Higher spectral centroid variation
         - Broader frequency range
@@ -268,15 +441,27 @@ class AudioAnalyzer:
             Tuple of (has_music, confidence, spectral_centroid_mean)
         """
         try:
-            # Extract spectral features
-            spectral_centroid = librosa.feature.spectral_centroid(y=audio, sr=sr)[0]
-            spectral_rolloff = librosa.feature.spectral_rolloff(y=audio, sr=sr)[0]
-            spectral_bandwidth = librosa.feature.spectral_bandwidth(y=audio, sr=sr)[0]
+            # Extract spectral features from one magnitude spectrogram; the
+            # bandwidth reuses the centroid instead of recomputing it
+            # float32 input keeps the STFT complex64 and S float32. Edge
+            # frames don't matter for the statistics, so skip the centering
+            # pad (clips reaching here are longer than one frame)
+            S = np.abs(librosa.stft(
+                audio.astype(np.float32, copy=False),
+                n_fft=self.FRAME_LENGTH,
+                hop_length=self.HOP_LENGTH,
+                center=False,
+            ))
+            freq = librosa.fft_frequencies(sr=sr, n_fft=self.FRAME_LENGTH)
+            spectral_centroid = librosa.feature.spectral_centroid(S=S, freq=freq)
+            spectral_bandwidth = librosa.feature.spectral_bandwidth(
+                S=S, freq=freq, centroid=spectral_centroid
+            )[0]
+            spectral_centroid = spectral_centroid[0]
 
             # Calculate statistics
             centroid_mean = np.mean(spectral_centroid)
             centroid_std = np.std(spectral_centroid)
-            rolloff_mean = np.mean(spectral_rolloff)
             bandwidth_mean = np.mean(spectral_bandwidth)
 
             # Music detection heuristics
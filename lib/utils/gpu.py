@@ -5,8 +5,10 @@ Provides utilities for detecting GPU availability, monitoring VRAM usage,
 and managing compute resources.
 """
 
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
@@ -20,10 +22,72 @@ except ImportError:
     logger.warning("PyTorch not available - GPU features disabled")
 
 
+def _version_tuple(version: Optional[str]) -> Tuple[int, ...]:
+    """Parse the leading numeric parts of a version string ("2.1.0+cu121" -> (2, 1, 0))."""
+    parts = []
+    for part in (version or "").split("+")[0].split("."):
+        if not part.isdigit():
+            break
+        parts.append(int(part))
+    return tuple(parts)
+
+
+def _enable_expandable_segments():
+    """
+    Make the CUDA caching allocator grow segments in place (VMM-backed).
+
+    Repeated load/unload of Whisper weights then can't fragment VRAM into
+    "reserved but unallocated" blocks, so cache eviction no longer needs
+    empty_cache() to make room. The setting is read when the allocator
+    initializes (first CUDA allocation), so setting it at import is early
+    enough. An existing PYTORCH_CUDA_ALLOC_CONF is left untouched.
+    """
+    if (
+        _version_tuple(torch.__version__) >= (2, 1)
+        and torch.version.cuda is not None
+        and _version_tuple(torch.version.cuda) >= (11, 4)
+    ):
+        os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
+
+
+if TORCH_AVAILABLE:
+    _enable_expandable_segments()
+
+
+def enable_tf32():
+    """
+    Let FP32 matmuls run on TF32 tensor cores (Ampere and newer).
+
+    Worth a free 5-10% on FP32 matmuls. Pre-Ampere GPUs ignore the setting,
+    so the device isn't probed and CUDA stays uninitialized. This changes
+    global torch numerics, so the application opts in at startup; a
+    precision already lowered by the caller ("medium") is left untouched.
+    """
+    if TORCH_AVAILABLE and torch.get_float32_matmul_precision() == "highest":
+        torch.set_float32_matmul_precision("high")
+
+
+def expandable_segments_enabled() -> bool:
+    """
+    Check whether the CUDA caching allocator uses expandable segments.
+
+    Returns:
+        bool: True if PYTORCH_CUDA_ALLOC_CONF enables expandable_segments
+    """
+    return "expandable_segments:true" in os.environ.get("PYTORCH_CUDA_ALLOC_CONF", "").replace(" ", "").lower()
+
+
+_BYTES_TO_MB = 1.0 / 1048576
+
+
+@lru_cache(maxsize=None)
 def is_gpu_available() -> bool:
     """
     Check if GPU (CUDA) is available for computation.
 
+    The visible devices can't change within a process, so the result is
+    computed once.
+
     Returns:
         bool: True if CUDA GPU is available, False otherwise
     """
@@ -33,6 +97,25 @@ def is_gpu_available() -> bool:
     return torch.cuda.is_available()
 
 
+@lru_cache(maxsize=None)
+def _total_vram_mb(device_index: int) -> float:
+    """Total memory of a device in MB; device properties are fixed, so queried once."""
+    return torch.cuda.get_device_properties(device_index).total_memory * _BYTES_TO_MB
+
+
+def get_device_count() -> int:
+    """
+    Get the number of visible CUDA devices.
+
+    Returns:
+        int: Number of GPUs (0 if CUDA is unavailable)
+    """
+    if not is_gpu_available():
+        return 0
+
+    return torch.cuda.device_count()
+
+
 def get_gpu_info() -> Dict[str, Any]:
     """
     Get detailed GPU information.
@@ -79,7 +162,7 @@ def get_vram_info(device_index: int = 0) -> Dict[str, float]:
         - free_mb: Available VRAM
         - usage_percent: Percentage of VRAM in use
     """
-    if not TORCH_AVAILABLE or not torch.cuda.is_available():
+    if not is_gpu_available():
         return {
             "total_mb": 0,
             "allocated_mb": 0,
@@ -90,9 +173,9 @@ def get_vram_info(device_index: int = 0) -> Dict[str, float]:
 
     try:
         # Get memory stats in bytes, convert to MB
-        total = torch.cuda.get_device_properties(device_index).total_memory / (1024**2)
-        allocated = torch.cuda.memory_allocated(device_index) / (1024**2)
-        reserved = torch.cuda.memory_reserved(device_index) / (1024**2)
+        total = _total_vram_mb(device_index)
+        allocated = torch.cuda.memory_allocated(device_index) * _BYTES_TO_MB
+        reserved = torch.cuda.memory_reserved(device_index) * _BYTES_TO_MB
         free = total - allocated
 
         usage_percent = (allocated / total * 100) if total > 0 else 0.0
@@ -115,6 +198,25 @@ def get_vram_info(device_index: int = 0) -> Dict[str, float]:
         }
 
 
+def get_allocated_vram_mb(device_index: int = 0) -> float:
+    """
+    Get the VRAM currently allocated by tensors on a device.
+
+    A single driver query, for hot paths that don't need the full
+    get_vram_info() breakdown.
+
+    Args:
+        device_index: GPU device index (default: 0)
+
+    Returns:
+        float: Allocated VRAM in MB (0 if CUDA is unavailable)
+    """
+    if not is_gpu_available():
+        return 0.0
+
+    return torch.cuda.memory_allocated(device_index) * _BYTES_TO_MB
+
+
 def get_optimal_device() -> str:
     """
     Get the optimal device string for PyTorch operations.
@@ -125,21 +227,26 @@ def get_optimal_device() -> str:
     return "cuda" if is_gpu_available() else "cpu"
 
 
+# Default compute type per device for faster-whisper:
+# - cuda: int8 weights with float16 activations, roughly half the VRAM of
+#   float16 at about the same speed and negligible WER impact
+# - cpu: int8, markedly faster than float32
+COMPUTE_TYPE_DEFAULTS = {
+    "cuda": "int8_float16",
+    "cpu": "int8",
+}
+
+
 def get_optimal_compute_type() -> str:
     """
     Get optimal compute type based on hardware availability.
 
-    For faster-whisper:
-    - GPU available: "float16" (faster, uses less VRAM)
-    - CPU only: "int8" (fastest on CPU)
+    See COMPUTE_TYPE_DEFAULTS: "int8_float16" on GPU, "int8" on CPU.
 
     Returns:
-        str: Recommended compute type ("float16", "int8", etc.)
+        str: Recommended compute type ("int8_float16", "int8", etc.)
     """
-    if is_gpu_available():
-        return "float16"
-    else:
-        return "int8"
+    return COMPUTE_TYPE_DEFAULTS[get_optimal_device()]
 
 
 def check_vram_availability(required_mb: float, device_index: int = 0) -> bool:
@@ -165,7 +272,10 @@ def clear_gpu_cache():
     Clear PyTorch CUDA cache to free up VRAM.
 
     Should be called after unloading models or when VRAM is running low.
+    With expandable segments enabled (the default on PyTorch >= 2.1) freed
+    blocks are reused in place, so this mostly returns memory to other
+    processes rather than curing fragmentation.
     """
-    if TORCH_AVAILABLE and torch.cuda.is_available():
+    if is_gpu_available():
         torch.cuda.empty_cache()
         logger.info("GPU cache cleared")
@@ -0,0 +1,117 @@
+"""
+Voice Activity Detection Pre-pass
+
+Runs Silero VAD over an audio file and packs the detected speech into one
+compact waveform, so engines without a built-in VAD filter only decode
+speech. A SpeechTimeline maps timestamps on the compact waveform back to
+the original audio.
+"""
+
+import logging
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SAMPLING_RATE = 16000
+
+# Silero VAD model and PyAV decoding bundled with faster-whisper
+try:
+    from faster_whisper.audio import decode_audio
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    SILERO_VAD_AVAILABLE = True
+except ImportError:
+    SILERO_VAD_AVAILABLE = False
+
+
+class SpeechTimeline:
+    """
+    Maps times on concatenated speech audio back to the original audio.
+    """
+
+    def __init__(self, spans: List[Tuple[float, float]]):
+        """
+        Initialize the timeline.
+
+        Args:
+            spans: (compact_start_s, original_start_s) per speech chunk,
+                ordered by compact_start_s
+        """
+        self._compact_starts = [compact for compact, _ in spans]
+        self._original_starts = [original for _, original in spans]
+
+    def to_original(self, t: float, is_end: bool = False) -> float:
+        """
+        Convert a compact-audio time to original-audio time.
+
+        Args:
+            t: Time in seconds on the compact audio
+            is_end: Treat ``t`` as an end time, so a time exactly on a chunk
+                boundary stays in the earlier chunk instead of jumping past
+                the removed silence
+
+        Returns:
+            float: Time in seconds on the original audio
+        """
+        if not self._compact_starts:
+            return t
+
+        find = bisect_left if is_end else bisect_right
+        index = max(find(self._compact_starts, t) - 1, 0)
+        return self._original_starts[index] + (t - self._compact_starts[index])
+
+
+def concat_speech(
+    audio: np.ndarray,
+    speech_chunks: List[Dict[str, int]],
+    sampling_rate: int = SAMPLING_RATE,
+) -> Tuple[np.ndarray, SpeechTimeline]:
+    """
+    Concatenate speech chunks into one waveform.
+
+    Args:
+        audio: Original mono waveform
+        speech_chunks: Speech regions as {"start": sample, "end": sample}
+        sampling_rate: Sampling rate of ``audio``
+
+    Returns:
+        Tuple of (compact waveform, timeline back to ``audio``)
+    """
+    if not speech_chunks:
+        return audio[:0], SpeechTimeline([])
+
+    spans = []
+    offset = 0
+    for chunk in speech_chunks:
+        spans.append((offset / sampling_rate, chunk["start"] / sampling_rate))
+        offset += chunk["end"] - chunk["start"]
+
+    compact = np.concatenate([audio[chunk["start"]:chunk["end"]] for chunk in speech_chunks])
+    return compact, SpeechTimeline(spans)
+
+
+def extract_speech(
+    audio_path: str, vad_parameters: Optional[dict] = None
+) -> Tuple[np.ndarray, SpeechTimeline]:
+    """
+    Decode an audio file and keep only the speech detected by Silero VAD.
+
+    Args:
+        audio_path: Path to audio file
+        vad_parameters: Optional VadOptions overrides (threshold, min_silence_duration_ms, ...)
+
+    Returns:
+        Tuple of (16 kHz mono speech waveform, timeline back to the file)
+    """
+    audio = decode_audio(audio_path, sampling_rate=SAMPLING_RATE)
+    speech_chunks = get_speech_timestamps(audio, VadOptions(**(vad_parameters or {})))
+    compact, timeline = concat_speech(audio, speech_chunks)
+
+    logger.info(
+        f"VAD kept {len(compact) / SAMPLING_RATE:.1f}s of speech "
+        f"from {len(audio) / SAMPLING_RATE:.1f}s ({len(speech_chunks)} chunks)"
+    )
+    return compact, timeline
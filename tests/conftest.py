@@ -0,0 +1,100 @@
+"""
+Shared pytest fixtures
+
+Session-scoped engine and model-manager fixtures, so model weights are
+loaded from disk once per test run instead of once per test, and
+synthetic audio for tests that only need realistic length and structure.
+"""
+
+import wave
+import weakref
+
+import numpy as np
+import pytest
+
+from lib.engines.faster_whisper import FasterWhisperEngine, FASTER_WHISPER_AVAILABLE
+from lib.models import ModelManager
+
+
+@pytest.fixture(scope="session")
+def tiny_engine():
+    """FasterWhisperEngine with the tiny model loaded on CPU (int8)"""
+    if not FASTER_WHISPER_AVAILABLE:
+        pytest.skip("faster-whisper not available")
+
+    engine = FasterWhisperEngine()
+    engine.load_model("tiny", {"device": "cpu", "compute_type": "int8"})
+    return engine
+
+
+@pytest.fixture
+def fresh_model_cache(monkeypatch):
+    """
+    Empty faster-whisper model cache for one test.
+
+    Loads then read weights from disk instead of reusing the model a
+    session fixture (e.g. tiny_engine) keeps resident under the same key.
+    """
+    monkeypatch.setattr(
+        "lib.engines.faster_whisper._MODEL_CACHE", weakref.WeakValueDictionary()
+    )
+
+
+@pytest.fixture(scope="session")
+def shared_manager():
+    """ModelManager shared across tests; models it loads stay cached for the session"""
+    return ModelManager()
+
+
+SYNTH_SAMPLE_RATE = 16000
+
+
+def write_synthetic_speech(path, duration_s: float, seed: int = 0) -> str:
+    """
+    Write deterministic speech-like audio as a 16 kHz mono 16-bit WAV.
+
+    Alternates 6 s of voiced-like sound (a 150 Hz harmonic stack with
+    syllable-rate amplitude modulation, plus noise) with 4 s of near
+    silence, so the VAD has pauses to skip. Written one second at a time
+    to keep memory flat for long clips. The content isn't words; use it
+    for timing and robustness, not transcript checks.
+
+    Args:
+        path: Output file path
+        duration_s: Clip length in seconds
+        seed: Noise seed
+
+    Returns:
+        str: The path written
+    """
+    rng = np.random.default_rng(seed)
+    rate = SYNTH_SAMPLE_RATE
+    t = np.arange(rate) / rate
+    harmonics = sum(np.sin(2 * np.pi * 150 * k * t) / k for k in range(1, 6))
+    syllables = 0.5 * (1 + np.sin(2 * np.pi * 4 * t))
+
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        for second in range(int(duration_s)):
+            noise = rng.standard_normal(rate)
+            if second % 10 < 6:
+                x = 0.3 * syllables * harmonics + 0.02 * noise
+            else:
+                x = 0.002 * noise
+            wav.writeframes((np.clip(x, -1, 1) * 32767).astype("<i2").tobytes())
+
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def synth_speech(tmp_path_factory):
+    """5 s of synthetic speech-like audio (see write_synthetic_speech)"""
+    return write_synthetic_speech(tmp_path_factory.mktemp("audio") / "speech_5s.wav", 5)
+
+
+@pytest.fixture(scope="session")
+def synth_13min(tmp_path_factory):
+    """13 minutes of synthetic speech-like audio (see write_synthetic_speech)"""
+    return write_synthetic_speech(tmp_path_factory.mktemp("audio") / "speech_13min.wav", 13 * 60)
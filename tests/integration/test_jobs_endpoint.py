@@ -0,0 +1,486 @@
+"""
+Integration tests for /jobs endpoints
+
+Tests job submission, status polling and result delivery.
+"""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from api.main import app
+from api.routers import subtitle
+from api.utils.jobs import get_job_manager, JobStatus
+from lib.engines.base import ASREngine, Segment, TranscriptionResult, Word
+from lib.utils.gpu import get_optimal_compute_type
+
+client = TestClient(app)
+
+
+class TestJobStatusEndpoint:
+    """Test suite for /jobs/{job_id} endpoint"""
+
+    def test_unknown_job_returns_404(self):
+        """Test that an unknown job id is rejected"""
+        response = client.get("/jobs/does-not-exist")
+        assert response.status_code == 404
+
+    def test_pending_job_status(self):
+        """Test status payload for a job that has not finished"""
+        job = get_job_manager().create_job(format="srt", filename="a.wav")
+
+        response = client.get(f"/jobs/{job.id}")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "job_id": job.id,
+            "status": "pending",
+            "progress": 0,
+        }
+
+    def test_long_poll_returns_on_update(self):
+        """Test that ?wait= returns as soon as the job changes"""
+        manager = get_job_manager()
+        job = manager.create_job(format="srt", filename="a.wav")
+        timer = threading.Timer(
+            0.1, manager.update_job, args=(job.id,),
+            kwargs={"status": JobStatus.PROCESSING, "progress": 30},
+        )
+        timer.start()
+
+        start = time.monotonic()
+        response = client.get(f"/jobs/{job.id}", params={"wait": 10})
+        timer.join()
+
+        assert time.monotonic() - start < 5
+        assert response.json()["status"] == "processing"
+        assert response.json()["progress"] == 30
+
+    def test_long_poll_wait_bounded(self):
+        """Test that excessive wait values are rejected"""
+        job = get_job_manager().create_job(format="srt", filename="a.wav")
+        response = client.get(f"/jobs/{job.id}", params={"wait": 3600})
+        assert response.status_code == 422
+
+    @pytest.mark.parametrize("num_segments", [0, 1, subtitle.STREAM_CHUNK_ITEMS * 2 + 3])
+    def test_completed_json_result(self, num_segments):
+        """Test that pre-encoded JSON results decode to the stored result"""
+        segments = [
+            {
+                "start": float(i),
+                "end": i + 0.5,
+                "text": f"segment {i}",
+                "words": [{"word": "w", "start": float(i), "end": i + 0.5}],
+            }
+            for i in range(num_segments)
+        ]
+        data = {
+            "text": "hello",
+            "language": "en",
+            "segments": segments,
+            "metadata": {"engine": "faster-whisper"},
+        }
+        job_manager = get_job_manager()
+        job = job_manager.create_job(format="json", filename="a.wav")
+        job_manager.update_job(
+            job.id,
+            status=JobStatus.COMPLETED,
+            progress=100,
+            result={"type": "json", "data": data},
+        )
+
+        response = client.get(f"/jobs/{job.id}")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {
+            "job_id": job.id,
+            "status": "completed",
+            "progress": 100,
+            "result": {"type": "json", "data": data},
+        }
+
+    def test_flat_words_derived_on_request(self):
+        """Test that ?flat_words=true adds a flat words list from segments"""
+        words = [{"word": "hi", "start": 0.0, "end": 0.4}, {"word": "there", "start": 0.5, "end": 0.9}]
+        data = {
+            "text": "hi there",
+            "language": "en",
+            "segments": [
+                {"start": 0.0, "end": 0.4, "text": "hi", "words": words[:1]},
+                {"start": 0.4, "end": 0.45, "text": "", "words": None},
+                {"start": 0.5, "end": 0.9, "text": "there", "words": words[1:]},
+            ],
+            "metadata": {},
+        }
+        job_manager = get_job_manager()
+        job = job_manager.create_job(format="json", filename="a.wav")
+        job_manager.update_job(
+            job.id,
+            status=JobStatus.COMPLETED,
+            progress=100,
+            result={"type": "json", "data": data},
+        )
+
+        result = client.get(f"/jobs/{job.id}").json()["result"]["data"]
+        assert "words" not in result
+
+        result = client.get(f"/jobs/{job.id}?flat_words=true").json()["result"]["data"]
+        assert result["words"] == words
+        assert "words" not in data
+
+    def test_large_result_gzipped(self):
+        """Test that large results are compressed when the client accepts gzip"""
+        job_manager = get_job_manager()
+        job = job_manager.create_job(format="srt", filename="a.wav")
+        content = "1\n00:00:00,000 --> 00:00:01,000\nhello world\n\n" * 100
+        job_manager.update_job(
+            job.id,
+            status=JobStatus.COMPLETED,
+            progress=100,
+            result={"type": "srt", "content": content, "filename": "a.srt"},
+        )
+
+        response = client.get(f"/jobs/{job.id}", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["result"]["content"] == content
+
+
+class TestSubmitSubtitleJob:
+    """Test suite for /subtitle upload validation"""
+
+    def test_rejects_unsupported_format(self):
+        """Test that unsupported extensions are rejected before upload is saved"""
+        response = client.post(
+            "/subtitle",
+            files={"audio_file": ("test.txt", b"not audio", "text/plain")},
+        )
+        assert response.status_code == 415
+
+    def test_rejects_oversized_upload(self, monkeypatch, tmp_path):
+        """Test that oversized uploads are rejected and the partial file removed"""
+        monkeypatch.setattr(subtitle, "MAX_FILE_SIZE_MB", 1)
+        monkeypatch.setattr(subtitle.tempfile, "tempdir", str(tmp_path))
+        monkeypatch.setattr(subtitle, "TMPFS_DIR", None)
+
+        response = client.post(
+            "/subtitle",
+            files={"audio_file": ("big.wav", b"\0" * (2 * 1024 * 1024), "audio/wav")},
+        )
+
+        assert response.status_code == 413
+        assert list(tmp_path.iterdir()) == []
+
+    def test_form_fields_parsed_into_configs(self, monkeypatch):
+        """Test that flat form fields are grouped into transcription/formatter configs"""
+        queue = asyncio.Queue()
+        monkeypatch.setattr(subtitle, "_job_queue", queue)
+
+        response = client.post(
+            "/subtitle",
+            files={"audio_file": ("a.wav", b"RIFF", "audio/wav")},
+            data={
+                "format": "json",
+                "model_size": "tiny",
+                "compute_type": "int8",
+                "language": "en",
+                "beam_size": "3",
+                "max_line_width": "30",
+            },
+        )
+
+        assert response.status_code == 200
+        (_, temp_path, fmt, _, engine, model_size, compute_type,
+         transcription_config, formatter_config) = queue.get_nowait()
+        os.unlink(temp_path)
+        assert (fmt, engine, model_size, compute_type) == ("json", "faster-whisper", "tiny", "int8")
+        assert transcription_config["language"] == "en"
+        assert transcription_config["beam_size"] == 3
+        assert transcription_config["batch_size"] == 16
+        assert formatter_config["max_line_width"] == 30
+
+    def test_small_upload_uses_tmpfs(self, monkeypatch, tmp_path):
+        """Test that uploads under the threshold are written to the tmpfs dir"""
+        queue = asyncio.Queue()
+        monkeypatch.setattr(subtitle, "_job_queue", queue)
+        monkeypatch.setattr(subtitle, "TMPFS_DIR", str(tmp_path))
+
+        response = client.post(
+            "/subtitle",
+            files={"audio_file": ("a.wav", b"RIFF", "audio/wav")},
+        )
+
+        assert response.status_code == 200
+        temp_path = queue.get_nowait()[1]
+        assert os.path.dirname(temp_path) == str(tmp_path)
+        os.unlink(temp_path)
+
+    def test_tmpfs_skipped_when_low_on_space(self, monkeypatch, tmp_path):
+        """Test that a tmpfs without room for the upload is not chosen"""
+        from types import SimpleNamespace
+
+        monkeypatch.setattr(subtitle, "TMPFS_DIR", str(tmp_path))
+        free_bytes = (subtitle.TMPFS_MARGIN_MB + 1) * 1024 * 1024
+        monkeypatch.setattr(
+            subtitle.os, "statvfs", lambda path: SimpleNamespace(f_bavail=free_bytes, f_frsize=1)
+        )
+
+        assert subtitle._upload_dir(1024 * 1024) == str(tmp_path)
+        assert subtitle._upload_dir(2 * 1024 * 1024) is None
+
+    def test_full_tmpfs_falls_back_to_disk(self, monkeypatch, tmp_path):
+        """Test that ENOSPC on the tmpfs retries the upload in the temp dir"""
+        import errno
+        import io
+        import tempfile
+
+        tmpfs = tmp_path / "shm"
+        disk = tmp_path / "disk"
+        tmpfs.mkdir()
+        disk.mkdir()
+        monkeypatch.setattr(subtitle.tempfile, "tempdir", str(disk))
+
+        real_named_temporary_file = tempfile.NamedTemporaryFile
+
+        def full_tmpfs(*args, dir=None, **kwargs):
+            temp_file = real_named_temporary_file(*args, dir=dir, **kwargs)
+            if dir == str(tmpfs):
+                def write(data):
+                    raise OSError(errno.ENOSPC, "No space left on device")
+                temp_file.write = write
+            return temp_file
+
+        monkeypatch.setattr(subtitle.tempfile, "NamedTemporaryFile", full_tmpfs)
+
+        path = subtitle._save_upload(io.BytesIO(b"RIFF" * 1024), ".wav", str(tmpfs))
+
+        assert os.path.dirname(path) == str(disk)
+        with open(path, "rb") as f:
+            assert f.read() == b"RIFF" * 1024
+        os.unlink(path)
+        assert list(tmpfs.iterdir()) == []
+
+    def test_auto_compute_type_resolved(self, monkeypatch):
+        """Test that compute_type=auto resolves to the hardware default"""
+        queue = asyncio.Queue()
+        monkeypatch.setattr(subtitle, "_job_queue", queue)
+
+        response = client.post(
+            "/subtitle",
+            files={"audio_file": ("a.wav", b"RIFF", "audio/wav")},
+            data={"compute_type": "auto"},
+        )
+
+        assert response.status_code == 200
+        job_args = queue.get_nowait()
+        os.unlink(job_args[1])
+        assert job_args[6] == get_optimal_compute_type()
+
+    def test_out_of_range_field_rejected(self):
+        """Test that schema constraints on form fields return 422"""
+        response = client.post(
+            "/subtitle",
+            files={"audio_file": ("a.wav", b"RIFF", "audio/wav")},
+            data={"beam_size": "100"},
+        )
+
+        assert response.status_code == 422
+
+    def test_queued_job_processed_by_worker(self, monkeypatch):
+        """Test that startup workers pick up queued jobs"""
+        calls = []
+
+        def fake_process(job_id, temp_path, *args, device_index=0):
+            os.unlink(temp_path)
+            calls.append(device_index)
+            get_job_manager().update_job(
+                job_id, status=JobStatus.COMPLETED, progress=100,
+                result={"type": "srt", "content": "", "filename": "a.srt"},
+            )
+
+        monkeypatch.setattr(subtitle, "process_subtitle_job", fake_process)
+        monkeypatch.setattr(subtitle, "WARM_MODEL_SIZE", "")
+
+        with TestClient(app) as live_client:
+            job_id = live_client.post(
+                "/subtitle",
+                files={"audio_file": ("a.wav", b"RIFF", "audio/wav")},
+            ).json()["job_id"]
+
+            for _ in range(100):
+                if live_client.get(f"/jobs/{job_id}").json()["status"] == "completed":
+                    break
+                time.sleep(0.01)
+
+        assert get_job_manager().get_job(job_id).status == JobStatus.COMPLETED
+        assert calls == [0]
+
+
+class TestJobWorker:
+    """Test suite for job worker scheduling"""
+
+    def test_group_by_model(self):
+        """Test that queued jobs are regrouped by model, keeping order"""
+        def job(job_id, model_size):
+            return (job_id, "", "srt", "", "faster-whisper", model_size, "int8", {}, {})
+
+        batch = [job("a", "large-v3"), job("b", "tiny"), job("c", "large-v3"), job("d", "tiny")]
+
+        ordered = [job_args[0] for job_args in subtitle._group_by_model(batch)]
+
+        assert ordered == ["a", "c", "b", "d"]
+
+    @pytest.mark.asyncio
+    async def test_workers_share_burst(self, monkeypatch):
+        """Test that a burst of jobs is spread over all workers"""
+        devices = []
+
+        def fake_process(*args, device_index=0):
+            time.sleep(0.05)
+            devices.append(device_index)
+
+        monkeypatch.setattr(subtitle, "process_subtitle_job", fake_process)
+        monkeypatch.setattr(subtitle, "WARM_MODEL_SIZE", "")
+        monkeypatch.setattr(subtitle, "get_device_count", lambda: 2)
+        monkeypatch.setattr(subtitle, "_job_queue", None)
+
+        workers = subtitle.start_job_workers()
+        try:
+            # Queued before either worker runs, so one could take them all
+            for i in range(4):
+                subtitle._job_queue.put_nowait(
+                    (str(i), "", "srt", "", "faster-whisper", "tiny", "int8", {}, {})
+                )
+            await asyncio.wait_for(subtitle._job_queue.join(), timeout=5)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        assert set(devices) == {0, 1}
+
+    @pytest.mark.asyncio
+    async def test_worker_not_blocked_by_warmup(self, monkeypatch):
+        """Test that workers take jobs while the warm model is still loading"""
+        warmup_release = threading.Event()
+        processed = []
+
+        monkeypatch.setattr(subtitle, "_warm_engine", lambda device_index: warmup_release.wait(5))
+        monkeypatch.setattr(
+            subtitle, "process_subtitle_job", lambda *args, device_index=0: processed.append(args[0])
+        )
+        monkeypatch.setattr(subtitle, "WARM_MODEL_SIZE", "tiny")
+        monkeypatch.setattr(subtitle, "get_device_count", lambda: 1)
+        monkeypatch.setattr(subtitle, "_job_queue", None)
+
+        tasks = subtitle.start_job_workers()
+        try:
+            subtitle._job_queue.put_nowait(
+                ("a", "", "srt", "", "faster-whisper", "tiny", "int8", {}, {})
+            )
+            await asyncio.wait_for(subtitle._job_queue.join(), timeout=2)
+        finally:
+            warmup_release.set()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert processed == ["a"]
+
+    def test_cpu_engine_config_splits_threads(self, monkeypatch):
+        """Test that CPU workers get a per-worker thread budget"""
+        monkeypatch.setattr(subtitle, "get_optimal_device", lambda: "cpu")
+
+        config = subtitle._engine_config(1, "int8")
+
+        assert config == {
+            "device": "cpu",
+            "device_index": 1,
+            "compute_type": "int8",
+            "cpu_threads": subtitle.CPU_THREADS,
+        }
+
+
+class FakeEngine(ASREngine):
+    """Engine stub returning a fixed transcription"""
+
+    def load_model(self, model_size, config):
+        pass
+
+    def get_info(self):
+        return None
+
+    def transcribe(self, audio_path, config):
+        return TranscriptionResult(
+            text="Hello world",
+            language="en",
+            segments=[
+                Segment(
+                    start=0.0, end=1.0, text="Hello world",
+                    words=[
+                        Word(start=0.0, end=0.4, word="Hello", confidence=0.9),
+                        Word(start=0.5, end=1.0, word="world", confidence=0.8),
+                    ],
+                ),
+                Segment(start=1.0, end=2.0, text="Again"),
+            ],
+            inference_time_ms=1.0,
+        )
+
+
+class FakeModelManager:
+    """Model manager stub handing out FakeEngine"""
+
+    def get_engine(self, engine_name, model_size, config):
+        return FakeEngine()
+
+
+class TestProcessSubtitleJob:
+    """Test suite for process_subtitle_job"""
+
+    def _run(self, monkeypatch, tmp_path, output_format, formatter_config=None):
+        monkeypatch.setattr(subtitle, "get_model_manager", FakeModelManager)
+        audio_path = tmp_path / "a.wav"
+        audio_path.write_bytes(b"RIFF")
+        job_manager = get_job_manager()
+        job = job_manager.create_job(format=output_format, filename="a.wav")
+
+        subtitle.process_subtitle_job(
+            job.id, str(audio_path), output_format, "a.wav", "faster-whisper",
+            "tiny", "int8", {"vad_filter": True}, formatter_config or {},
+        )
+
+        assert not audio_path.exists()
+        return job_manager.get_job(job.id)
+
+    def test_json_result(self, monkeypatch, tmp_path):
+        """Test JSON results keep segment text/timing and word timing only"""
+        job = self._run(monkeypatch, tmp_path, "json")
+
+        assert job.status == JobStatus.COMPLETED
+        data = job.result["data"]
+        assert data["segments"] == [
+            {
+                "start": 0.0, "end": 1.0, "text": "Hello world",
+                "words": [
+                    {"start": 0.0, "end": 0.4, "word": "Hello"},
+                    {"start": 0.5, "end": 1.0, "word": "world"},
+                ],
+            },
+            {"start": 1.0, "end": 2.0, "text": "Again", "words": None},
+        ]
+        assert data["metadata"]["audio_duration_s"] == 2.0
+
+    def test_srt_result(self, monkeypatch, tmp_path):
+        """Test SRT results are formatted with the formatter config"""
+        job = self._run(monkeypatch, tmp_path, "srt", {"max_line_width": 42})
+
+        assert job.status == JobStatus.COMPLETED
+        assert job.result["type"] == "srt"
+        assert job.result["filename"] == "a.srt"
+        assert "Hello world" in job.result["content"]
+        assert job.result["metadata"]["audio_duration_s"] == 2.0
@@ -0,0 +1,52 @@
+"""
+Integration tests for /presets endpoints
+
+Tests preset loading at startup and listing.
+"""
+
+import logging
+import os
+import shutil
+
+from fastapi.testclient import TestClient
+from api.main import app
+from api.routers import presets, subtitle
+
+
+class TestPresetsEndpoint:
+    """Test suite for /presets endpoints"""
+
+    def test_list_presets_loaded_at_startup(self, monkeypatch):
+        """Test that presets validated at startup are served"""
+        monkeypatch.setattr(subtitle, "WARM_MODEL_SIZE", "")
+        with TestClient(app) as client:
+            response = client.get("/presets/")
+
+        assert response.status_code == 200
+        ids = [preset["id"] for preset in response.json()]
+        assert ids == sorted(ids)
+        assert "default" in ids
+
+    def test_malformed_preset_skipped(self, tmp_path, monkeypatch, caplog):
+        """Test that a malformed preset is logged and the valid ones still load"""
+        shutil.copy(presets.PRESETS_DIR / "default.json", tmp_path / "default.json")
+        (tmp_path / "broken.json").write_text("{not json")
+        monkeypatch.setattr(presets, "PRESETS_DIR", tmp_path)
+
+        with caplog.at_level(logging.ERROR, logger=presets.logger.name):
+            loaded = presets.load_presets()
+
+        assert [preset.id for preset in loaded] == ["default"]
+        assert "broken.json" in caplog.text
+
+    def test_preset_broken_by_edit_dropped(self, tmp_path, monkeypatch):
+        """Test that a preset edited into an invalid state is no longer served"""
+        preset_path = tmp_path / "default.json"
+        shutil.copy(presets.PRESETS_DIR / "default.json", preset_path)
+        monkeypatch.setattr(presets, "PRESETS_DIR", tmp_path)
+        assert [preset.id for preset in presets.load_presets()] == ["default"]
+
+        preset_path.write_text("{not json")
+        os.utime(preset_path, ns=(0, 0))
+
+        assert presets.load_presets() == []
@@ -0,0 +1,58 @@
+"""
+Standalone Transcription Benchmark
+
+Times one FasterWhisperEngine transcription in a fresh interpreter, free of
+pytest's import graph and plugins, and prints the result as JSON. Invoked
+by the performance tests; can also be run directly:
+
+    python -m tests.performance.run_bench fixtures/clean_speech.wav --model-size tiny
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from lib.engines.faster_whisper import FasterWhisperEngine
+from lib.utils.gpu import get_optimal_compute_type, get_optimal_device
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("audio_path", help="Audio file to transcribe")
+    parser.add_argument("--model-size", default="tiny", help="Whisper model size (default: tiny)")
+    parser.add_argument("--device", default=None, help="Device (default: best available)")
+    parser.add_argument("--compute-type", default=None, help="CTranslate2 compute type (default: per device)")
+    parser.add_argument("--no-vad", action="store_true", help="Disable the VAD filter")
+    args = parser.parse_args(argv)
+
+    device = args.device or get_optimal_device()
+    compute_type = args.compute_type or get_optimal_compute_type()
+
+    engine = FasterWhisperEngine()
+    start = time.perf_counter_ns()
+    engine.load_model(args.model_size, {"device": device, "compute_type": compute_type})
+    load_time_ms = (time.perf_counter_ns() - start) / 1e6
+
+    start = time.perf_counter_ns()
+    result = engine.transcribe(args.audio_path, {"vad_filter": not args.no_vad})
+    total_time_ms = (time.perf_counter_ns() - start) / 1e6
+
+    json.dump(
+        {
+            "model_size": args.model_size,
+            "device": device,
+            "compute_type": compute_type,
+            "load_time_ms": load_time_ms,
+            "total_time_ms": total_time_ms,
+            "inference_time_ms": result.inference_time_ms,
+            "audio_duration_s": result.segments[-1].end if result.segments else 0.0,
+            "segments": len(result.segments),
+        },
+        sys.stdout,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Unit tests for AudioAnalyzer helpers
+
+Tests the numpy feature helpers; they don't need librosa.
+"""
+
+import threading
+
+import numpy as np
+
+from lib.utils.audio_analyzer import AudioAnalyzer, _content_key, _framed_rms, _quantiles
+
+
+def _naive_rms(y, frame_length, hop_length):
+    """Reference: centered zero-padded framing, RMS per frame"""
+    padded = np.pad(y, frame_length // 2)
+    n_frames = 1 + (len(padded) - frame_length) // hop_length
+    return np.array([
+        np.sqrt(np.mean(padded[i * hop_length:i * hop_length + frame_length] ** 2))
+        for i in range(n_frames)
+    ])
+
+
+class TestFramedRMS:
+    """Test suite for _framed_rms"""
+
+    def test_matches_reference(self):
+        """Test frame count and values against explicit framing"""
+        y = np.random.default_rng(0).standard_normal(16000).astype(np.float32)
+
+        rms = _framed_rms(y, 2048, 512)
+
+        expected = _naive_rms(y.astype(np.float64), 2048, 512)
+        assert rms.dtype == np.float32
+        assert rms.shape == expected.shape
+        np.testing.assert_allclose(rms, expected, rtol=1e-5)
+
+    def test_hop_not_dividing_frame(self):
+        """Test the per-sample fallback when frame_length isn't a multiple of hop_length"""
+        y = np.random.default_rng(2).standard_normal(5000).astype(np.float32)
+
+        rms = _framed_rms(y, 400, 160)
+
+        np.testing.assert_allclose(rms, _naive_rms(y.astype(np.float64), 400, 160), rtol=1e-5)
+
+    def test_silence_and_short_input(self):
+        """Test silent and shorter-than-frame audio"""
+        assert not _framed_rms(np.zeros(8000, dtype=np.float32)).any()
+        assert _framed_rms(np.ones(100, dtype=np.float32)).shape == (1,)
+
+
+class TestQuantiles:
+    """Test suite for _quantiles"""
+
+    def test_matches_percentile(self):
+        """Test interpolated quantiles against np.percentile"""
+        rng = np.random.default_rng(1)
+        for size in (1, 2, 7, 1000):
+            values = rng.random(size).astype(np.float32)
+            np.testing.assert_allclose(
+                _quantiles(values, (0.1, 0.9)), np.percentile(values, (10, 90)), rtol=1e-6
+            )
+
+
+class TestAnalysisCache:
+    """Test suite for content-keyed result caching"""
+
+    def test_content_key(self, tmp_path):
+        """Test that the key follows content, not path"""
+        a = tmp_path / "a.wav"
+        b = tmp_path / "b.wav"
+        c = tmp_path / "c.wav"
+        a.write_bytes(b"x" * 200000)
+        b.write_bytes(b"x" * 200000)
+        c.write_bytes(b"x" * 199999 + b"y")
+
+        assert _content_key(str(a)) == _content_key(str(b))
+        assert _content_key(str(a)) != _content_key(str(c))
+
+    def test_content_key_covers_middle(self, tmp_path):
+        """Test that files differing only mid-stream get different keys"""
+        a = tmp_path / "a.wav"
+        b = tmp_path / "b.wav"
+        a.write_bytes(b"\0" * 100000 + b"a" + b"\0" * 100000)
+        b.write_bytes(b"\0" * 100000 + b"b" + b"\0" * 100000)
+
+        assert _content_key(str(a)) != _content_key(str(b))
+
+    def test_repeat_hits_cache(self, tmp_path, monkeypatch):
+        """Test that a repeated file is analyzed once and the LRU is bounded"""
+        analyzer = AudioAnalyzer.__new__(AudioAnalyzer)
+        analyzer.cache_size = 1
+        analyzer._cache = {}
+        analyzer._cache_lock = threading.Lock()
+        calls = []
+        monkeypatch.setattr(analyzer, "_analyze", lambda path: calls.append(path) or path)
+
+        first = tmp_path / "a.wav"
+        second = tmp_path / "b.wav"
+        first.write_bytes(b"one")
+        second.write_bytes(b"two")
+
+        assert analyzer.analyze(str(first)) == str(first)
+        assert analyzer.analyze(str(first)) == str(first)
+        analyzer.analyze(str(second))
+        analyzer.analyze(str(first))
+
+        assert calls == [str(first), str(second), str(first)]
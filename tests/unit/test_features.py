@@ -0,0 +1,65 @@
+"""
+Unit tests for TorchFeatureExtractor
+
+Tests that GPU feature extraction matches the numpy reference.
+"""
+
+import numpy as np
+import pytest
+
+from lib.utils.features import TORCH_AVAILABLE, TorchFeatureExtractor
+
+
+class NumpyFeatureExtractor:
+    """Reference log-mel extractor with faster-whisper's parameters"""
+
+    sampling_rate = 16000
+    n_fft = 400
+    hop_length = 160
+    n_samples = 480000
+    nb_max_frames = 3000
+
+    def __init__(self, n_mels: int = 80):
+        rng = np.random.default_rng(0)
+        self.mel_filters = rng.random((n_mels, self.n_fft // 2 + 1)).astype(np.float32)
+
+    def __call__(self, waveform, padding=160, chunk_length=None):
+        waveform = np.pad(waveform.astype(np.float32), (0, padding))
+        padded = np.pad(waveform, self.n_fft // 2, mode="reflect")
+        window = np.hanning(self.n_fft + 1)[:-1].astype(np.float32)
+        num_frames = 1 + (len(padded) - self.n_fft) // self.hop_length
+        frames = np.stack([
+            padded[i * self.hop_length:i * self.hop_length + self.n_fft] * window
+            for i in range(num_frames)
+        ], axis=-1)
+        stft = np.fft.rfft(frames, axis=0)
+        magnitudes = np.abs(stft[..., :-1]) ** 2
+        log_spec = np.log10(np.clip(self.mel_filters @ magnitudes, 1e-10, None))
+        log_spec = np.maximum(log_spec, log_spec.max() - 8.0)
+        return (log_spec + 4.0) / 4.0
+
+
+@pytest.mark.skipif(not TORCH_AVAILABLE, reason="PyTorch not available")
+class TestTorchFeatureExtractor:
+    """Test suite for TorchFeatureExtractor"""
+
+    def test_matches_numpy_reference(self):
+        """Test that torch features match the numpy implementation"""
+        reference = NumpyFeatureExtractor()
+        extractor = TorchFeatureExtractor(reference, device="cpu")
+        audio = np.random.default_rng(1).standard_normal(16000).astype(np.float32)
+
+        expected = reference(audio)
+        actual = extractor(audio)
+
+        assert actual.shape == expected.shape
+        np.testing.assert_allclose(actual, expected, atol=1e-3)
+
+    def test_delegates_attributes(self):
+        """Test that extractor attributes are read from the wrapped extractor"""
+        reference = NumpyFeatureExtractor()
+        extractor = TorchFeatureExtractor(reference, device="cpu")
+
+        assert extractor.sampling_rate == 16000
+        extractor(np.zeros(1600, dtype=np.float32), chunk_length=10)
+        assert reference.n_samples == 160000
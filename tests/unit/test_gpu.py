@@ -0,0 +1,64 @@
+"""
+Unit tests for GPU utilities
+
+Tests helpers that don't need a CUDA device, plus startup settings that
+only apply on one.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.routers import subtitle
+from lib.utils.gpu import _version_tuple, expandable_segments_enabled
+
+
+class TestVersionTuple:
+    """Test suite for version parsing"""
+
+    def test_local_and_short_versions(self):
+        """Test local version suffixes and short versions"""
+        assert _version_tuple("2.1.0+cu121") == (2, 1, 0)
+        assert _version_tuple("11.8") == (11, 8)
+        assert _version_tuple("2.2.0a0") == (2, 2)
+
+    def test_missing_version(self):
+        """Test that a missing version compares lowest"""
+        assert _version_tuple(None) == ()
+        assert _version_tuple(None) < (11, 4)
+
+
+class TestExpandableSegments:
+    """Test suite for allocator config detection"""
+
+    def test_reads_alloc_conf(self, monkeypatch):
+        """Test detection from PYTORCH_CUDA_ALLOC_CONF"""
+        monkeypatch.setenv("PYTORCH_CUDA_ALLOC_CONF", "max_split_size_mb:128,expandable_segments:True")
+        assert expandable_segments_enabled()
+
+        monkeypatch.setenv("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:False")
+        assert not expandable_segments_enabled()
+
+        monkeypatch.delenv("PYTORCH_CUDA_ALLOC_CONF")
+        assert not expandable_segments_enabled()
+
+
+class TestTF32:
+    """Test suite for TF32 matmul startup configuration"""
+
+    def test_tf32_enabled(self, monkeypatch):
+        """Test that app startup enables TF32 matmuls on tensor-core GPUs"""
+        torch = pytest.importorskip("torch")
+        # Probed here rather than in a skipif, so collection never initializes CUDA
+        if not torch.cuda.is_available() or torch.cuda.get_device_capability()[0] < 8:
+            pytest.skip("Requires an Ampere or newer GPU")
+
+        monkeypatch.setattr(subtitle, "WARM_MODEL_SIZE", "")
+        precision = torch.get_float32_matmul_precision()
+        torch.set_float32_matmul_precision("highest")
+        try:
+            with TestClient(app):
+                assert torch.backends.cuda.matmul.allow_tf32 is True
+                assert torch.get_float32_matmul_precision() in ("high", "medium")
+        finally:
+            torch.set_float32_matmul_precision(precision)
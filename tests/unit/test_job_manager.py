@@ -0,0 +1,139 @@
+"""
+Unit tests for JobManager
+
+Tests job creation, updates and cleanup.
+"""
+
+import asyncio
+import threading
+import time
+
+from api.utils.jobs import JobManager, JobStatus
+
+
+class TestJobManager:
+    """Test suite for JobManager"""
+
+    def test_job_ids_unique(self):
+        """Test that job IDs are unique and resolvable"""
+        manager = JobManager()
+        jobs = [manager.create_job() for _ in range(50)]
+
+        assert len({job.id for job in jobs}) == 50
+        assert all(manager.get_job(job.id) is job for job in jobs)
+
+    def test_update_job(self):
+        """Test status transitions set timestamps and result"""
+        manager = JobManager()
+        job = manager.create_job(format="json", filename="a.wav")
+
+        manager.update_job(job.id, status=JobStatus.PROCESSING, progress=10)
+        assert job.started_at is not None
+
+        manager.update_job(
+            job.id, status=JobStatus.COMPLETED, progress=100, result={"type": "json"}
+        )
+        assert job.status == JobStatus.COMPLETED
+        assert job.completed_at is not None
+        assert job.result == {"type": "json"}
+
+    def test_update_unknown_job(self):
+        """Test that updating an unknown job returns None"""
+        assert JobManager().update_job("missing", progress=50) is None
+
+    def test_cleanup_keeps_active_jobs(self):
+        """Test that cleanup only evicts finished jobs"""
+        manager = JobManager(max_jobs=4)
+        active = manager.create_job()
+        for _ in range(3):
+            job = manager.create_job()
+            manager.update_job(job.id, status=JobStatus.COMPLETED)
+
+        manager.create_job()
+
+        jobs = manager.list_jobs()
+        assert active.id in jobs
+        assert len(jobs) == 4
+
+    def test_cleanup_on_completion_evicts_oldest(self):
+        """Test that finishing a job at capacity evicts the oldest finished jobs"""
+        manager = JobManager(max_jobs=4)
+        jobs = [manager.create_job() for _ in range(4)]
+
+        for job in jobs[:3]:
+            manager.update_job(job.id, status=JobStatus.COMPLETED)
+        manager.update_job(jobs[3].id, status=JobStatus.FAILED)
+
+        remaining = manager.list_jobs()
+        assert jobs[0].id not in remaining
+        assert jobs[1].id in remaining
+        assert len(remaining) == 3
+
+    def test_repeated_completion_counted_once(self):
+        """Test that re-marking a finished job doesn't queue it twice"""
+        manager = JobManager()
+        job = manager.create_job()
+
+        manager.update_job(job.id, status=JobStatus.COMPLETED)
+        manager.update_job(job.id, status=JobStatus.COMPLETED, progress=100)
+
+        assert list(manager._finished) == [job.id]
+
+    def test_concurrent_create_and_update(self):
+        """Test that concurrent workers don't lose jobs"""
+        manager = JobManager(max_jobs=10_000)
+
+        def worker():
+            for _ in range(100):
+                job = manager.create_job()
+                manager.update_job(job.id, status=JobStatus.PROCESSING, progress=50)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        jobs = manager.list_jobs()
+        assert len(jobs) == 800
+        assert all(job.progress == 50 for job in jobs.values())
+
+    def test_wait_for_update_woken_by_worker_thread(self):
+        """Test that a long-poll waiter wakes on an update from another thread"""
+        manager = JobManager()
+        job = manager.create_job()
+
+        async def wait():
+            timer = threading.Timer(
+                0.05, manager.update_job, args=(job.id,), kwargs={"progress": 40}
+            )
+            timer.start()
+            await manager.wait_for_update(job, (job.status, job.progress), timeout=5)
+            timer.join()
+
+        start = time.monotonic()
+        asyncio.run(wait())
+
+        assert time.monotonic() - start < 2
+        assert job.progress == 40
+        assert job._waiters == []
+
+    def test_wait_for_update_returns_if_already_changed(self):
+        """Test that a stale snapshot returns without waiting"""
+        manager = JobManager()
+        job = manager.create_job()
+        manager.update_job(job.id, status=JobStatus.PROCESSING)
+
+        start = time.monotonic()
+        asyncio.run(manager.wait_for_update(job, (JobStatus.PENDING, 0), timeout=5))
+
+        assert time.monotonic() - start < 1
+
+    def test_wait_for_update_times_out(self):
+        """Test that the waiter is removed after a timeout"""
+        manager = JobManager()
+        job = manager.create_job()
+
+        asyncio.run(manager.wait_for_update(job, (job.status, job.progress), timeout=0.05))
+
+        assert job._waiters == []
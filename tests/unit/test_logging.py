@@ -0,0 +1,116 @@
+"""
+Unit tests for structured logging
+
+Tests JSON log formatting.
+"""
+
+import io
+import logging
+import queue
+import sys
+from datetime import datetime, timezone
+
+import numpy as np
+import orjson
+
+from api.utils.logging import BufferedStreamHandler, JSONFormatter, RecordQueueHandler
+
+
+class CountingStream(io.StringIO):
+    """StringIO that counts flush calls"""
+
+    flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+def make_record(level=logging.INFO, msg="hello %s", args=("world",)):
+    return logging.LogRecord("test", level, __file__, 10, msg, args, None)
+
+
+class TestJSONFormatter:
+    """Test suite for JSONFormatter"""
+
+    def test_formats_base_fields(self):
+        """Test that base fields are encoded with a UTC timestamp"""
+        record = make_record()
+
+        log_data = orjson.loads(JSONFormatter().format(record))
+
+        assert log_data["level"] == "INFO"
+        assert log_data["logger"] == "test"
+        assert log_data["message"] == "hello world"
+        assert log_data["timestamp"].endswith("Z")
+        assert "location" not in log_data
+
+    def test_timestamp_matches_record_time(self):
+        """Test that cached timestamp prefixes track the record's second"""
+        formatter = JSONFormatter()
+        for created in (1700000000.25, 1700000000.5, 1700000001.000001):
+            record = make_record()
+            record.created = created
+
+            log_data = orjson.loads(formatter.format(record))
+
+            expected = datetime.fromtimestamp(created, timezone.utc)
+            assert log_data["timestamp"] == expected.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+    def test_metadata_with_numpy_values(self):
+        """Test that metadata with numpy scalars and int keys is serialized"""
+        record = make_record()
+        record.metadata = {"snr_db": np.float64(12.5), 1: "one"}
+
+        log_data = orjson.loads(JSONFormatter().format(record))
+
+        assert log_data["metadata"] == {"snr_db": 12.5, "1": "one"}
+
+    def test_error_includes_location(self):
+        """Test that errors carry file location info"""
+        log_data = orjson.loads(JSONFormatter().format(make_record(level=logging.ERROR)))
+
+        assert log_data["location"]["line"] == 10
+
+
+class TestBufferedStreamHandler:
+    """Test suite for BufferedStreamHandler"""
+
+    def test_flushes_only_errors_immediately(self):
+        """Test that regular records are batched and errors flushed"""
+        stream = CountingStream()
+        handler = BufferedStreamHandler(stream, flush_interval=60)
+
+        handler.handle(make_record())
+        assert stream.flushes == 0
+        assert stream.getvalue() == "hello world\n"
+
+        handler.handle(make_record(level=logging.ERROR))
+        assert stream.flushes == 1
+
+        handler.close()
+        assert stream.flushes == 2
+
+
+class TestRecordQueueHandler:
+    """Test suite for RecordQueueHandler"""
+
+    def test_prepare_keeps_exc_info_and_extras(self):
+        """Test that queued records keep structured fields for the formatter"""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord(
+                "test", logging.ERROR, __file__, 10, "failed %s", ("job",), sys.exc_info()
+            )
+        record.metadata = {"job_id": "abc"}
+
+        prepared = RecordQueueHandler(queue.SimpleQueue()).prepare(record)
+
+        assert prepared is not record
+        assert prepared.msg == "failed job"
+        assert prepared.args is None
+        assert prepared.exc_info is not None
+        log_data = orjson.loads(JSONFormatter().format(prepared))
+        assert "ValueError: boom" in log_data["exception"]
+        assert log_data["metadata"] == {"job_id": "abc"}
@@ -0,0 +1,111 @@
+"""
+Unit tests for MetricsCollector
+
+Tests request statistics and streaming latency percentiles.
+"""
+
+import random
+import time
+
+import pytest
+from api.routers import metrics as metrics_module
+from api.routers.metrics import MetricsCollector, P2Quantile
+
+
+class TestP2Quantile:
+    """Test suite for the P-square quantile estimator"""
+
+    def test_empty_estimator(self):
+        """Test that an empty estimator reports zero"""
+        assert P2Quantile(0.5).value == 0.0
+
+    def test_few_samples_exact(self):
+        """Test exact quantile with fewer than five samples"""
+        estimator = P2Quantile(0.5)
+        for x in (3.0, 1.0, 2.0):
+            estimator.add(x)
+
+        assert estimator.value == 2.0
+
+    @pytest.mark.parametrize("quantile", [0.5, 0.95, 0.99])
+    def test_converges_on_uniform(self, quantile):
+        """Test estimate is close to the true quantile of a uniform stream"""
+        rng = random.Random(0)
+        estimator = P2Quantile(quantile)
+        for _ in range(20000):
+            estimator.add(rng.uniform(0, 1000))
+
+        assert estimator.value == pytest.approx(quantile * 1000, abs=20)
+
+
+class TestMetricsCollector:
+    """Test suite for MetricsCollector"""
+
+    def test_empty_metrics(self):
+        """Test metrics before any request is recorded"""
+        metrics = MetricsCollector().get_metrics()
+
+        assert metrics["requests_total"] == 0
+        assert metrics["requests_last_hour"] == 0
+        assert metrics["p50_inference_time_ms"] == 0.0
+        assert metrics["error_rate"] == 0.0
+
+    def test_record_request(self):
+        """Test counters, rates and latency after recording requests"""
+        collector = MetricsCollector()
+        collector.record_request("/subtitle", 100.0, success=True, cache_hit=True)
+        collector.record_request("/subtitle", 300.0, success=False)
+
+        metrics = collector.get_metrics()
+
+        assert metrics["requests_total"] == 2
+        assert metrics["requests_last_hour"] == 2
+        assert metrics["requests_per_minute"] == 2.0
+        assert metrics["avg_inference_time_ms"] == 200.0
+        assert metrics["cache_hit_rate"] == 0.5
+        assert metrics["error_rate"] == 0.5
+
+        stat = collector.endpoint_stats["/subtitle"]
+        assert (stat.count, stat.errors, stat.total_time_ms) == (2, 1, 400.0)
+
+    def test_backlog_drained_on_threshold(self):
+        """Test that pending samples are folded in once the threshold is hit"""
+        collector = MetricsCollector()
+        for _ in range(MetricsCollector.DRAIN_THRESHOLD):
+            collector.record_request("/subtitle", 50.0)
+
+        assert collector._pending.empty()
+        assert collector.requests_total == MetricsCollector.DRAIN_THRESHOLD
+
+    def test_requests_outside_window_evicted(self):
+        """Test that timestamps older than the rate window are dropped"""
+        collector = MetricsCollector()
+        now = time.time()
+        collector.request_times.extend(
+            [now - MetricsCollector.RATE_WINDOW_S - 10, now - 120, now - 5]
+        )
+
+        metrics = collector.get_metrics()
+
+        assert metrics["requests_last_hour"] == 2
+        assert metrics["requests_per_minute"] == 1.0
+        assert len(collector.request_times) == 2
+
+    def test_gpu_poll_cached_within_ttl(self, monkeypatch):
+        """Test that GPU metrics are polled at most once per TTL"""
+        calls = []
+        monkeypatch.setattr(metrics_module, "is_gpu_available", lambda: True)
+        monkeypatch.setattr(
+            metrics_module,
+            "get_vram_info",
+            lambda: calls.append(1) or {"usage_percent": 42.0},
+        )
+        collector = MetricsCollector()
+
+        assert collector.get_metrics()["vram_usage_percent"] == 42.0
+        assert collector.get_metrics()["vram_usage_percent"] == 42.0
+        assert len(calls) == 1
+
+        collector._last_gpu_poll -= MetricsCollector.GPU_POLL_TTL_S
+        collector.get_metrics()
+        assert len(calls) == 2
@@ -0,0 +1,193 @@
+"""
+Unit tests for OpenAIWhisperEngine
+
+Tests backend selection; the CTranslate2 engine is replaced by a stub.
+"""
+
+import pytest
+
+from lib.engines import openai_whisper
+from lib.engines.openai_whisper import OpenAIWhisperEngine
+
+
+class _StubCT2Engine:
+    """Records load/transcribe calls in place of FasterWhisperEngine"""
+
+    def __init__(self):
+        self.model = None
+        self.calls = []
+
+    def load_model(self, model_size, config):
+        self.model = object()
+        self.calls.append(("load", model_size, config))
+
+    def transcribe(self, audio_path, config):
+        self.calls.append(("transcribe", audio_path, config))
+        return "result"
+
+
+def _bare_engine() -> OpenAIWhisperEngine:
+    """Engine without the openai-whisper availability check"""
+    engine = OpenAIWhisperEngine.__new__(OpenAIWhisperEngine)
+    engine.model = None
+    engine.model_size = None
+    engine.device = "cpu"
+    engine._backend = "torch"
+    engine._ct2_engine = None
+    return engine
+
+
+@pytest.fixture
+def stub_ct2(monkeypatch):
+    monkeypatch.setattr(openai_whisper, "FASTER_WHISPER_AVAILABLE", True)
+    monkeypatch.setattr(openai_whisper, "FasterWhisperEngine", _StubCT2Engine)
+
+
+class TestCT2Backend:
+    """Test suite for the CTranslate2 backend"""
+
+    def test_cpu_defaults_to_int8(self, stub_ct2):
+        """Test that CPU loads use int8 and all cores by default"""
+        engine = _bare_engine()
+        engine.load_model("small", {"device": "cpu", "backend": "ct2"})
+
+        _, model_size, config = engine._ct2_engine.calls[0]
+        assert model_size == "small"
+        assert config["compute_type"] == "int8"
+        assert config["cpu_threads"] > 0
+        assert engine.model is not None
+
+    def test_cuda_defaults_to_float16(self, stub_ct2):
+        """Test that CUDA loads use float16 unless a compute type is given"""
+        engine = _bare_engine()
+        engine.load_model("small", {"device": "cuda", "backend": "ct2"})
+        assert engine._ct2_engine.calls[0][2]["compute_type"] == "float16"
+
+        engine.load_model("small", {"device": "cuda", "backend": "ct2", "compute_type": "int8_float16"})
+        assert engine._ct2_engine.calls[0][2]["compute_type"] == "int8_float16"
+
+    def test_transcribe_delegates(self, stub_ct2):
+        """Test that transcribe runs on the CTranslate2 engine"""
+        engine = _bare_engine()
+        engine.load_model("small", {"backend": "ct2"})
+
+        assert engine.transcribe("audio.wav", {"language": "en"}) == "result"
+        assert engine._ct2_engine.calls[-1] == ("transcribe", "audio.wav", {"language": "en"})
+
+    def test_transcribe_batch_delegates(self, stub_ct2):
+        """Test that batch transcription runs each clip on the CTranslate2 engine"""
+        engine = _bare_engine()
+        engine.load_model("small", {"backend": "ct2"})
+
+        assert engine.transcribe_batch(["a.wav", "b.wav"], {}) == ["result", "result"]
+        assert [call[1] for call in engine._ct2_engine.calls[1:]] == ["a.wav", "b.wav"]
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend is rejected"""
+        with pytest.raises(ValueError, match="Unsupported backend"):
+            _bare_engine().load_model("small", {"backend": "onnx"})
+
+
+class TestCompileDecoder:
+    """Test suite for decoder compilation"""
+
+    def test_cpu_keeps_eager_decoder(self):
+        """Test that compilation is skipped off CUDA"""
+        engine = _bare_engine()
+        decoder = object()
+        engine.model = type("Model", (), {"decoder": decoder})()
+
+        engine._compile_decoder()
+
+        assert engine.model.decoder is decoder
+
+
+class TestQuantize:
+    """Test suite for weight quantization options"""
+
+    def test_unknown_mode(self):
+        """Test that an unknown quantize mode is rejected before loading"""
+        with pytest.raises(ValueError, match="Unsupported quantize mode"):
+            _bare_engine().load_model("small", {"backend": "torch", "quantize": "int3"})
+
+
+class TestConvertResult:
+    """Test suite for whisper result conversion"""
+
+    def test_skips_invalid_segments_and_words(self):
+        """Test that invalid segments/words are dropped and the rest kept"""
+        result = {
+            "language": "en",
+            "segments": [
+                {
+                    "start": 0.0,
+                    "end": 2.0,
+                    "text": " Hello there ",
+                    "words": [
+                        {"start": 0.0, "end": 0.8, "word": " Hello", "probability": 0.9},
+                        {"start": 1.0, "end": 1.0, "word": " bad"},
+                        {"start": 1.0, "end": 2.0, "word": " there", "probability": 0.8},
+                    ],
+                },
+                {"start": 2.0, "end": 2.0, "text": "empty span"},
+                {"start": 3.0, "end": 4.0, "text": "Bye"},
+            ],
+        }
+
+        converted = _bare_engine()._convert_result(result, 12.5)
+
+        assert converted.text == "Hello there Bye"
+        assert converted.language == "en"
+        assert [s.text for s in converted.segments] == ["Hello there", "Bye"]
+        assert [w.word for w in converted.segments[0].words] == ["Hello", "there"]
+        assert converted.segments[0].words[0].confidence == 0.9
+        assert converted.segments[1].words is None
+
+
+class TestUnloadModel:
+    """Test suite for unloading"""
+
+    def test_cpu_unload_skips_cuda(self):
+        """Test that a CPU model is released without touching CUDA"""
+        engine = _bare_engine()
+        engine.model = object()
+
+        engine.unload_model()
+
+        assert engine.model is None
+
+
+class TestWhisperCppBackend:
+    """Test suite for whisper.cpp output conversion"""
+
+    def test_centiseconds_to_segments(self):
+        """Test that whisper.cpp segments become a whisper-style result"""
+        cpp_segment = type("CppSegment", (), {})
+
+        def make(t0, t1, text):
+            seg = cpp_segment()
+            seg.t0, seg.t1, seg.text = t0, t1, text
+            return seg
+
+        class StubModel:
+            def transcribe(self, audio, **params):
+                self.params = params
+                return [make(0, 150, " Hello"), make(150, 320, " world")]
+
+        engine = _bare_engine()
+        engine.model = StubModel()
+
+        result = engine._generate_whispercpp("a.wav", None, None)
+
+        assert engine.model.params == {"language": "auto"}
+        assert result["segments"] == [
+            {"start": 0.0, "end": 1.5, "text": " Hello"},
+            {"start": 1.5, "end": 3.2, "text": " world"},
+        ]
+        assert engine._convert_result(result, 1.0).text == "Hello world"
+
+    def test_missing_bindings(self, monkeypatch):
+        """Test that loading without pywhispercpp fails clearly"""
+        monkeypatch.setattr(openai_whisper, "WHISPERCPP_AVAILABLE", False)
+        with pytest.raises(RuntimeError, match="pywhispercpp"):
+            _bare_engine().load_model("tiny", {"backend": "whispercpp"})
@@ -0,0 +1,193 @@
+"""
+Unit tests for SRTFormatter
+
+Tests SRT timestamp formatting and entry layout.
+"""
+
+from lib.engines.base import Segment, Word
+from lib.formatters.srt import SRTFormatter
+
+
+class TestTimestamps:
+    """Test suite for SRT timestamp formatting"""
+
+    def test_format_timestamp(self):
+        """Test hours, minutes, seconds and milliseconds fields"""
+        formatter = SRTFormatter()
+        assert formatter._format_timestamp(0.0) == "00:00:00,000"
+        assert formatter._format_timestamp(3723.456) == "01:02:03,456"
+
+    def test_rounds_to_nearest_millisecond(self):
+        """Test that float error does not truncate a millisecond away"""
+        formatter = SRTFormatter()
+        assert formatter._format_timestamp(1.001) == "00:00:01,001"
+        assert formatter._format_timestamp(59.9996) == "00:01:00,000"
+
+    def test_timestamp_pair(self):
+        """Test that the pair matches two single timestamps"""
+        formatter = SRTFormatter()
+        assert formatter._format_timestamp_pair(1.5, 3723.456) == (
+            f"{formatter._format_timestamp(1.5)} --> {formatter._format_timestamp(3723.456)}"
+        )
+
+    def test_segment_entries(self):
+        """Test segment-level SRT output"""
+        segments = [
+            Segment(start=0.0, end=2.5, text="Hello world."),
+            Segment(start=2.5, end=5.0, text="This is a test."),
+        ]
+        assert SRTFormatter().format(segments) == (
+            "1\n00:00:00,000 --> 00:00:02,500\nHello world.\n\n"
+            "2\n00:00:02,500 --> 00:00:05,000\nThis is a test.\n"
+        )
+
+    def test_word_entries(self):
+        """Test word-level SRT output, falling back to segment timing"""
+        segments = [
+            Segment(
+                start=0.0,
+                end=1.0,
+                text="Hi there",
+                words=[Word(start=0.0, end=0.4, word=" Hi"), Word(start=0.5, end=1.0, word=" there")],
+            ),
+            Segment(start=1.0, end=2.0, text="Bye"),
+        ]
+        assert SRTFormatter().format(segments, word_level=True) == (
+            "1\n00:00:00,000 --> 00:00:00,400\nHi\n\n"
+            "2\n00:00:00,500 --> 00:00:01,000\nthere\n\n"
+            "3\n00:00:01,000 --> 00:00:02,000\nBye\n"
+        )
+
+    def test_empty(self):
+        """Test that no segments produce an empty file"""
+        assert SRTFormatter().format([]) == ""
+
+
+class TestCJKDetection:
+    """Test suite for CJK text detection"""
+
+    def test_scripts(self):
+        """Test Chinese, Japanese, Korean and Latin text"""
+        formatter = SRTFormatter()
+        assert formatter._is_cjk_text("你好，世界")
+        assert formatter._is_cjk_text("こんにちは")
+        assert formatter._is_cjk_text("안녕하세요")
+        assert not formatter._is_cjk_text("Hello world")
+
+    def test_mixed_and_empty(self):
+        """Test the 30% threshold and text without letters"""
+        formatter = SRTFormatter()
+        assert formatter._is_cjk_text("我喜欢 Python")
+        assert not formatter._is_cjk_text("I really love the word 好")
+        assert not formatter._is_cjk_text("123 ...")
+
+
+class TestSplitByPunctuation:
+    """Test suite for punctuation splitting"""
+
+    def test_groups_follow_punctuation(self):
+        """Test group text and word-based timing"""
+        segment = Segment(
+            start=0.0,
+            end=3.0,
+            text="你好，世界。再见",
+            words=[
+                Word(start=0.0, end=0.5, word="你好，"),
+                Word(start=0.6, end=1.2, word="世界。"),
+                Word(start=1.5, end=2.0, word="再"),
+                Word(start=2.0, end=2.8, word="见"),
+            ],
+        )
+        assert SRTFormatter()._split_by_punctuation(segment) == [
+            {'start': 0.0, 'end': 0.5, 'text': '你好，'},
+            {'start': 0.6, 'end': 1.2, 'text': '世界。'},
+            {'start': 1.5, 'end': 2.8, 'text': '再见'},
+        ]
+
+
+class TestWrapText:
+    """Test suite for line wrapping"""
+
+    def test_wraps_at_width(self):
+        """Test greedy wrapping at the line width"""
+        formatter = SRTFormatter(max_line_width=11, max_line_count=3)
+        assert formatter._wrap_text("one two three four") == "one two\nthree four"
+
+    def test_long_word_own_line(self):
+        """Test that an over-wide word is kept whole"""
+        formatter = SRTFormatter(max_line_width=5, max_line_count=3)
+        assert formatter._wrap_text("a extraordinary b") == "a\nextraordinary\nb"
+
+    def test_merges_excess_lines(self):
+        """Test that lines beyond max_line_count are merged into the last one"""
+        formatter = SRTFormatter(max_line_width=3, max_line_count=2)
+        assert formatter._wrap_text("aa bb cc dd") == "aa\nbb cc dd"
+
+
+class TestValidate:
+    """Test suite for SRT validation"""
+
+    def test_formatter_output_is_valid(self):
+        """Test that generated SRT validates"""
+        formatter = SRTFormatter(max_line_width=10)
+        srt = formatter.format([
+            Segment(start=0.0, end=2.5, text="Hello world, again."),
+            Segment(start=2.5, end=5.0, text="Bye"),
+        ])
+        assert formatter.validate(srt) == (True, [])
+
+    def test_lenient_timing_line(self):
+        """Test that non-canonical timing lines are still accepted"""
+        assert SRTFormatter().validate("1\n0:00:01.000 --> 0:00:02.000\nHi\n") == (True, [])
+
+    def test_reports_errors(self):
+        """Test that structural problems are reported"""
+        is_valid, errors = SRTFormatter().validate("1\n00:00:00,000 00:00:01,000\nHi\n\nx\n")
+        assert not is_valid
+        assert "Entry 1: Invalid timestamp format '00:00:00,000 00:00:01,000'" in errors
+        assert "Line 5: Expected entry number, got 'x'" in errors
+
+
+class TestReadingDuration:
+    """Test suite for reading-speed durations"""
+
+    def test_latin_and_cjk_speeds(self):
+        """Test that spaces are not counted and CJK reads slower"""
+        formatter = SRTFormatter()
+        assert formatter._calculate_reading_duration("a" * 30 + " " * 10 + "b" * 15) == 3.0
+        assert formatter._calculate_reading_duration("你好世界再见朋友") == 2.0
+
+    def test_clamped(self):
+        """Test the minimum and maximum durations"""
+        formatter = SRTFormatter(chars_per_second=10.0)
+        assert formatter._calculate_reading_duration("hi") == SRTFormatter.MIN_DURATION
+        assert formatter._calculate_reading_duration("x" * 500) == SRTFormatter.MAX_DURATION
+
+
+class TestStreamFormat:
+    """Test suite for incremental SRT output"""
+
+    def test_consumes_generator(self, tmp_path):
+        """Test that a lazy segment iterator is written to a file"""
+        segments = (Segment(start=float(i), end=i + 1.0, text=f"Line {i}") for i in range(3))
+        path = tmp_path / "out.srt"
+
+        with open(path, "w", encoding="utf-8") as out:
+            last_end = SRTFormatter().stream_format(segments, out)
+
+        assert last_end == 3.0
+        content = path.read_text(encoding="utf-8")
+        assert content.startswith("1\n00:00:00,000 --> 00:00:01,000\nLine 0\n\n2\n")
+        assert SRTFormatter().validate(content) == (True, [])
+
+    def test_adjusted_timing_fixes_overlap(self):
+        """Test that an adjusted start never precedes the previous end"""
+        formatter = SRTFormatter(adjust_timing=True)
+        segments = [
+            Segment(start=0.0, end=2.0, text="a" * 30),
+            Segment(start=2.0, end=2.5, text="b" * 30),
+        ]
+        assert formatter.format(segments) == (
+            "1\n00:00:00,000 --> 00:00:02,000\n" + "a" * 30 + "\n\n"
+            "2\n00:00:02,000 --> 00:00:02,500\n" + "b" * 30 + "\n"
+        )
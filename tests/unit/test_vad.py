@@ -0,0 +1,53 @@
+"""
+Unit tests for the VAD pre-pass
+
+Tests speech concatenation and timestamp restoration.
+"""
+
+import numpy as np
+import pytest
+
+from lib.utils.vad import SpeechTimeline, concat_speech
+
+
+class TestConcatSpeech:
+    """Test suite for concat_speech and SpeechTimeline"""
+
+    def test_concatenates_speech_chunks(self):
+        """Test that only speech samples are kept, in order"""
+        audio = np.arange(100, dtype=np.float32)
+        chunks = [{"start": 10, "end": 20}, {"start": 50, "end": 55}]
+
+        compact, _ = concat_speech(audio, chunks, sampling_rate=10)
+
+        assert compact.tolist() == list(range(10, 20)) + list(range(50, 55))
+
+    def test_no_speech(self):
+        """Test that no speech yields empty audio and an identity timeline"""
+        compact, timeline = concat_speech(np.zeros(100, dtype=np.float32), [])
+
+        assert compact.size == 0
+        assert timeline.to_original(1.5) == 1.5
+
+    @pytest.mark.parametrize(
+        "t, is_end, expected",
+        [
+            (0.0, False, 1.0),
+            (0.5, False, 1.5),
+            (1.0, False, 5.0),
+            (1.0, True, 2.0),
+            (1.25, True, 5.25),
+        ],
+    )
+    def test_restores_original_times(self, t, is_end, expected):
+        """Test that compact times map back across removed silence"""
+        audio = np.zeros(100, dtype=np.float32)
+        chunks = [{"start": 10, "end": 20}, {"start": 50, "end": 55}]
+
+        _, timeline = concat_speech(audio, chunks, sampling_rate=10)
+
+        assert timeline.to_original(t, is_end=is_end) == pytest.approx(expected)
+
+    def test_empty_timeline_is_identity(self):
+        """Test that a timeline without spans leaves times unchanged"""
+        assert SpeechTimeline([]).to_original(3.0, is_end=True) == 3.0